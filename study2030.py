@@ -1,17 +1,39 @@
-import pandas as pd
 import ipywidgets as widgets
 from IPython.display import display, HTML, clear_output
+import asyncio
+import contextlib
+import csv
+import functools
+import heapq
+import importlib
+import io
 import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.patches import Rectangle
 import numpy as np
 import warnings
 import json
+from itertools import islice
+from pathlib import Path
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple, Any
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 warnings.filterwarnings('ignore')
 
 # Configure logging
@@ -21,6 +43,565 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+PROGRESS_SCHEMA_VERSION = 2
+OBSERVER_DEBOUNCE_SECONDS = 0.2
+
+# Renders dashboard figures off the UI thread; one worker keeps refreshes in order
+_ANALYTICS_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+# Imports heavy optional modules ahead of the first feature that needs them
+_PRELOAD_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# Placeholder entries shown first in the phase/topic dropdowns
+SENTINEL_PHASE = '-- Select Phase --'
+SENTINEL_TOPIC = '-- Select Topic --'
+
+# Small-int codes used to tally statuses with NumPy; anything else counts as not started
+STATUS_CODES = MappingProxyType({'Completed': 0, 'In Progress': 1, 'Review': 2})
+OTHER_STATUS_CODE = 3
+
+# Recommendation keywords -> (rank, category); when several keywords appear the
+# lowest rank wins, matching the order the categories used to be tested in
+RECOMMENDATION_KEYWORDS = re.compile(r'critical|priority|review|advance|start|focus|milestone', re.IGNORECASE | re.ASCII)
+RECOMMENDATION_CATEGORIES = MappingProxyType({
+    'critical': (0, 'High Priority'),
+    'priority': (0, 'High Priority'),
+    'review': (1, 'Review'),
+    'advance': (2, 'Progression'),
+    'start': (2, 'Progression'),
+    'focus': (3, 'Focus Area'),
+    'milestone': (4, 'Milestone')
+})
+
+PRIORITY_COLORS = MappingProxyType({
+    'Critical': '#dc3545',
+    'High': '#fd7e14',
+    'Medium': '#ffc107',
+    'Low': '#28a745'
+})
+
+# Sort rank per topic priority (unknown priorities rank last) and the
+# priorities whose unstarted subtopics are surfaced as upcoming items
+PRIORITY_ORDER = MappingProxyType({'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3})
+UPCOMING_PRIORITIES = frozenset(('Critical', 'High'))
+# Statuses whose items count as current focus areas
+FOCUS_STATUSES = frozenset(('In Progress', 'Review'))
+ACTIVE_MILESTONE_STATUSES = frozenset(('Planned', 'Active'))
+
+SUBTOPIC_STATUS_COLORS = MappingProxyType({
+    'Completed': '#28a745',
+    'In Progress': '#ffc107',
+    'Review': '#17a2b8',
+    'Not Started': '#e9ecef',
+    'Skipped': '#6c757d'
+})
+
+# Badge class per subtopic status in the HTML progress report; In Progress uses
+# the report stylesheet's .status-progress rule
+STATUS_CSS_CLASSES = MappingProxyType({
+    'Completed': 'status-completed',
+    'In Progress': 'status-progress',
+    'Review': 'status-review',
+    'Not Started': 'status-not-started',
+    'Skipped': 'status-skipped'
+})
+
+MILESTONE_STATUS_COLORS = MappingProxyType({
+    'Planned': '#ffc107',
+    'Active': '#17a2b8',
+    'Completed': '#28a745',
+    'Delayed': '#dc3545'
+})
+
+# HTML for the progress manager; templates with fields are rendered with str.format_map
+SELECTION_INFO_HTML = """
+<div style='background: linear-gradient(135deg, #f8f9fa, #e9ecef); padding: 15px; border-radius: 8px; border-left: 4px solid {priority_color};'>
+    <h4 style='margin: 0 0 10px 0; color: #333;'>📖 Đã Chọn</h4>
+    <p style='margin: 0; color: #666;'><strong>Đường dẫn:</strong> {phase_short} → {topic} → {subtopic}</p>
+    <p style='margin: 5px 0 0 0;'><span style='background: {priority_color}; color: white; padding: 2px 8px; border-radius: 12px; font-size: 0.85em;'>{priority}</span> 
+    <strong>Thời gian:</strong> {weeks} tuần | <strong>Cập nhật:</strong> {last_updated}</p>
+</div>
+"""
+
+SAVE_PREVIEW_HTML = "<div style='color: #6c757d; padding: 5px; font-style: italic; font-size: 0.9em;'>{icon} {label}: {preview}</div>"
+
+PROGRESS_MANAGER_HEADER_HTML = """
+<div style='text-align: center; padding: 15px; background: linear-gradient(135deg, #4CAF50, #45a049); color: white; border-radius: 10px; margin-bottom: 15px;'>
+    <h2 style='margin: 0;'>📈 Learning Progress Manager</h2>
+    <p style='margin: 5px 0 0 0; opacity: 0.9;'>Track your journey + Add custom topics/subtopics</p>
+</div>
+"""
+
+PROGRESS_EXAMPLES_HTML = """
+<div style='background: #e8f4f8; padding: 15px; border-radius: 8px; border-left: 4px solid #17a2b8;'>
+    <strong>💡 Ví dụ sử dụng:</strong><br>
+    <div style='display: flex; gap: 20px; margin-top: 10px;'>
+        <div style='flex: 1;'>
+            <strong>📝 Learning Notes:</strong><br>
+            <span style='font-size: 0.9em; color: #666;'>
+            • Learned about phasor representation<br>
+            • Complex impedance = R + jX<br>
+            • Need to review Euler's formula
+            </span>
+        </div>
+        <div style='flex: 1;'>
+            <strong>📚 Resources:</strong><br>
+            <span style='font-size: 0.9em; color: #666;'>
+            • Book: RF Circuit Design, Ch.3<br>
+            • Video: https://youtu.be/xyz123<br>
+            • PDF: complex_analysis.pdf, p.45-67
+            </span>
+        </div>
+    </div>
+</div>
+"""
+
+# Static HTML for the export tab
+EXPORT_HEADER_HTML = """
+<div style='text-align: center; padding: 15px; background: linear-gradient(135deg, #17a2b8, #138496); color: white; border-radius: 10px; margin-bottom: 15px;'>
+    <h2 style='margin: 0;'>📥 Export System</h2>
+    <p style='margin: 5px 0 0 0; opacity: 0.9;'>Export your learning data for backup and analysis</p>
+</div>
+"""
+
+EXPORT_GUIDE_HTML = """
+<div style='background: #e8f4f8; padding: 15px; border-radius: 8px; margin-top: 15px;'>
+    <h4 style='color: #17a2b8; margin: 0 0 10px 0;'>💡 Export Options Guide:</h4>
+    <ul style='margin: 0; color: #555; line-height: 1.5;'>
+        <li><strong>Progress Report:</strong> Complete progress tracking data with status and notes</li>
+        <li><strong>Milestone Timeline:</strong> All milestone dates and status information</li>
+        <li><strong>Detailed Roadmap:</strong> Full roadmap structure with priorities and durations</li>
+        <li><strong>Learning Notes:</strong> All your personal learning notes and insights</li>
+        <li><strong>Analytics Summary:</strong> Statistical summary of your learning progress</li>
+        <li><strong>Study Plan:</strong> Personalized study recommendations and next steps</li>
+    </ul>
+</div>
+"""
+
+# Strategic learning framework under the roadmap overview: one card per phase
+# type, then one circle per study habit
+STRATEGY_PHASE_CARDS = (
+    ('Foundation', '🏗️', (('Focus', 'Mathematical & circuit fundamentals'), ('Goal', 'Solid theoretical foundation'),
+                          ('Key Skills', 'Complex analysis, network theory'), ('Outcome', 'Ready for analog IC design'))),
+    ('Short-term', '🚀', (('Focus', 'Analog IC design mastery'), ('Goal', 'Design operational amplifiers'),
+                          ('Key Skills', 'OpAmp design, data converters'), ('Outcome', 'Competent analog designer'))),
+    ('Mid-term', '⚡', (('Focus', 'Advanced microwave & high-speed'), ('Goal', 'SerDes and microwave expertise'),
+                       ('Key Skills', 'EM simulation, signal integrity'), ('Outcome', 'High-speed design capability'))),
+    ('Long-term', '🏆', (('Focus', 'RF IC design mastery'), ('Goal', 'Complete RF transceiver design'),
+                        ('Key Skills', 'LNA, VCO, mixer design'), ('Outcome', 'RF system architect'))),
+    ('Advanced', '🌟', (('Focus', 'Cutting-edge applications'), ('Goal', 'Industry leadership'),
+                       ('Key Skills', 'mmWave, 5G, automotive radar'), ('Outcome', 'Technology innovator'))),
+)
+
+STRATEGY_HABITS = (
+    ('📚', 'Consistent Study', '10-15 hours/week'),
+    ('🛠️', 'Hands-on Practice', 'Design & simulate'),
+    ('🔄', 'Regular Review', 'Reinforce learning'),
+    ('👥', 'Community', 'Join forums & groups'),
+    ('📊', 'Track Progress', 'Monitor & adjust'),
+)
+
+STRATEGY_PHASE_CARD_HTML = """
+<div style='background: white; padding: 20px; border-radius: 12px; box-shadow: 0 4px 16px rgba(0,0,0,0.1); border-left: 5px solid {color};'>
+    <h3 style='color: {color}; text-align: center; margin-bottom: 15px;'>{icon} {phase_type} Phase</h3>
+    <ul style='color: #555; line-height: 1.6;'>{items}</ul>
+</div>
+"""
+
+STRATEGY_HABIT_HTML = """
+<div style='text-align: center;'>
+    <div style='background: #1976d2; color: white; width: 50px; height: 50px; border-radius: 50%; 
+               display: flex; align-items: center; justify-content: center; margin: 0 auto 10px; font-size: 1.5em;'>{icon}</div>
+    <h5 style='margin: 0 0 5px 0; color: #1976d2;'>{title}</h5>
+    <p style='margin: 0; color: #666; font-size: 0.9em;'>{detail}</p>
+</div>
+"""
+
+# Banner above the system tabs: static header, then file and count status
+SYSTEM_HEADER_HTML = """
+<div style='text-align: center; padding: 25px; background: linear-gradient(45deg, #667eea, #764ba2); 
+            color: white; border-radius: 15px; margin-bottom: 20px; box-shadow: 0 8px 32px rgba(0,0,0,0.1);'>
+    <h1 style='margin: 0 0 10px 0; font-size: 2.5em; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);'>
+        🎯 RF IC Design Learning Roadmap System
+    </h1>
+    <p style='margin: 5px 0 15px 0; font-size: 1.3em; opacity: 0.95;'>
+        Your comprehensive journey from fundamentals to mastery
+    </p>
+    <div style='background: rgba(255,255,255,0.2); padding: 15px; border-radius: 10px; margin-top: 15px;'>
+        <div style='display: flex; justify-content: space-around; flex-wrap: wrap;'>
+            <div style='margin: 5px;'><strong>🏗️ Foundation</strong><br>0-3 months</div>
+            <div style='margin: 5px;'><strong>🚀 Short-term</strong><br>3-9 months</div>
+            <div style='margin: 5px;'><strong>⚡ Mid-term</strong><br>9-18 months</div>
+            <div style='margin: 5px;'><strong>🏆 Long-term</strong><br>18-30 months</div>
+            <div style='margin: 5px;'><strong>🌟 Advanced</strong><br>30+ months</div>
+        </div>
+    </div>
+</div>
+"""
+
+SYSTEM_STATUS_HTML = """
+<div style='background: linear-gradient(135deg, #f8f9fa, #e9ecef); padding: 20px; border-radius: 12px; 
+            margin-bottom: 20px; border: 2px solid #dee2e6;'>
+    <div style='display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap;'>
+        <div style='margin: 10px;'>
+            <h4 style='margin: 0 0 5px 0; color: #495057;'>📊 System Status</h4>
+            <p style='margin: 0; color: #6c757d;'>Ready for learning tracking</p>
+        </div>
+        <div style='margin: 10px;'>
+            <h4 style='margin: 0 0 5px 0; color: #495057;'>💾 Data Files</h4>
+            <p style='margin: 0; color: #6c757d;'>
+                Progress: {progress_mark} | 
+                Milestones: {milestones_mark}
+            </p>
+        </div>
+        <div style='margin: 10px;'>
+            <h4 style='margin: 0 0 5px 0; color: #495057;'>🎯 Quick Stats</h4>
+            <p style='margin: 0; color: #6c757d;'>
+                {item_count} items tracked | 
+                {milestone_count} milestones set
+            </p>
+        </div>
+    </div>
+</div>
+"""
+
+# Standalone page wrapping every HTML export; CSS braces are doubled for str.format
+HTML_REPORT_SHELL = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>RF IC Design Learning Report - {export_type}</title>
+    <style>
+        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 40px; background: #f8f9fa; }}
+        .header {{ background: linear-gradient(135deg, #667eea, #764ba2); color: white; padding: 30px; border-radius: 15px; text-align: center; margin-bottom: 30px; }}
+        .content {{ background: white; padding: 30px; border-radius: 15px; box-shadow: 0 4px 20px rgba(0,0,0,0.1); }}
+        h1 {{ margin: 0; font-size: 2.5em; }}
+        h2 {{ color: #333; border-bottom: 3px solid #667eea; padding-bottom: 10px; }}
+        h3 {{ color: #666; }}
+        .status-completed {{ background: #28a745; color: white; padding: 4px 8px; border-radius: 12px; font-size: 0.8em; }}
+        .status-progress {{ background: #ffc107; color: black; padding: 4px 8px; border-radius: 12px; font-size: 0.8em; }}
+        .status-review {{ background: #17a2b8; color: white; padding: 4px 8px; border-radius: 12px; font-size: 0.8em; }}
+        .priority-critical {{ border-left: 5px solid #dc3545; padding-left: 15px; margin: 10px 0; }}
+        .priority-high {{ border-left: 5px solid #fd7e14; padding-left: 15px; margin: 10px 0; }}
+        .footer {{ text-align: center; margin-top: 30px; color: #666; font-style: italic; }}
+        table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
+        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
+        th {{ background-color: #f8f9fa; font-weight: bold; }}
+        .notes {{ background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 10px 0; font-style: italic; }}
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>RF IC Design Learning Report</h1>
+        <p>{export_type} - Generated on {generated_on}</p>
+    </div>
+    <div class="content">
+        {content}
+    </div>
+    <div class="footer">
+        <p>Generated by RF IC Design Learning Roadmap System</p>
+        <p>Continue your journey to RF IC design mastery! 🚀</p>
+    </div>
+</body>
+</html>
+"""
+
+# The shell on either side of the section content, so a report can be written out
+# in pieces; only the head has fields
+HTML_REPORT_HEAD, HTML_REPORT_TAIL = HTML_REPORT_SHELL.split('{content}')
+HTML_REPORT_TAIL_BYTES = HTML_REPORT_TAIL.encode('utf-8')
+
+# Phase card opening the detailed roadmap export; {color} is filled in once per
+# phase type in __init__, the remaining fields per phase
+ROADMAP_PHASE_CARD_HTML = """
+<div style='border: 2px solid {color}; border-radius: 10px; padding: 20px; margin: 20px 0; background: rgba(255,255,255,0.95);'>
+    <h3 style='color: {color}; margin-bottom: 10px;'>Phase {index}: {phase_name}</h3>
+    <p style='font-style: italic; color: #666;'>{description}</p>
+    <p><strong>Duration:</strong> {weeks} weeks | <strong>Type:</strong> {phase_type}</p>
+    
+    <h4>Topics:</h4>
+"""
+
+# One subtopic tile in the roadmap overview, rendered with str.format per item
+ROADMAP_SUBTOPIC_HTML = """
+<div style='background: {status_color}; color: {text_color}; padding: 8px 12px; border-radius: 8px; 
+           font-size: 0.9em; display: flex; justify-content: space-between; align-items: center; 
+           transition: transform 0.2s;' 
+     onmouseover='this.style.transform="scale(1.02)"' 
+     onmouseout='this.style.transform="scale(1)"'>
+    <span>{index}. {subtopic}</span>
+    <span style='font-size: 0.8em; opacity: 0.8;'>{status}</span>
+</div>
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _selection_info_template(priority: str) -> str:
+    """
+    Return SELECTION_INFO_HTML with the priority color and badge filled in.
+    
+    Only the path, duration and timestamp vary per selection, so the rest of
+    the template is rendered once per priority.
+    
+    Args:
+        priority (str): Topic priority level
+    """
+    escaped = priority.replace('{', '{{').replace('}', '}}')
+    return (SELECTION_INFO_HTML
+            .replace('{priority_color}', PRIORITY_COLORS.get(priority, '#6c757d'))
+            .replace('{priority}', escaped))
+
+
+@functools.lru_cache(maxsize=None)
+def _static_html_widget(markup: str) -> widgets.HTML:
+    """
+    Return a shared HTML widget for constant markup.
+    
+    The widget is created once and reused whenever a tab is rebuilt, so the
+    frontend does not create and parse a new copy each time.
+    
+    Args:
+        markup (str): Static HTML content
+    """
+    return widgets.HTML(markup)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(text: str) -> Optional[datetime]:
+    """
+    Parse a progress record's 'last_updated' value, memoized by string.
+    
+    Records saved in the same second share a timestamp, and the analytics
+    and activity checks re-read the same values on every refresh, so each
+    distinct string goes through strptime once.
+    
+    Args:
+        text (str): Timestamp formatted as '%Y-%m-%d %H:%M:%S'
+        
+    Returns:
+        Optional[datetime]: Parsed timestamp, or None if empty or malformed
+    """
+    try:
+        return datetime.strptime(text, '%Y-%m-%d %H:%M:%S')
+    except (TypeError, ValueError):
+        return None
+
+
+def _json_dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes (2-space indented if asked), using orjson when available."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option, default=str)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _write_csv_rows(filename: str, fieldnames: List[str], rows) -> bool:
+    """
+    Stream dict rows to a UTF-8 CSV file, one row at a time.
+    
+    Args:
+        filename (str): Output filename
+        fieldnames (List[str]): Column order
+        rows (Iterable[dict]): Rows to write; may be a generator
+        
+    Returns:
+        bool: True if at least one row was written; no file is created otherwise
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return False
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator='\n')
+        writer.writeheader()
+        writer.writerow(first)
+        writer.writerows(rows)
+    return True
+
+
+def _velocity_loops(ordinals: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float, float]:
+    """
+    Cumulative completions per day plus a least-squares trend, as plain loops for Numba.
+    
+    Args:
+        ordinals (np.ndarray): int64 day ordinals of completed items, in any order
+        
+    Returns:
+        Tuple: (unique days ascending, cumulative counts, trend slope, trend intercept)
+    """
+    days = np.sort(ordinals)
+    n = days.shape[0]
+    unique_days = np.empty(n, dtype=np.int64)
+    cumulative = np.empty(n, dtype=np.int64)
+    m = 0
+    for i in range(n):
+        # Run-length encode the sorted days; the count so far is the index + 1
+        if m == 0 or days[i] != unique_days[m - 1]:
+            unique_days[m] = days[i]
+            m += 1
+        cumulative[m - 1] = i + 1
+    unique_days = unique_days[:m]
+    cumulative = cumulative[:m]
+    
+    slope = 0.0
+    intercept = float(cumulative[0]) if m > 0 else 0.0
+    if m > 1:
+        x_mean = 0.0
+        y_mean = 0.0
+        for j in range(m):
+            x_mean += unique_days[j]
+            y_mean += cumulative[j]
+        x_mean /= m
+        y_mean /= m
+        sxy = 0.0
+        sxx = 0.0
+        for j in range(m):
+            dx = unique_days[j] - x_mean
+            sxy += dx * (cumulative[j] - y_mean)
+            sxx += dx * dx
+        slope = sxy / sxx
+        intercept = y_mean - slope * x_mean
+    return unique_days, cumulative, slope, intercept
+
+
+def _velocity_numpy(ordinals: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float, float]:
+    """Same result as _velocity_loops using vectorized NumPy calls (used without Numba)."""
+    unique_days, day_counts = np.unique(ordinals, return_counts=True)
+    cumulative = np.cumsum(day_counts)
+    if len(unique_days) < 2:
+        return unique_days, cumulative, 0.0, float(cumulative[0]) if len(cumulative) else 0.0
+    x = unique_days.astype(np.float64)
+    y = cumulative.astype(np.float64)
+    dx = x - x.mean()
+    slope = float((dx * (y - y.mean())).sum() / (dx * dx).sum())
+    return unique_days, cumulative, slope, float(y.mean() - slope * x.mean())
+
+
+# Compiled once and cached on disk, so only the first session pays the compile cost;
+# fastmath lets the trend's mean and least-squares sums vectorize (inputs are finite)
+_velocity_kernel = njit(cache=True, fastmath=True)(_velocity_loops) if NUMBA_AVAILABLE else _velocity_numpy
+
+
+def _status_tally_loops(status_idx: np.ndarray, phase_idx: np.ndarray, priority_idx: np.ndarray,
+                        n_statuses: int, n_phases: int, n_priorities: int) -> np.ndarray:
+    """
+    Count items per (status, phase, priority) cell, as a plain loop for Numba.
+    
+    Args:
+        status_idx (np.ndarray): Status code per item
+        phase_idx (np.ndarray): Phase index per item
+        priority_idx (np.ndarray): Priority index per item
+        n_statuses (int): Number of status codes
+        n_phases (int): Number of phases
+        n_priorities (int): Number of priorities
+        
+    Returns:
+        np.ndarray: int64 counts shaped (n_statuses, n_phases, n_priorities)
+    """
+    counts = np.zeros((n_statuses, n_phases, n_priorities), dtype=np.int64)
+    for i in range(status_idx.shape[0]):
+        counts[status_idx[i], phase_idx[i], priority_idx[i]] += 1
+    return counts
+
+
+def _status_tally_numpy(status_idx: np.ndarray, phase_idx: np.ndarray, priority_idx: np.ndarray,
+                        n_statuses: int, n_phases: int, n_priorities: int) -> np.ndarray:
+    """Same result as _status_tally_loops using one bincount (used without Numba)."""
+    shape = (n_statuses, n_phases, n_priorities)
+    flat_idx = np.ravel_multi_index((status_idx, phase_idx, priority_idx), shape)
+    return np.bincount(flat_idx, minlength=n_statuses * n_phases * n_priorities).reshape(shape)
+
+
+# Integer-only, so fastmath would change nothing; cached on disk like _velocity_kernel
+_status_tally_kernel = njit(cache=True)(_status_tally_loops) if NUMBA_AVAILABLE else _status_tally_numpy
+
+
+def debounce(wait: float):
+    """
+    Delay a widget callback until no new call arrives for `wait` seconds.
+    
+    Bursts of changes (e.g. arrowing through a dropdown) collapse into a single
+    call with the latest arguments. When no event loop is running the callback
+    is invoked immediately.
+    
+    Args:
+        wait (float): Quiet period in seconds
+    """
+    def decorator(fn):
+        pending = None
+        
+        @functools.wraps(fn)
+        def debounced(*args, **kwargs):
+            nonlocal pending
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return fn(*args, **kwargs)
+            if pending is not None:
+                pending.cancel()
+            pending = loop.call_later(wait, functools.partial(fn, *args, **kwargs))
+        return debounced
+    return decorator
+
+
+def _call_when_done(future, callback) -> None:
+    """
+    Run `callback(future)` once a background future finishes.
+    
+    When an event loop is running (as in a Jupyter kernel) the callback is
+    scheduled on it so widget updates happen on the loop thread; otherwise
+    it runs on the worker thread. Cancelled futures are ignored.
+    
+    Args:
+        future: concurrent.futures.Future to watch
+        callback: Called with the finished future
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    
+    def notify(done):
+        if done.cancelled():
+            return
+        if loop is None:
+            callback(done)
+        else:
+            loop.call_soon_threadsafe(callback, done)
+    
+    future.add_done_callback(notify)
+
+
+def _deliver_result(on_done, future) -> None:
+    """Pass a finished future's result to `on_done` (used with functools.partial)."""
+    on_done(future.result())
+
+
+@contextlib.contextmanager
+def hold_sync(*widget_list: widgets.Widget):
+    """
+    Hold frontend sync on several widgets so each sends a single batched
+    state update when the block exits, instead of one message per trait write.
+    
+    Args:
+        *widget_list: Widgets whose state updates should be batched
+    """
+    with contextlib.ExitStack() as stack:
+        for widget in widget_list:
+            stack.enter_context(widget.hold_sync())
+        yield
+
+
 class RFLearningRoadmapSystem:
     """
     A comprehensive RF IC Design Learning Roadmap System with progress tracking,
@@ -39,8 +620,13 @@ class RFLearningRoadmapSystem:
             csv_file (str): Base filename for data storage
         """
         self.csv_file = csv_file
-        self.progress_file = csv_file.replace('.csv', '_progress.csv')
+        self.progress_file = csv_file.replace('.csv', '_progress.json')
+        self.legacy_progress_file = csv_file.replace('.csv', '_progress.csv')
         self.milestones_file = csv_file.replace('.csv', '_milestones.csv')
+        # Whether the data files exist, checked once here and set by the save methods,
+        # so the status banner needs no stat() per render
+        self._progress_file_exists = os.path.exists(self.progress_file)
+        self._milestones_file_exists = os.path.exists(self.milestones_file)
         
         # Define color schemes for different phases
         self.phase_colors = {
@@ -50,14 +636,48 @@ class RFLearningRoadmapSystem:
             'Long-term': '#27ae60',
             'Advanced': '#9b59b6'
         }
+        # Roadmap export phase card per phase type with its colour already substituted
+        self._phase_card_templates = {
+            phase_type: ROADMAP_PHASE_CARD_HTML.replace('{color}', color)
+            for phase_type, color in self.phase_colors.items()
+        }
         
         # Performance optimization: Cache frequently accessed data
         self._roadmap_cache = None
         self._progress_cache = {}
         self._milestones_cache = {}
         
+        # Selection currently shown in the progress manager, used to skip identical reloads
+        self._last_loaded_key = None
+        # Undo callbacks for the handlers the current progress manager registered
+        self._detach_callbacks = []
+        
+        # Dashboard figure, axes and date tickers, created on first render and reused afterwards
+        self._analytics_figure = None
+        self._analytics_axes = None
+        self._analytics_date_tickers = None
+        # Export tab, built once; it reads roadmap and progress only when an export runs
+        self._export_system_widget = None
+        # Header and status banner of the full system, refreshed in place on each display
+        self._status_widget = None
+        
+        # Background writer for UI-triggered saves; only the latest pending save runs
+        self._save_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_save = None
+        
+        # Flat roadmap rows for whole-roadmap passes, built lazily by _roadmap_items
+        self._flat_items = None
+        # Detailed roadmap export section; it depends only on the roadmap structure
+        self._roadmap_html = None
+        
+        # Bumped whenever progress, milestones or the roadmap change; derived
+        # results (recommendations, upcoming items) are cached against it
+        self._progress_version = 0
+        self._result_cache = {}
+        
         # Initialize the comprehensive roadmap
         self.roadmap = self._create_comprehensive_roadmap()
+        self._build_option_caches()
         self._load_all_data()
         
         logger.info("RF Learning Roadmap System initialized successfully")
@@ -334,43 +954,123 @@ class RFLearningRoadmapSystem:
                 }
             }
         }
+        
+        # Reverse index: subtopic -> [(phase, topic), ...] for O(1) lookups,
+        # plus the flat list of (phase, topic, subtopic) keys in roadmap order for saving
+        self._subtopic_index = {}
+        self._progress_keys = []
+        for phase_name, phase_data in self._roadmap_cache.items():
+            for topic_name, topic_data in phase_data['topics'].items():
+                for subtopic in topic_data['subtopics']:
+                    self._subtopic_index.setdefault(subtopic, []).append((phase_name, topic_name))
+                    self._progress_keys.append((phase_name, topic_name, subtopic))
         return self._roadmap_cache
     
+    def _build_option_caches(self) -> None:
+        """Cache dropdown options, subtopic name sets and short phase labels for the progress manager."""
+        self._topic_cache = {}
+        self._subtopic_cache = {}
+        self._subtopic_sets = {}
+        self._phase_short = {phase_name: phase_name.split(':', 1)[0] for phase_name in self.roadmap}
+        for phase_name, phase_data in self.roadmap.items():
+            self._topic_cache[phase_name] = [SENTINEL_TOPIC] + list(phase_data['topics'].keys())
+            for topic_name, topic_data in phase_data['topics'].items():
+                self._subtopic_cache[(phase_name, topic_name)] = tuple(topic_data['subtopics'])
+                self._subtopic_sets[(phase_name, topic_name)] = set(topic_data['subtopics'])
+    
     def _load_all_data(self) -> None:
-        """Load all data from CSV files with error handling."""
+        """Load progress and milestone files concurrently with error handling."""
         try:
-            self._load_progress()
-            self._load_milestones()
+            # Each loader writes its own attribute, so no locking is needed
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                progress_future = executor.submit(self._load_progress)
+                milestones_future = executor.submit(self._load_milestones)
+                progress_future.result()
+                milestones_future.result()
+            # Freshly loaded data invalidates anything cached against the old version
+            self._progress_version += 1
             logger.info("All data loaded successfully")
         except Exception as e:
             logger.error(f"Error loading data: {e}")
             
     def _load_progress(self) -> None:
-        """Load learning progress from CSV file."""
+        """Load learning progress from the JSON snapshot (or legacy CSV file)."""
         try:
             if os.path.exists(self.progress_file):
-                df = pd.read_csv(self.progress_file)
-                self.progress = {}
-                for _, row in df.iterrows():
-                    key = f"{row['Phase']}|{row['Topic']}|{row['Subtopic']}"
-                    self.progress[key] = {
-                        'status': row['Status'],
-                        'completion': row['Completion_Percent'],
-                        'notes': row.get('Notes', ''),
-                        'last_updated': row['Last_Updated']
-                    }
+                with open(self.progress_file, 'rb') as f:
+                    snapshot = _json_loads(f.read())
+                self.progress = self._flatten_progress_snapshot(snapshot)
                 logger.info(f"Loaded progress for {len(self.progress)} items")
+            elif os.path.exists(self.legacy_progress_file):
+                self.progress = self._load_legacy_progress_csv()
+                logger.info(f"Migrated progress for {len(self.progress)} items from {self.legacy_progress_file}")
             else:
                 self.progress = {}
                 logger.info("No existing progress file found, starting fresh")
         except Exception as e:
             logger.error(f"Error loading progress: {e}")
             self.progress = {}
+        
+        # Newest update time; writes move it forward so activity checks never re-parse records
+        self._last_activity = max(
+            filter(None, (_parse_timestamp(info.get('last_updated')) for info in self.progress.values())),
+            default=None
+        )
+    
+    @staticmethod
+    def _flatten_progress_snapshot(snapshot: Dict[str, Any]) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+        """
+        Convert a JSON progress snapshot into records keyed by (phase, topic, subtopic).
+        
+        Schema 2 nests records as phase -> topic -> subtopic; schema 1 used
+        flat "phase|topic|subtopic" keys.
+        
+        Args:
+            snapshot (Dict[str, Any]): Decoded snapshot file contents
+            
+        Returns:
+            Dict[Tuple[str, str, str], Dict[str, Any]]: Progress records
+        """
+        data = snapshot.get('progress', {})
+        if snapshot.get('schema', 1) < 2:
+            return {tuple(key.split('|', 2)): info for key, info in data.items()}
+        return {
+            (phase, topic, subtopic): info
+            for phase, topics in data.items()
+            for topic, subtopics in topics.items()
+            for subtopic, info in subtopics.items()
+        }
+    
+    def _load_legacy_progress_csv(self) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+        """
+        Read progress saved by older versions in CSV format.
+        
+        Returns:
+            Dict[Tuple[str, str, str], Dict[str, Any]]: Progress records keyed by (phase, topic, subtopic)
+        """
+        import pandas as pd
+        
+        df = pd.read_csv(self.legacy_progress_file)
+        df['Completion_Percent'] = df['Completion_Percent'].fillna(0).astype(int)
+        df = df.fillna('')
+        keys = zip(df['Phase'].astype(str), df['Topic'].astype(str), df['Subtopic'].astype(str))
+        records = pd.DataFrame({
+            'status': df['Status'],
+            'completion': df['Completion_Percent'],
+            'notes': df['Notes'].astype(str) if 'Notes' in df else '',
+            'resources': df['Resources'].astype(str) if 'Resources' in df else '',
+            'last_updated': df['Last_Updated'].astype(str)
+        }).to_dict('records')
+        return dict(zip(keys, records))
     
     def _load_milestones(self) -> None:
         """Load milestone data from CSV file."""
         try:
             if os.path.exists(self.milestones_file):
+                # pandas is imported where it is used, so loading the module and
+                # starting without saved milestones never pays for it
+                import pandas as pd
+                
                 df = pd.read_csv(self.milestones_file)
                 self.milestones = {}
                 for _, row in df.iterrows():
@@ -388,47 +1088,99 @@ class RFLearningRoadmapSystem:
         except Exception as e:
             logger.error(f"Error loading milestones: {e}")
             self.milestones = {}
+        
+        # Parse the ISO date strings once; the strings stay in self.milestones for saving/export
+        self._milestone_dates = {phase: self._parse_milestone_dates(info)
+                                 for phase, info in self.milestones.items()}
     
-    def _save_progress(self) -> bool:
+    @staticmethod
+    def _parse_milestone_dates(info: Dict[str, Any]) -> Optional[Tuple[datetime, datetime]]:
         """
-        Save progress to CSV file with error handling.
+        Parse a milestone's start and target end dates.
         
+        Args:
+            info (Dict[str, Any]): Milestone record with ISO 'start_date' and 'target_end_date'
+            
         Returns:
-            bool: True if successful, False otherwise
+            Optional[Tuple[datetime, datetime]]: (start, target end), or None if either is missing or invalid
         """
         try:
-            rows = []
-            for phase_name, phase_data in self.roadmap.items():
-                for topic_name, topic_data in phase_data['topics'].items():
-                    for subtopic in topic_data['subtopics']:
-                        key = f"{phase_name}|{topic_name}|{subtopic}"
-                        progress_info = self.progress.get(key, {
-                            'status': 'Not Started',
-                            'completion': 0,
-                            'notes': '',
-                            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        })
-                        
-                        rows.append({
-                            'Phase': phase_name,
-                            'Topic': topic_name,
-                            'Subtopic': subtopic,
-                            'Status': progress_info['status'],
-                            'Completion_Percent': progress_info['completion'],
-                            'Notes': progress_info['notes'],
-                            'Priority': topic_data['priority'],
-                            'Estimated_Weeks': topic_data['weeks'],
-                            'Last_Updated': progress_info['last_updated']
-                        })
+            return (datetime.strptime(info['start_date'], '%Y-%m-%d'),
+                    datetime.strptime(info['target_end_date'], '%Y-%m-%d'))
+        except (KeyError, TypeError, ValueError):
+            return None
+    
+    def _save_progress(self, progress: Optional[Dict[Tuple[str, str, str], Dict[str, Any]]] = None) -> bool:
+        """
+        Save progress to the JSON snapshot file with error handling.
+        
+        Args:
+            progress (Optional[Dict]): Progress records to write, defaults to self.progress
             
-            df = pd.DataFrame(rows)
-            df.to_csv(self.progress_file, index=False)
-            logger.info(f"Progress saved to {self.progress_file}")
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            default_info = self._default_progress_info()
+            # Bulk upsert: every roadmap key gets the default, then tracked items overwrite it
+            if progress is None:
+                progress = self.progress
+            records = dict.fromkeys(self._progress_keys, default_info)
+            records.update({key: progress[key] for key in progress.keys() & records.keys()})
+            
+            # Nest as phase -> topic -> subtopic so the JSON needs no joined keys
+            snapshot = {}
+            for (phase_name, topic_name, subtopic), info in records.items():
+                snapshot.setdefault(phase_name, {}).setdefault(topic_name, {})[subtopic] = info
+            
+            # Write a sibling temp file and swap it in, so the snapshot on disk is
+            # always a complete file even if a write is interrupted
+            temp_file = self.progress_file + '.tmp'
+            with open(temp_file, 'wb') as f:
+                f.write(_json_dumps({'schema': PROGRESS_SCHEMA_VERSION, 'progress': snapshot}))
+            os.replace(temp_file, self.progress_file)
+            self._progress_file_exists = True
+            logger.info("Progress saved to %s", self.progress_file)
             return True
         except Exception as e:
             logger.error(f"Error saving progress: {e}")
             return False
     
+    def _schedule_save(self, on_done=None) -> None:
+        """
+        Save progress on the background writer without blocking the caller.
+        
+        A save still waiting in the queue is cancelled, so a burst of clicks
+        writes the file once with the latest data. The records are copied
+        here so the writer never iterates a dict the UI is mutating.
+        
+        Args:
+            on_done (Optional[Callable[[bool], None]]): Called with the save result
+                on the event loop thread, or on the writer thread when no loop is running
+        """
+        if self._pending_save is not None:
+            self._pending_save.cancel()
+        
+        future = self._save_executor.submit(self._save_progress, dict(self.progress))
+        self._pending_save = future
+        if on_done is not None:
+            _call_when_done(future, functools.partial(_deliver_result, on_done))
+    
+    def export_progress_csv(self, filename: Optional[str] = None) -> bool:
+        """
+        Export progress to CSV for use in spreadsheets.
+        
+        The JSON snapshot remains the persistent store; this CSV is for
+        user consumption only.
+        
+        Args:
+            filename (Optional[str]): Output filename, defaults to the legacy progress CSV path
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self._export_progress_report_csv(filename or self.legacy_progress_file)
+    
     def _save_milestones(self) -> bool:
         """
         Save milestones to CSV file with error handling.
@@ -448,8 +1200,11 @@ class RFLearningRoadmapSystem:
                 })
             
             if rows:
+                import pandas as pd
+                
                 df = pd.DataFrame(rows)
                 df.to_csv(self.milestones_file, index=False)
+                self._milestones_file_exists = True
                 logger.info(f"Milestones saved to {self.milestones_file}")
                 return True
             return False
@@ -457,6 +1212,40 @@ class RFLearningRoadmapSystem:
             logger.error(f"Error saving milestones: {e}")
             return False
     
+    @staticmethod
+    def _require_full_selection(phase: str, topic: str, subtopic: str,
+                                status_indicator: Optional[widgets.HTML] = None,
+                                msg: str = '') -> bool:
+        """
+        Check that a phase, topic and subtopic are all selected.
+        
+        Args:
+            phase (str): Selected phase, or SENTINEL_PHASE
+            topic (str): Selected topic, or SENTINEL_TOPIC
+            subtopic (str): Selected subtopic, empty when none
+            status_indicator (Optional[widgets.HTML]): Widget that shows the warning
+            msg (str): Warning text shown when the selection is incomplete
+            
+        Returns:
+            bool: True if the selection is complete, False otherwise
+        """
+        if subtopic and topic != SENTINEL_TOPIC and phase != SENTINEL_PHASE:
+            return True
+        if status_indicator is not None and msg:
+            status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>⚠️ {msg}</div>"
+        return False
+    
+    @staticmethod
+    def _default_progress_info() -> Dict[str, Any]:
+        """Return the record used for items with no saved progress, stamped with the current time."""
+        return {
+            'status': 'Not Started',
+            'completion': 0,
+            'notes': '',
+            'resources': '',
+            'last_updated': datetime.now().isoformat(sep=' ', timespec='seconds')
+        }
+    
     def get_progress_info(self, phase: str, topic: str, subtopic: str) -> Dict[str, Any]:
         """
         Get progress information for a specific item.
@@ -469,16 +1258,12 @@ class RFLearningRoadmapSystem:
         Returns:
             Dict[str, Any]: Progress information with resources field
         """
-        key = f"{phase}|{topic}|{subtopic}"
-        default_info = {
-            'status': 'Not Started',
-            'completion': 0,
-            'notes': '',
-            'resources': '',  # NEW: Resources field
-            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-        
-        progress_info = self.progress.get(key, default_info)
+        if not topic:
+            topic = self._find_topic(phase, subtopic)
+        key = (phase, topic, subtopic)
+        progress_info = self.progress.get(key)
+        if progress_info is None:
+            return self._default_progress_info()
         
         # Ensure resources field exists (for backward compatibility)
         if 'resources' not in progress_info:
@@ -486,6 +1271,22 @@ class RFLearningRoadmapSystem:
             
         return progress_info
     
+    def _find_topic(self, phase: str, subtopic: str) -> str:
+        """
+        Locate the topic that contains a subtopic within a phase.
+        
+        Args:
+            phase (str): Phase name
+            subtopic (str): Subtopic name
+            
+        Returns:
+            str: Topic name, or empty string if not found
+        """
+        for phase_name, topic_name in self._subtopic_index.get(subtopic, ()):
+            if phase_name == phase:
+                return topic_name
+        return ''
+    
     def set_progress_info(self, phase: str, topic: str, subtopic: str, 
                          status: str, completion: int, notes: str, resources: str = '') -> bool:
         """
@@ -504,43 +1305,105 @@ class RFLearningRoadmapSystem:
             bool: True if successful, False otherwise
         """
         try:
-            key = f"{phase}|{topic}|{subtopic}"
+            key = (phase, topic, subtopic)
+            now = datetime.now()
             self.progress[key] = {
                 'status': status,
                 'completion': completion,
                 'notes': notes,
                 'resources': resources,  # NEW: Store resources
-                'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                'last_updated': now.isoformat(sep=' ', timespec='seconds')
             }
-            return self._save_progress()
+            self._last_activity = now
+            self._progress_version += 1
+            # Saves go through the background writer so they land in the order they
+            # were requested; this caller waits for its own write
+            return self._save_executor.submit(self._save_progress, dict(self.progress)).result()
         except Exception as e:
             logger.error(f"Error setting progress info: {e}")
             return False
-
+    
+    def _clear_progress_fields(self) -> None:
+        """Disable and empty the progress manager fields when no subtopic is selected."""
+        self._last_loaded_key = None
+        
+        # DISABLE notes areas
+        notes_area = self._notes_area
+        resources_area = self._resources_area
+        notes_area.disabled = True
+        resources_area.disabled = True
+        notes_area.value = ''
+        resources_area.value = ''
+        notes_area.placeholder = 'Chọn Phase → Topic → Subtopic để kích hoạt notes...'
+        resources_area.placeholder = 'Chọn subtopic để thêm tài liệu...'
+        
+        # Reset enable button
+        enable_notes_btn = self._enable_notes_btn
+        enable_notes_btn.disabled = False
+        enable_notes_btn.description = '🔓 Enable Notes'
+        enable_notes_btn.button_style = 'warning'
+        
+        self._selection_info.value = "<div style='padding: 10px; background: #f8f9fa; border-radius: 5px;'><i>📝 Chọn subtopic để bắt đầu track progress...</i></div>"
+    
+    def _populate_progress_fields(self, phase: str, topic: str, subtopic: str) -> None:
         """
+        Fill the progress manager fields with the stored progress of a subtopic.
+        
         Args:
-            phase (str): Phase name
-            topic (str): Topic name
-            subtopic (str): Subtopic name
-            status (str): Status value
-            completion (int): Completion percentage
-            notes (str): Learning notes
-            
-        Returns:
-            bool: True if successful, False otherwise
+            phase (str): Selected phase name
+            topic (str): Selected topic name
+            subtopic (str): Selected subtopic name
         """
+        notes_area = self._notes_area
+        resources_area = self._resources_area
+        status_indicator = self._status_indicator
         try:
-            key = f"{phase}|{topic}|{subtopic}"
-            self.progress[key] = {
-                'status': status,
-                'completion': completion,
-                'notes': notes,
-                'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            return self._save_progress()
+            # Load existing progress
+            progress_info = self.get_progress_info(phase, topic, subtopic)
+            
+            # Update other fields first
+            self._status_dropdown.value = progress_info['status']
+            self._completion_slider.value = progress_info['completion']
+            
+            # FORCE ENABLE both notes areas
+            notes_area.disabled = False
+            resources_area.disabled = False
+            notes_area.value = progress_info['notes']
+            notes_area.placeholder = f'Nhập ghi chú học tập cho "{subtopic}"...'
+            
+            # Load resources from notes or separate field if available
+            resources_info = progress_info.get('resources', '')  # New field for resources
+            resources_area.value = resources_info
+            resources_area.placeholder = f'Tài liệu/Links cho "{subtopic}":\n• PDF: filename.pdf\n• Video: https://youtube.com/...\n• Book: Chapter 5, Page 123'
+            
+            # Update enable button state
+            enable_notes_btn = self._enable_notes_btn
+            enable_notes_btn.description = '✅ Auto Enabled'
+            enable_notes_btn.button_style = 'success' 
+            enable_notes_btn.disabled = True
+            
+            # Update selection info
+            topic_info = self.roadmap[phase]['topics'][topic]
+            self._selection_info.value = _selection_info_template(topic_info['priority']).format_map({
+                'phase_short': self._phase_short[phase],
+                'topic': topic,
+                'subtopic': subtopic,
+                'weeks': topic_info['weeks'],
+                'last_updated': progress_info['last_updated']
+            })
+            
+            # Show success message
+            status_indicator.value = f"<div style='color: #28a745; padding: 5px;'>✅ Đã load dữ liệu cho: {subtopic}</div>"
+            
+            logger.info("Successfully loaded progress for: %s", subtopic)
+            self._last_loaded_key = (phase, topic, subtopic)
+            
         except Exception as e:
-            logger.error(f"Error setting progress info: {e}")
-            return False
+            logger.error(f"Error in _populate_progress_fields: {e}")
+            # Force enable notes anyway
+            notes_area.disabled = False
+            resources_area.disabled = False
+            status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>⚠️ Lỗi load dữ liệu nhưng notes đã được kích hoạt</div>"
     
     def create_progress_manager(self) -> widgets.Widget:
         """
@@ -550,10 +1413,16 @@ class RFLearningRoadmapSystem:
         Returns:
             widgets.Widget: Complete progress manager interface
         """
+        # Handlers from a previous manager would keep its widgets alive
+        self._detach_observers()
+        
+        # A fresh manager starts with nothing on screen
+        self._last_loaded_key = None
+        
         # Phase selection
         phase_dropdown = widgets.Dropdown(
-            options=['-- Select Phase --'] + list(self.roadmap.keys()),
-            value='-- Select Phase --',
+            options=[SENTINEL_PHASE] + list(self.roadmap.keys()),
+            value=SENTINEL_PHASE,
             description='Phase:',
             layout=widgets.Layout(width='450px'),
             style={'description_width': '80px'}
@@ -561,8 +1430,8 @@ class RFLearningRoadmapSystem:
         
         # Topic selection with add functionality
         topic_dropdown = widgets.Dropdown(
-            options=['-- Select Topic --'],
-            value='-- Select Topic --',
+            options=[SENTINEL_TOPIC],
+            value=SENTINEL_TOPIC,
             description='Topic:',
             layout=widgets.Layout(width='400px'),
             style={'description_width': '80px'}
@@ -596,10 +1465,13 @@ class RFLearningRoadmapSystem:
             layout=widgets.Layout(width='100px')
         )
         
-        # Subtopic selection with add functionality  
-        subtopic_dropdown = widgets.Dropdown(
-            options=['-- Select Subtopic --'],
-            value='-- Select Subtopic --',
+        # Subtopic selection with add functionality - searchable so long
+        # subtopic lists only render the entries matching the typed filter
+        subtopic_dropdown = widgets.Combobox(
+            options=[],
+            value='',
+            placeholder='Type to filter subtopics...',
+            ensure_option=True,
             description='Subtopic:',
             layout=widgets.Layout(width='400px'),
             style={'description_width': '80px'}
@@ -634,15 +1506,17 @@ class RFLearningRoadmapSystem:
             step=5,
             description='Progress:',
             style={'description_width': '70px'},
-            layout=widgets.Layout(width='320px')
+            layout=widgets.Layout(width='320px'),
+            continuous_update=False
         )
         
-        # MAIN NOTES area
+        # MAIN NOTES area - values are only read on Save, so sync on blur instead of per keystroke
         notes_area = widgets.Textarea(
             value='',
             placeholder='Chọn subtopic trước để thêm ghi chú học tập...',
             layout=widgets.Layout(width='600px', height='120px'),
-            disabled=True
+            disabled=True,
+            continuous_update=False
         )
         
         # NEW: RESOURCES/DOCUMENTS notes area
@@ -650,7 +1524,8 @@ class RFLearningRoadmapSystem:
             value='',
             placeholder='Nhập tên tài liệu, đường dẫn, links...',
             layout=widgets.Layout(width='600px', height='80px'),
-            disabled=True
+            disabled=True,
+            continuous_update=False
         )
         
         # Add a manual enable button for debugging
@@ -661,19 +1536,6 @@ class RFLearningRoadmapSystem:
             tooltip='Click to manually enable notes if auto-enable fails'
         )
         
-        def force_enable_notes(b):
-            """Force enable notes area - manual override."""
-            notes_area.disabled = False
-            resources_area.disabled = False
-            notes_area.placeholder = 'Notes area manually enabled - you can type now!'
-            resources_area.placeholder = 'Resources area manually enabled - add your documents/links!'
-            enable_notes_btn.description = '✅ Notes Enabled'
-            enable_notes_btn.button_style = 'success'
-            enable_notes_btn.disabled = True
-            status_indicator.value = "<div style='color: #28a745; padding: 5px;'>🔓 Both notes areas manually enabled</div>"
-        
-        enable_notes_btn.on_click(force_enable_notes)
-        
         # Save button with loading state
         save_btn = widgets.Button(
             description='💾 Save Progress',
@@ -690,289 +1552,44 @@ class RFLearningRoadmapSystem:
         # Status indicator
         status_indicator = widgets.HTML()
         
-        def add_new_topic(b):
-            """Add new topic to selected phase."""
-            selected_phase = phase_dropdown.value
-            new_topic_name = new_topic_text.value.strip()
-            
-            if selected_phase == '-- Select Phase --':
-                status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>⚠️ Chọn Phase trước khi thêm Topic</div>"
-                return
-                
-            if not new_topic_name:
-                status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>⚠️ Nhập tên Topic</div>"
-                return
-            
-            try:
-                # Add to roadmap structure
-                if selected_phase not in self.roadmap:
-                    status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>❌ Phase không tồn tại</div>"
-                    return
-                
-                # Check if topic already exists
-                if new_topic_name in self.roadmap[selected_phase]['topics']:
-                    status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>⚠️ Topic '{new_topic_name}' đã tồn tại</div>"
-                    return
-                
-                # Add new topic
-                self.roadmap[selected_phase]['topics'][new_topic_name] = {
-                    'weeks': topic_weeks.value,
-                    'priority': topic_priority.value,
-                    'subtopics': []  # Start empty, user can add subtopics
-                }
-                
-                # Update dropdown options
-                topics = list(self.roadmap[selected_phase]['topics'].keys())
-                topic_dropdown.options = ['-- Select Topic --'] + topics
-                topic_dropdown.value = new_topic_name  # Auto-select new topic
-                
-                # Clear input
-                new_topic_text.value = ''
-                
-                status_indicator.value = f"<div style='color: #28a745; padding: 5px;'>✅ Đã thêm Topic: {new_topic_name}</div>"
-                
-            except Exception as e:
-                status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>❌ Lỗi thêm topic: {e}</div>"
-                logger.error(f"Error adding topic: {e}")
-        
-        def add_new_subtopic(b):
-            """Add new subtopic to selected topic."""
-            selected_phase = phase_dropdown.value
-            selected_topic = topic_dropdown.value
-            new_subtopic_name = new_subtopic_text.value.strip()
-            
-            if selected_topic == '-- Select Topic --':
-                status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>⚠️ Chọn Topic trước khi thêm Subtopic</div>"
-                return
-                
-            if not new_subtopic_name:
-                status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>⚠️ Nhập tên Subtopic</div>"
-                return
-            
-            try:
-                # Check if subtopic already exists
-                current_subtopics = self.roadmap[selected_phase]['topics'][selected_topic]['subtopics']
-                if new_subtopic_name in current_subtopics:
-                    status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>⚠️ Subtopic '{new_subtopic_name}' đã tồn tại</div>"
-                    return
-                
-                # Add new subtopic
-                self.roadmap[selected_phase]['topics'][selected_topic]['subtopics'].append(new_subtopic_name)
-                
-                # Update dropdown options
-                subtopics = self.roadmap[selected_phase]['topics'][selected_topic]['subtopics']
-                subtopic_dropdown.options = ['-- Select Subtopic --'] + subtopics
-                subtopic_dropdown.value = new_subtopic_name  # Auto-select new subtopic
-                
-                # Clear input
-                new_subtopic_text.value = ''
-                
-                status_indicator.value = f"<div style='color: #28a745; padding: 5px;'>✅ Đã thêm Subtopic: {new_subtopic_name}</div>"
-                
-            except Exception as e:
-                status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>❌ Lỗi thêm subtopic: {e}</div>"
-                logger.error(f"Error adding subtopic: {e}")
-        
-        add_topic_btn.on_click(add_new_topic)
-        add_subtopic_btn.on_click(add_new_subtopic)
-        
-        def update_topic_options(change):
-            """Update topic dropdown options based on selected phase."""
-            selected_phase = change['new']
-            if selected_phase == '-- Select Phase --':
-                topic_dropdown.options = ['-- Select Topic --']
-                subtopic_dropdown.options = ['-- Select Subtopic --']
-                return
-            
-            try:
-                topics = list(self.roadmap[selected_phase]['topics'].keys())
-                topic_dropdown.options = ['-- Select Topic --'] + topics
-                topic_dropdown.value = '-- Select Topic --'
-            except Exception as e:
-                logger.error(f"Error updating topic options: {e}")
-        
-        def update_subtopic_options(change):
-            """Update subtopic dropdown options based on selected topic."""
-            selected_phase = phase_dropdown.value
-            selected_topic = change['new']
-            
-            if (selected_topic == '-- Select Topic --' or 
-                selected_phase == '-- Select Phase --'):
-                subtopic_dropdown.options = ['-- Select Subtopic --']
-                return
-            
-            try:
-                subtopics = self.roadmap[selected_phase]['topics'][selected_topic]['subtopics']
-                subtopic_dropdown.options = ['-- Select Subtopic --'] + subtopics
-                subtopic_dropdown.value = '-- Select Subtopic --'
-            except Exception as e:
-                logger.error(f"Error updating subtopic options: {e}")
-        
-        def update_progress_fields(change=None):
-            """Update progress fields - SIMPLIFIED VERSION to fix notes issue."""
-            selected_phase = phase_dropdown.value
-            selected_topic = topic_dropdown.value
-            selected_subtopic = subtopic_dropdown.value
-            
-            # Clear status first
-            status_indicator.value = ""
-            
-            if (selected_subtopic == '-- Select Subtopic --' or
-                selected_topic == '-- Select Topic --' or
-                selected_phase == '-- Select Phase --'):
-                
-                # DISABLE notes areas
-                notes_area.disabled = True
-                resources_area.disabled = True
-                notes_area.value = ''
-                resources_area.value = ''
-                notes_area.placeholder = 'Chọn Phase → Topic → Subtopic để kích hoạt notes...'
-                resources_area.placeholder = 'Chọn subtopic để thêm tài liệu...'
-                
-                # Reset enable button
-                enable_notes_btn.disabled = False
-                enable_notes_btn.description = '🔓 Enable Notes'
-                enable_notes_btn.button_style = 'warning'
-                
-                selection_info.value = "<div style='padding: 10px; background: #f8f9fa; border-radius: 5px;'><i>📝 Chọn subtopic để bắt đầu track progress...</i></div>"
-                return
-            
-            # All selections are valid - proceed
-            try:
-                # Load existing progress
-                progress_info = self.get_progress_info(selected_phase, selected_topic, selected_subtopic)
-                
-                # Update other fields first
-                status_dropdown.unobserve_all()  # Temporarily remove observers
-                completion_slider.unobserve_all()
-                
-                status_dropdown.value = progress_info['status']
-                completion_slider.value = progress_info['completion']
-                
-                # FORCE ENABLE both notes areas
-                notes_area.disabled = False
-                resources_area.disabled = False
-                notes_area.value = progress_info['notes']
-                notes_area.placeholder = f'Nhập ghi chú học tập cho "{selected_subtopic}"...'
-                
-                # Load resources from notes or separate field if available
-                resources_info = progress_info.get('resources', '')  # New field for resources
-                resources_area.value = resources_info
-                resources_area.placeholder = f'Tài liệu/Links cho "{selected_subtopic}":\n• PDF: filename.pdf\n• Video: https://youtube.com/...\n• Book: Chapter 5, Page 123'
-                
-                # Update enable button state
-                enable_notes_btn.description = '✅ Auto Enabled'
-                enable_notes_btn.button_style = 'success' 
-                enable_notes_btn.disabled = True
-                
-                # Update selection info
-                topic_weeks = self.roadmap[selected_phase]['topics'][selected_topic]['weeks']
-                priority = self.roadmap[selected_phase]['topics'][selected_topic]['priority']
-                
-                priority_colors = {'Critical': '#dc3545', 'High': '#fd7e14', 
-                                 'Medium': '#ffc107', 'Low': '#28a745'}
-                priority_color = priority_colors.get(priority, '#6c757d')
-                
-                selection_info.value = f"""
-                <div style='background: linear-gradient(135deg, #f8f9fa, #e9ecef); padding: 15px; border-radius: 8px; border-left: 4px solid {priority_color};'>
-                    <h4 style='margin: 0 0 10px 0; color: #333;'>📖 Đã Chọn</h4>
-                    <p style='margin: 0; color: #666;'><strong>Đường dẫn:</strong> {selected_phase.split(':')[0]} → {selected_topic} → {selected_subtopic}</p>
-                    <p style='margin: 5px 0 0 0;'><span style='background: {priority_color}; color: white; padding: 2px 8px; border-radius: 12px; font-size: 0.85em;'>{priority}</span> 
-                    <strong>Thời gian:</strong> {topic_weeks} tuần | <strong>Cập nhật:</strong> {progress_info['last_updated']}</p>
-                </div>
-                """
-                
-                # Show success message
-                status_indicator.value = f"<div style='color: #28a745; padding: 5px;'>✅ Đã load dữ liệu cho: {selected_subtopic}</div>"
-                
-                logger.info(f"Successfully loaded progress for: {selected_subtopic}")
-                
-            except Exception as e:
-                logger.error(f"Error in update_progress_fields: {e}")
-                # Force enable notes anyway
-                notes_area.disabled = False
-                resources_area.disabled = False
-                status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>⚠️ Lỗi load dữ liệu nhưng notes đã được kích hoạt</div>"
-        
-        def save_progress_info(b):
-            """Save progress information with validation and feedback."""
-            selected_phase = phase_dropdown.value
-            selected_topic = topic_dropdown.value
-            selected_subtopic = subtopic_dropdown.value
-            
-            if (selected_subtopic == '-- Select Subtopic --' or
-                selected_topic == '-- Select Topic --' or
-                selected_phase == '-- Select Phase --'):
-                status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>⚠️ Chọn subtopic trước</div>"
-                return
-            
-            try:
-                # Update button state
-                save_btn.description = '💾 Saving...'
-                save_btn.disabled = True
-                
-                # Get current values - FIXED: Direct access to widget values
-                current_status = status_dropdown.value
-                current_completion = completion_slider.value
-                current_notes = notes_area.value
-                current_resources = resources_area.value  # NEW: Save resources
-                
-                # Debug information
-                logger.debug(f"Saving: Status={current_status}, Completion={current_completion}, Notes length={len(current_notes)}, Resources length={len(current_resources)}")
-                
-                # Enhanced progress info with resources
-                key = f"{selected_phase}|{selected_topic}|{selected_subtopic}"
-                self.progress[key] = {
-                    'status': current_status,
-                    'completion': current_completion,
-                    'notes': current_notes,
-                    'resources': current_resources,  # NEW: Store resources separately
-                    'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                # Save to file
-                success = self._save_progress()
-                
-                if success:
-                    status_indicator.value = f"<div style='color: #28a745; padding: 5px;'>✅ Đã lưu progress cho: {selected_subtopic}</div>"
-                    logger.info(f"Progress saved successfully for: {selected_subtopic}")
-                    
-                    # Show note preview if there are notes
-                    if current_notes.strip():
-                        note_preview = current_notes[:50] + "..." if len(current_notes) > 50 else current_notes
-                        status_indicator.value += f"<div style='color: #6c757d; padding: 5px; font-style: italic; font-size: 0.9em;'>📝 Ghi chú: {note_preview}</div>"
-                    
-                    # Show resources preview if there are resources
-                    if current_resources.strip():
-                        resources_preview = current_resources[:50] + "..." if len(current_resources) > 50 else current_resources
-                        status_indicator.value += f"<div style='color: #6c757d; padding: 5px; font-style: italic; font-size: 0.9em;'>📚 Tài liệu: {resources_preview}</div>"
-                else:
-                    status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>❌ Lỗi lưu progress</div>"
-                    
-            except Exception as e:
-                status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>❌ Lỗi: {str(e)}</div>"
-                logger.error(f"Error in save_progress_info: {e}")
-            finally:
-                # Restore button state
-                save_btn.description = '💾 Save Progress'
-                save_btn.disabled = False
-        
-        # Set up event observers with error handling
-        try:
-            phase_dropdown.observe(update_topic_options, names='value')
-            topic_dropdown.observe(update_subtopic_options, names='value')
-            subtopic_dropdown.observe(update_progress_fields, names='value')
-            save_btn.on_click(save_progress_info)
-        except Exception as e:
-            logger.error(f"Error setting up observers: {e}")
-        
-        return widgets.VBox([
-            widgets.HTML("""
-            <div style='text-align: center; padding: 15px; background: linear-gradient(135deg, #4CAF50, #45a049); color: white; border-radius: 10px; margin-bottom: 15px;'>
-                <h2 style='margin: 0;'>📈 Learning Progress Manager</h2>
-                <p style='margin: 5px 0 0 0; opacity: 0.9;'>Track your journey + Add custom topics/subtopics</p>
-            </div>
-            """),
+        # Widgets read and written by the progress manager handlers
+        self._phase_dropdown = phase_dropdown
+        self._topic_dropdown = topic_dropdown
+        self._subtopic_dropdown = subtopic_dropdown
+        self._new_topic_text = new_topic_text
+        self._topic_weeks = topic_weeks
+        self._topic_priority = topic_priority
+        self._new_subtopic_text = new_subtopic_text
+        self._status_dropdown = status_dropdown
+        self._completion_slider = completion_slider
+        self._notes_area = notes_area
+        self._resources_area = resources_area
+        self._enable_notes_btn = enable_notes_btn
+        self._save_btn = save_btn
+        self._selection_info = selection_info
+        self._status_indicator = status_indicator
+        
+        # Set up event observers with error handling
+        try:
+            # Debounced so rapid selection changes trigger a single update
+            for widget, handler in ((phase_dropdown, self._on_phase_change),
+                                    (topic_dropdown, self._on_topic_change),
+                                    (subtopic_dropdown, self._on_subtopic_change)):
+                handler = debounce(OBSERVER_DEBOUNCE_SECONDS)(handler)
+                widget.observe(handler, names='value')
+                self._detach_callbacks.append(functools.partial(widget.unobserve, handler, names='value'))
+            
+            for button, handler in ((enable_notes_btn, self._on_force_enable_notes),
+                                    (add_topic_btn, self._on_add_topic),
+                                    (add_subtopic_btn, self._on_add_subtopic),
+                                    (save_btn, self._on_save_click)):
+                button.on_click(handler)
+                self._detach_callbacks.append(functools.partial(button.on_click, handler, remove=True))
+        except Exception as e:
+            logger.error(f"Error setting up observers: {e}")
+        
+        return widgets.VBox([
+            _static_html_widget(PROGRESS_MANAGER_HEADER_HTML),
             
             # Selection area with add functionality
             widgets.VBox([
@@ -1072,29 +1689,7 @@ class RFLearningRoadmapSystem:
                 
                 # Usage examples
                 widgets.HTML("<div style='height: 15px;'></div>"),
-                widgets.HTML("""
-                <div style='background: #e8f4f8; padding: 15px; border-radius: 8px; border-left: 4px solid #17a2b8;'>
-                    <strong>💡 Ví dụ sử dụng:</strong><br>
-                    <div style='display: flex; gap: 20px; margin-top: 10px;'>
-                        <div style='flex: 1;'>
-                            <strong>📝 Learning Notes:</strong><br>
-                            <span style='font-size: 0.9em; color: #666;'>
-                            • Learned about phasor representation<br>
-                            • Complex impedance = R + jX<br>
-                            • Need to review Euler's formula
-                            </span>
-                        </div>
-                        <div style='flex: 1;'>
-                            <strong>📚 Resources:</strong><br>
-                            <span style='font-size: 0.9em; color: #666;'>
-                            • Book: RF Circuit Design, Ch.3<br>
-                            • Video: https://youtu.be/xyz123<br>
-                            • PDF: complex_analysis.pdf, p.45-67
-                            </span>
-                        </div>
-                    </div>
-                </div>
-                """)
+                _static_html_widget(PROGRESS_EXAMPLES_HTML)
             ], layout=widgets.Layout(
                 border='2px solid #2196F3', 
                 border_radius='12px',
@@ -1103,352 +1698,282 @@ class RFLearningRoadmapSystem:
                 background_color='#f8fbff'
             ))
         ])
-        """
-        Create an optimized progress management interface with fixed notes input.
-        
-        Returns:
-            widgets.Widget: Complete progress manager interface
-        """
-        # Phase selection
-        phase_dropdown = widgets.Dropdown(
-            options=['-- Select Phase --'] + list(self.roadmap.keys()),
-            value='-- Select Phase --',
-            description='Phase:',
-            layout=widgets.Layout(width='450px'),
-            style={'description_width': '80px'}
-        )
-        
-        # Topic selection
-        topic_dropdown = widgets.Dropdown(
-            options=['-- Select Topic --'],
-            value='-- Select Topic --',
-            description='Topic:',
-            layout=widgets.Layout(width='450px'),
-            style={'description_width': '80px'}
-        )
-        
-        # Subtopic selection
-        subtopic_dropdown = widgets.Dropdown(
-            options=['-- Select Subtopic --'],
-            value='-- Select Subtopic --',
-            description='Subtopic:',
-            layout=widgets.Layout(width='450px'),
-            style={'description_width': '80px'}
-        )
-        
-        # Status and completion
-        status_dropdown = widgets.Dropdown(
-            options=['Not Started', 'In Progress', 'Review', 'Completed', 'Skipped'],
-            value='Not Started',
-            description='Status:',
-            layout=widgets.Layout(width='220px'),
-            style={'description_width': '60px'}
-        )
-        
-        completion_slider = widgets.IntSlider(
-            value=0,
-            min=0,
-            max=100,
-            step=5,
-            description='Progress:',
-            style={'description_width': '70px'},
-            layout=widgets.Layout(width='320px')
-        )
-        
-        # COMPLETELY FIXED notes area - using different approach
-        notes_area = widgets.Textarea(
-            value='',
-            placeholder='Chọn subtopic trước để thêm ghi chú học tập...',
-            layout=widgets.Layout(width='600px', height='150px'),
-            disabled=True
-        )
-        
-        # Add a manual enable button for debugging
-        enable_notes_btn = widgets.Button(
-            description='🔓 Enable Notes',
-            button_style='warning',
-            layout=widgets.Layout(width='130px'),
-            tooltip='Click to manually enable notes if auto-enable fails'
-        )
-        
-        def force_enable_notes(b):
-            """Force enable notes area - manual override."""
-            notes_area.disabled = False
-            notes_area.placeholder = 'Notes area manually enabled - you can type now!'
-            enable_notes_btn.description = '✅ Notes Enabled'
-            enable_notes_btn.button_style = 'success'
-            enable_notes_btn.disabled = True
-            status_indicator.value = "<div style='color: #28a745; padding: 5px;'>🔓 Notes area manually enabled</div>"
-        
-        enable_notes_btn.on_click(force_enable_notes)
-        
-        # Save button with loading state
-        save_btn = widgets.Button(
-            description='💾 Save Progress',
-            button_style='success',
-            layout=widgets.Layout(width='140px'),
-            tooltip='Save your progress and notes'
-        )
-        
-        # Current selection info
-        selection_info = widgets.HTML(
-            value="<div style='padding: 10px; background: #f8f9fa; border-radius: 5px;'><i>📝 Select a subtopic to track your progress...</i></div>"
-        )
-        
-        # Status indicator
-        status_indicator = widgets.HTML()
-        
-        def update_topic_options(change):
-            """Update topic dropdown options based on selected phase."""
-            selected_phase = change['new']
-            if selected_phase == '-- Select Phase --':
-                topic_dropdown.options = ['-- Select Topic --']
-                subtopic_dropdown.options = ['-- Select Subtopic --']
+    
+    def _detach_observers(self) -> None:
+        """Remove the handlers the previous progress manager registered on its widgets."""
+        for detach in self._detach_callbacks:
+            try:
+                detach()
+            except Exception as e:
+                logger.error(f"Error detaching observer: {e}")
+        self._detach_callbacks = []
+    
+    def _on_phase_change(self, change) -> None:
+        """Update topic dropdown options based on selected phase."""
+        topic_dropdown = self._topic_dropdown
+        subtopic_dropdown = self._subtopic_dropdown
+        selected_phase = change['new']
+        
+        # Options and value are reset together: one state message per widget and
+        # a single coalesced value notification instead of one per assignment
+        with hold_sync(topic_dropdown, subtopic_dropdown), \
+                topic_dropdown.hold_trait_notifications(), \
+                subtopic_dropdown.hold_trait_notifications():
+            if selected_phase == SENTINEL_PHASE:
+                topic_dropdown.options = [SENTINEL_TOPIC]
+                subtopic_dropdown.options = []
+                subtopic_dropdown.value = ''
                 return
             
             try:
-                topics = list(self.roadmap[selected_phase]['topics'].keys())
-                topic_dropdown.options = ['-- Select Topic --'] + topics
-                topic_dropdown.value = '-- Select Topic --'
-                logger.debug(f"Updated topics for phase: {selected_phase}")
+                topic_dropdown.options = self._topic_cache[selected_phase]
+                topic_dropdown.value = SENTINEL_TOPIC
             except Exception as e:
                 logger.error(f"Error updating topic options: {e}")
-        
-        def update_subtopic_options(change):
-            """Update subtopic dropdown options based on selected topic."""
-            selected_phase = phase_dropdown.value
-            selected_topic = change['new']
-            
-            if (selected_topic == '-- Select Topic --' or 
-                selected_phase == '-- Select Phase --'):
-                subtopic_dropdown.options = ['-- Select Subtopic --']
+    
+    def _on_topic_change(self, change) -> None:
+        """Update subtopic dropdown options based on selected topic."""
+        subtopic_dropdown = self._subtopic_dropdown
+        selected_phase = self._phase_dropdown.value
+        selected_topic = change['new']
+        
+        with subtopic_dropdown.hold_sync(), subtopic_dropdown.hold_trait_notifications():
+            if (selected_topic == SENTINEL_TOPIC or 
+                selected_phase == SENTINEL_PHASE):
+                subtopic_dropdown.options = []
+                subtopic_dropdown.value = ''
                 return
             
             try:
-                subtopics = self.roadmap[selected_phase]['topics'][selected_topic]['subtopics']
-                subtopic_dropdown.options = ['-- Select Subtopic --'] + subtopics
-                subtopic_dropdown.value = '-- Select Subtopic --'
-                logger.debug(f"Updated subtopics for topic: {selected_topic}")
+                subtopic_dropdown.options = self._subtopic_cache[(selected_phase, selected_topic)]
+                subtopic_dropdown.value = ''
             except Exception as e:
                 logger.error(f"Error updating subtopic options: {e}")
-        
-        def update_progress_fields(change=None):
-            """Update progress fields - SIMPLIFIED VERSION to fix notes issue."""
-            selected_phase = phase_dropdown.value
-            selected_topic = topic_dropdown.value
-            selected_subtopic = subtopic_dropdown.value
-            
+    
+    def _on_subtopic_change(self, change=None) -> None:
+        """Load the selected subtopic into the progress fields, or clear them."""
+        selected_phase = self._phase_dropdown.value
+        selected_topic = self._topic_dropdown.value
+        selected_subtopic = self._subtopic_dropdown.value
+        
+        # Re-selecting the item already on screen would only reload the same data
+        key = (selected_phase, selected_topic, selected_subtopic)
+        if key == self._last_loaded_key:
+            return
+        self._last_loaded_key = None
+        
+        # Batch all widget writes into one sync message per widget; none of these
+        # widgets has a value observer, so the writes trigger no handlers
+        with hold_sync(self._status_indicator, self._selection_info, self._notes_area,
+                       self._resources_area, self._enable_notes_btn, self._status_dropdown,
+                       self._completion_slider):
             # Clear status first
-            status_indicator.value = ""
+            self._status_indicator.value = ""
             
-            if (selected_subtopic == '-- Select Subtopic --' or
-                selected_topic == '-- Select Topic --' or
-                selected_phase == '-- Select Phase --'):
-                
-                # DISABLE notes area
-                notes_area.disabled = True
-                notes_area.value = ''
-                notes_area.placeholder = 'Chọn Phase → Topic → Subtopic để kích hoạt notes...'
-                
-                # Reset enable button
-                enable_notes_btn.disabled = False
-                enable_notes_btn.description = '🔓 Enable Notes'
-                enable_notes_btn.button_style = 'warning'
-                
-                selection_info.value = "<div style='padding: 10px; background: #f8f9fa; border-radius: 5px;'><i>📝 Chọn subtopic để bắt đầu track progress...</i></div>"
+            if not self._require_full_selection(selected_phase, selected_topic, selected_subtopic):
+                self._clear_progress_fields()
+            else:
+                self._populate_progress_fields(selected_phase, selected_topic, selected_subtopic)
+    
+    def _on_add_topic(self, b) -> None:
+        """Add new topic to selected phase."""
+        topic_dropdown = self._topic_dropdown
+        status_indicator = self._status_indicator
+        selected_phase = self._phase_dropdown.value
+        new_topic_name = self._new_topic_text.value.strip()
+        
+        if selected_phase == SENTINEL_PHASE:
+            status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>⚠️ Chọn Phase trước khi thêm Topic</div>"
+            return
+            
+        if not new_topic_name:
+            status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>⚠️ Nhập tên Topic</div>"
+            return
+        
+        try:
+            # Add to roadmap structure
+            if selected_phase not in self.roadmap:
+                status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>❌ Phase không tồn tại</div>"
                 return
             
-            # All selections are valid - proceed
-            try:
-                # Load existing progress
-                progress_info = self.get_progress_info(selected_phase, selected_topic, selected_subtopic)
-                
-                # Update other fields first
-                status_dropdown.unobserve_all()  # Temporarily remove observers
-                completion_slider.unobserve_all()
-                
-                status_dropdown.value = progress_info['status']
-                completion_slider.value = progress_info['completion']
-                
-                # Re-attach observers
-                # (Will be reattached at the end of function)
-                
-                # FORCE ENABLE notes area - this is the key fix
-                notes_area.disabled = False
-                notes_area.value = progress_info['notes']
-                notes_area.placeholder = f'Nhập ghi chú học tập cho "{selected_subtopic}"...'
-                
-                # Update enable button state
-                enable_notes_btn.description = '✅ Auto Enabled'
-                enable_notes_btn.button_style = 'success' 
-                enable_notes_btn.disabled = True
-                
-                # Update selection info
-                topic_weeks = self.roadmap[selected_phase]['topics'][selected_topic]['weeks']
-                priority = self.roadmap[selected_phase]['topics'][selected_topic]['priority']
-                
-                priority_colors = {'Critical': '#dc3545', 'High': '#fd7e14', 
-                                 'Medium': '#ffc107', 'Low': '#28a745'}
-                priority_color = priority_colors.get(priority, '#6c757d')
-                
-                selection_info.value = f"""
-                <div style='background: linear-gradient(135deg, #f8f9fa, #e9ecef); padding: 15px; border-radius: 8px; border-left: 4px solid {priority_color};'>
-                    <h4 style='margin: 0 0 10px 0; color: #333;'>📖 Đã Chọn</h4>
-                    <p style='margin: 0; color: #666;'><strong>Đường dẫn:</strong> {selected_phase.split(':')[0]} → {selected_topic} → {selected_subtopic}</p>
-                    <p style='margin: 5px 0 0 0;'><span style='background: {priority_color}; color: white; padding: 2px 8px; border-radius: 12px; font-size: 0.85em;'>{priority}</span> 
-                    <strong>Thời gian:</strong> {topic_weeks} tuần | <strong>Cập nhật:</strong> {progress_info['last_updated']}</p>
-                </div>
-                """
-                
-                # Show success message
-                status_indicator.value = f"<div style='color: #28a745; padding: 5px;'>✅ Đã load dữ liệu cho: {selected_subtopic}</div>"
-                
-                logger.info(f"Successfully loaded progress for: {selected_subtopic}")
-                
-            except Exception as e:
-                logger.error(f"Error in update_progress_fields: {e}")
-                # Force enable notes anyway
-                notes_area.disabled = False
-                status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>⚠️ Lỗi load dữ liệu nhưng notes đã được kích hoạt</div>"
-        
-        def save_progress_info(b):
-            """Save progress information with validation and feedback."""
-            selected_phase = phase_dropdown.value
-            selected_topic = topic_dropdown.value
-            selected_subtopic = subtopic_dropdown.value
-            
-            if (selected_subtopic == '-- Select Subtopic --' or
-                selected_topic == '-- Select Topic --' or
-                selected_phase == '-- Select Phase --'):
-                status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>⚠️ Please select a subtopic first</div>"
+            # Check if topic already exists
+            phase_topics = self.roadmap[selected_phase]['topics']
+            if new_topic_name in phase_topics:
+                status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>⚠️ Topic '{new_topic_name}' đã tồn tại</div>"
                 return
             
-            try:
-                # Update button state
-                save_btn.description = '💾 Saving...'
-                save_btn.disabled = True
-                
-                # Get current values - FIXED: Direct access to widget values
-                current_status = status_dropdown.value
-                current_completion = completion_slider.value
-                current_notes = notes_area.value  # This should work now
-                
-                # Debug information
-                logger.debug(f"Saving: Status={current_status}, Completion={current_completion}, Notes length={len(current_notes)}")
-                
-                # Save progress with explicit values
-                success = self.set_progress_info(
-                    selected_phase, selected_topic, selected_subtopic,
-                    current_status, current_completion, current_notes
-                )
-                
-                if success:
-                    status_indicator.value = f"<div style='color: #28a745; padding: 5px;'>✅ Progress saved for: {selected_subtopic}</div>"
-                    logger.info(f"Progress saved successfully for: {selected_subtopic}")
-                    
-                    # Show note preview if there are notes
-                    if current_notes.strip():
-                        note_preview = current_notes[:100] + "..." if len(current_notes) > 100 else current_notes
-                        status_indicator.value += f"<div style='color: #6c757d; padding: 5px; font-style: italic; font-size: 0.9em;'>📝 Note saved: {note_preview}</div>"
-                else:
-                    status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>❌ Error saving progress</div>"
-                    
-            except Exception as e:
-                status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>❌ Error: {str(e)}</div>"
-                logger.error(f"Error in save_progress_info: {e}")
-            finally:
-                # Restore button state
-                save_btn.description = '💾 Save Progress'
-                save_btn.disabled = False
+            # Add new topic
+            phase_topics[new_topic_name] = {
+                'weeks': self._topic_weeks.value,
+                'priority': self._topic_priority.value,
+                'subtopics': []  # Start empty, user can add subtopics
+            }
+            
+            # Update cached and dropdown options
+            self._topic_cache[selected_phase] = [SENTINEL_TOPIC] + list(phase_topics.keys())
+            self._subtopic_cache[(selected_phase, new_topic_name)] = ()
+            self._subtopic_sets[(selected_phase, new_topic_name)] = set()
+            self._flat_items = None
+            self._roadmap_html = None
+            self._progress_version += 1
+            topic_dropdown.options = self._topic_cache[selected_phase]
+            topic_dropdown.value = new_topic_name  # Auto-select new topic
+            
+            # Clear input
+            self._new_topic_text.value = ''
+            
+            status_indicator.value = f"<div style='color: #28a745; padding: 5px;'>✅ Đã thêm Topic: {new_topic_name}</div>"
+            
+        except Exception as e:
+            status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>❌ Lỗi thêm topic: {e}</div>"
+            logger.error(f"Error adding topic: {e}")
+    
+    def _on_add_subtopic(self, b) -> None:
+        """Add new subtopic to selected topic."""
+        subtopic_dropdown = self._subtopic_dropdown
+        status_indicator = self._status_indicator
+        selected_phase = self._phase_dropdown.value
+        selected_topic = self._topic_dropdown.value
+        new_subtopic_name = self._new_subtopic_text.value.strip()
+        
+        if selected_topic == SENTINEL_TOPIC:
+            status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>⚠️ Chọn Topic trước khi thêm Subtopic</div>"
+            return
+            
+        if not new_subtopic_name:
+            status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>⚠️ Nhập tên Subtopic</div>"
+            return
         
-        # Set up event observers with error handling
         try:
-            phase_dropdown.observe(update_topic_options, names='value')
-            topic_dropdown.observe(update_subtopic_options, names='value')
-            subtopic_dropdown.observe(update_progress_fields, names='value')
-            save_btn.on_click(save_progress_info)
+            # Check if subtopic already exists
+            current_subtopics = self.roadmap[selected_phase]['topics'][selected_topic]['subtopics']
+            subtopic_names = self._subtopic_sets[(selected_phase, selected_topic)]
+            if new_subtopic_name in subtopic_names:
+                status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>⚠️ Subtopic '{new_subtopic_name}' đã tồn tại</div>"
+                return
+            
+            # Add new subtopic
+            current_subtopics.append(new_subtopic_name)
+            subtopic_names.add(new_subtopic_name)
+            self._subtopic_index.setdefault(new_subtopic_name, []).append((selected_phase, selected_topic))
+            self._progress_keys.append((selected_phase, selected_topic, new_subtopic_name))
+            self._flat_items = None
+            self._roadmap_html = None
+            self._progress_version += 1
+            
+            # Update cached and dropdown options
+            self._subtopic_cache[(selected_phase, selected_topic)] = tuple(current_subtopics)
+            subtopic_dropdown.options = self._subtopic_cache[(selected_phase, selected_topic)]
+            subtopic_dropdown.value = new_subtopic_name  # Auto-select new subtopic
+            
+            # Clear input
+            self._new_subtopic_text.value = ''
+            
+            status_indicator.value = f"<div style='color: #28a745; padding: 5px;'>✅ Đã thêm Subtopic: {new_subtopic_name}</div>"
+            
         except Exception as e:
-            logger.error(f"Error setting up observers: {e}")
+            status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>❌ Lỗi thêm subtopic: {e}</div>"
+            logger.error(f"Error adding subtopic: {e}")
+    
+    def _on_force_enable_notes(self, b) -> None:
+        """Force enable notes area - manual override."""
+        notes_area = self._notes_area
+        resources_area = self._resources_area
+        enable_notes_btn = self._enable_notes_btn
+        notes_area.disabled = False
+        resources_area.disabled = False
+        notes_area.placeholder = 'Notes area manually enabled - you can type now!'
+        resources_area.placeholder = 'Resources area manually enabled - add your documents/links!'
+        enable_notes_btn.description = '✅ Notes Enabled'
+        enable_notes_btn.button_style = 'success'
+        enable_notes_btn.disabled = True
+        self._status_indicator.value = "<div style='color: #28a745; padding: 5px;'>🔓 Both notes areas manually enabled</div>"
+    
+    def _on_save_click(self, b) -> None:
+        """Save progress information with validation and feedback."""
+        save_btn = self._save_btn
+        status_indicator = self._status_indicator
+        selected_phase = self._phase_dropdown.value
+        selected_topic = self._topic_dropdown.value
+        selected_subtopic = self._subtopic_dropdown.value
+        
+        if not self._require_full_selection(selected_phase, selected_topic, selected_subtopic,
+                                            status_indicator, 'Chọn subtopic trước'):
+            return
         
-        return widgets.VBox([
-            widgets.HTML("""
-            <div style='text-align: center; padding: 15px; background: linear-gradient(135deg, #4CAF50, #45a049); color: white; border-radius: 10px; margin-bottom: 15px;'>
-                <h2 style='margin: 0;'>📈 Learning Progress Manager</h2>
-                <p style='margin: 5px 0 0 0; opacity: 0.9;'>Track your journey through RF IC design mastery</p>
-            </div>
-            """),
-            
-            # Selection area
-            widgets.VBox([
-                widgets.HTML("<h3 style='color: #2e7d32; margin-bottom: 15px;'>🎯 Select Learning Item</h3>"),
-                phase_dropdown,
-                widgets.HTML("<div style='height: 5px;'></div>"),
-                topic_dropdown,
-                widgets.HTML("<div style='height: 5px;'></div>"),
-                subtopic_dropdown,
-                widgets.HTML("<div style='height: 10px;'></div>"),
-                selection_info
-            ], layout=widgets.Layout(
-                border='2px solid #4CAF50', 
-                border_radius='12px',
-                padding='20px', 
-                margin='10px', 
-                background_color='#f8fffe'
-            )),
+        try:
+            # Update button state
+            save_btn.description = '💾 Saving...'
+            save_btn.disabled = True
+            
+            # Get current values - FIXED: Direct access to widget values
+            current_status = self._status_dropdown.value
+            current_completion = self._completion_slider.value
+            current_notes = self._notes_area.value
+            current_resources = self._resources_area.value  # NEW: Save resources
+            
+            # Debug information
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Saving: Status=%s, Completion=%s, Notes length=%d, Resources length=%d",
+                             current_status, current_completion, len(current_notes), len(current_resources))
+            
+            # Enhanced progress info with resources
+            key = (selected_phase, selected_topic, selected_subtopic)
+            self._last_loaded_key = None  # Reload the saved values on next selection
+            now = datetime.now()
+            self.progress[key] = {
+                'status': current_status,
+                'completion': current_completion,
+                'notes': current_notes,
+                'resources': current_resources,  # NEW: Store resources separately
+                'last_updated': now.isoformat(sep=' ', timespec='seconds')
+            }
+            self._last_activity = now
+            self._progress_version += 1
             
-            # Progress tracking area
-            widgets.VBox([
-                widgets.HTML("<h3 style='color: #1976d2; margin-bottom: 15px;'>📊 Track Progress</h3>"),
-                widgets.HBox([
-                    status_dropdown, 
-                    widgets.HTML("<div style='width: 20px;'></div>"),
-                    completion_slider
-                ], layout=widgets.Layout(align_items='center')),
-                widgets.HTML("<div style='height: 15px;'></div>"),
-                widgets.HTML("<h4 style='margin: 0 0 8px 0; color: #555;'>📝 Learning Notes</h4>"),
-                widgets.HTML("""
-                <div style='background: #fff3cd; padding: 10px; border-radius: 5px; border-left: 4px solid #ffc107; margin-bottom: 10px;'>
-                    <strong>🔧 Nếu không nhập được notes:</strong><br>
-                    1. Chọn đầy đủ: Phase → Topic → Subtopic<br>
-                    2. Nếu vẫn bị disabled (màu xám), click nút "🔓 Enable Notes" bên dưới<br>
-                    3. Background sẽ chuyển sang trắng khi đã enable thành công
-                </div>
-                """),
-                notes_area,
-                widgets.HTML("<div style='height: 8px;'></div>"),
-                widgets.HBox([
-                    enable_notes_btn,
-                    widgets.HTML("<div style='width: 15px;'></div>"),
-                    widgets.HTML("<span style='color: #666; font-size: 0.9em; font-style: italic;'>👆 Click nếu notes area bị disabled</span>")
-                ], layout=widgets.Layout(align_items='center')),
-                widgets.HTML("<div style='height: 10px;'></div>"),
-                widgets.HBox([
-                    save_btn,
-                    widgets.HTML("<div style='width: 20px;'></div>"),
-                    status_indicator
-                ], layout=widgets.Layout(align_items='center')),
+            # Write to file in the background; the UI is updated when it finishes
+            self._schedule_save(functools.partial(self._report_save, selected_subtopic, current_notes, current_resources))
                 
-                # Debug panel for troubleshooting
-                widgets.HTML("<div style='height: 15px;'></div>"),
-                widgets.HTML("""
-                <div style='background: #e8f4f8; padding: 15px; border-radius: 8px; border-left: 4px solid #17a2b8;'>
-                    <strong>🔍 Debug Panel:</strong><br>
-                    <span style='font-size: 0.9em; color: #666;'>
-                    • Notes area disabled = màu xám, không type được<br>
-                    • Notes area enabled = màu trắng, có thể type<br>
-                    • Nếu auto-enable không hoạt động → dùng nút "🔓 Enable Notes"<br>
-                    • Sau khi enable, hãy thử type vài từ để test
-                    </span>
-                </div>
-                """)
-            ], layout=widgets.Layout(
-                border='2px solid #2196F3', 
-                border_radius='12px',
-                padding='20px', 
-                margin='10px', 
-                background_color='#f8fbff'
-            ))
-        ])
+        except Exception as e:
+            status_indicator.value = f"<div style='color: #dc3545; padding: 5px;'>❌ Lỗi: {str(e)}</div>"
+            logger.error(f"Error in _on_save_click: {e}")
+            save_btn.description = '💾 Save Progress'
+            save_btn.disabled = False
+    
+    def _report_save(self, subtopic: str, notes: str, resources: str, success: bool) -> None:
+        """
+        Show the outcome of a background save and re-enable the Save button.
+        
+        Args:
+            subtopic (str): Saved subtopic name
+            notes (str): Saved learning notes, previewed on success
+            resources (str): Saved resources, previewed on success
+            success (bool): Whether the progress file was written
+        """
+        status_indicator = self._status_indicator
+        try:
+            if success:
+                # Build the message and previews locally, then assign once
+                parts = [f"<div style='color: #28a745; padding: 5px;'>✅ Đã lưu progress cho: {subtopic}</div>"]
+                logger.info("Progress saved successfully for: %s", subtopic)
+                
+                # Show note preview if there are notes
+                if notes.strip():
+                    note_preview = notes[:50] + "..." if len(notes) > 50 else notes
+                    parts.append(SAVE_PREVIEW_HTML.format_map({'icon': '📝', 'label': 'Ghi chú', 'preview': note_preview}))
+                
+                # Show resources preview if there are resources
+                if resources.strip():
+                    resources_preview = resources[:50] + "..." if len(resources) > 50 else resources
+                    parts.append(SAVE_PREVIEW_HTML.format_map({'icon': '📚', 'label': 'Tài liệu', 'preview': resources_preview}))
+                
+                status_indicator.value = ''.join(parts)
+            else:
+                status_indicator.value = "<div style='color: #dc3545; padding: 5px;'>❌ Lỗi lưu progress</div>"
+        finally:
+            # Restore button state
+            self._save_btn.description = '💾 Save Progress'
+            self._save_btn.disabled = False
     
     def create_milestone_manager(self) -> widgets.Widget:
         """
@@ -1511,32 +2036,28 @@ class RFLearningRoadmapSystem:
                 """
                 return
             
-            html_content = "<h4 style='color: #495057; margin-bottom: 15px;'>📅 Current Milestones</h4>"
-            html_content += "<div style='max-height: 400px; overflow-y: auto; padding-right: 10px;'>"
+            # Collect the fragments and join once at the end
+            parts = [
+                "<h4 style='color: #495057; margin-bottom: 15px;'>📅 Current Milestones</h4>",
+                "<div style='max-height: 400px; overflow-y: auto; padding-right: 10px;'>"
+            ]
             
-            # Sort milestones by start date
-            sorted_milestones = sorted(
-                self.milestones.items(), 
-                key=lambda x: x[1]['start_date']
-            )
+            # Sort milestones by parsed start date; undated ones go last
+            now = datetime.now()
+            undated = (datetime.max, datetime.max)
+            sorted_milestones = [(phase, info, self._milestone_dates.get(phase) or undated)
+                                 for phase, info in self.milestones.items()]
+            sorted_milestones.sort(key=itemgetter(2))
             
-            for phase, info in sorted_milestones:
-                status_colors = {
-                    'Planned': '#ffc107', 
-                    'Active': '#17a2b8', 
-                    'Completed': '#28a745', 
-                    'Delayed': '#dc3545'
-                }
-                status_color = status_colors.get(info['status'], '#6c757d')
+            for phase, info, (start_dt, end_dt) in sorted_milestones:
+                status_color = MILESTONE_STATUS_COLORS.get(info['status'], '#6c757d')
                 
                 # Calculate progress indicators
                 try:
-                    start_dt = datetime.strptime(info['start_date'], '%Y-%m-%d')
-                    end_dt = datetime.strptime(info['target_end_date'], '%Y-%m-%d')
                     total_days = (end_dt - start_dt).days
                     
                     if info['status'] == 'Active':
-                        days_passed = (datetime.now() - start_dt).days
+                        days_passed = (now - start_dt).days
                         progress_percent = min(100, max(0, (days_passed / total_days) * 100))
                         progress_bar = f"""
                         <div style='width: 100%; background: #e9ecef; border-radius: 10px; margin: 8px 0;'>
@@ -1550,9 +2071,9 @@ class RFLearningRoadmapSystem:
                 except:
                     progress_bar = ""
                 
-                phase_short = phase.split(':')[0] if ':' in phase else phase
+                phase_short = self._phase_short.get(phase) or phase.split(':', 1)[0]
                 
-                html_content += f"""
+                parts.append(f"""
                 <div style='border: 2px solid {status_color}; border-radius: 12px; padding: 15px; margin: 10px 0; 
                             background: linear-gradient(135deg, rgba(255,255,255,0.9), rgba(248,249,250,0.9)); 
                             box-shadow: 0 2px 8px rgba(0,0,0,0.1); transition: transform 0.2s;'
@@ -1570,12 +2091,13 @@ class RFLearningRoadmapSystem:
                     </div>
                     {progress_bar}
                 </div>
-                """
-            html_content += "</div>"
-            milestone_display.value = html_content
+                """)
+            parts.append("</div>")
+            milestone_display.value = "".join(parts)
         
         def set_milestone(b):
             """Set milestone with validation and feedback."""
+            nonlocal end_date_user_edited
             selected_phase = milestone_phase_dropdown.value
             
             try:
@@ -1595,9 +2117,14 @@ class RFLearningRoadmapSystem:
                     'actual_end_date': '',
                     'status': milestone_status.value
                 }
+                self._milestone_dates[selected_phase] = (datetime.combine(start_date.value, datetime.min.time()),
+                                                         datetime.combine(end_date.value, datetime.min.time()))
+                self._progress_version += 1
                 
                 success = self._save_milestones()
                 if success:
+                    # The chosen date is stored; resume suggestions for the next phase
+                    end_date_user_edited = False
                     update_milestone_display()
                     milestone_status_indicator.value = f"<div style='color: #28a745; padding: 5px;'>✅ Milestone set for: {selected_phase.split(':')[0]}</div>"
                     logger.info(f"Milestone set successfully for: {selected_phase}")
@@ -1612,19 +2139,35 @@ class RFLearningRoadmapSystem:
                 set_milestone_btn.description = '🎯 Set Milestone'
                 set_milestone_btn.disabled = False
         
-        # Auto-update end date based on phase duration
+        # Auto-update end date based on phase duration, unless the user picked one
+        end_date_user_edited = False
+        
+        def mark_end_date_edited(change):
+            """Remember that the target end date was chosen by hand."""
+            nonlocal end_date_user_edited
+            end_date_user_edited = True
+        
         def update_end_date_suggestion(change):
             """Auto-suggest end date based on phase duration."""
+            nonlocal end_date_user_edited
+            if end_date_user_edited:
+                return
+            
             selected_phase = change['new']
             if selected_phase in self.roadmap:
                 duration_weeks = self.roadmap[selected_phase]['duration_weeks']
                 suggested_end = start_date.value + timedelta(weeks=duration_weeks)
-                end_date.value = suggested_end
+                if end_date.value != suggested_end:
+                    with end_date.hold_trait_notifications():
+                        end_date.value = suggested_end
+                    # Our own write is not a user edit
+                    end_date_user_edited = False
         
         # Set up event handlers
         try:
             set_milestone_btn.on_click(set_milestone)
             milestone_phase_dropdown.observe(update_end_date_suggestion, names='value')
+            end_date.observe(mark_end_date_edited, names='value')
         except Exception as e:
             logger.error(f"Error setting up milestone manager observers: {e}")
         
@@ -1673,6 +2216,8 @@ class RFLearningRoadmapSystem:
         Returns:
             widgets.Widget: Complete analytics dashboard
         """
+        # Charts are swapped in place on an Image widget; the Output only holds the text summary
+        analytics_image = widgets.Image(format='png', layout=widgets.Layout(width='100%'))
         analytics_output = widgets.Output()
         
         refresh_btn = widgets.Button(
@@ -1682,249 +2227,20 @@ class RFLearningRoadmapSystem:
             tooltip='Update all analytics and charts'
         )
         
-        def generate_analytics(b=None):
-            """Generate comprehensive analytics with error handling."""
+        def show_analytics(stats, future):
+            """Show the rendered charts and print the summary statistics below them."""
             with analytics_output:
                 clear_output(wait=True)
                 
                 try:
-                    # Calculate overall progress statistics
-                    total_items = 0
-                    completed_items = 0
-                    in_progress_items = 0
-                    review_items = 0
-                    
-                    phase_stats = {}
-                    priority_progress = {'Critical': {'total': 0, 'completed': 0},
-                                       'High': {'total': 0, 'completed': 0},
-                                       'Medium': {'total': 0, 'completed': 0},
-                                       'Low': {'total': 0, 'completed': 0}}
-                    
-                    for phase_name, phase_data in self.roadmap.items():
-                        phase_total = 0
-                        phase_completed = 0
-                        phase_in_progress = 0
-                        phase_review = 0
-                        
-                        for topic_name, topic_data in phase_data['topics'].items():
-                            priority = topic_data['priority']
-                            for subtopic in topic_data['subtopics']:
-                                total_items += 1
-                                phase_total += 1
-                                priority_progress[priority]['total'] += 1
-                                
-                                progress_info = self.get_progress_info(phase_name, topic_name, subtopic)
-                                status = progress_info['status']
-                                
-                                if status == 'Completed':
-                                    completed_items += 1
-                                    phase_completed += 1
-                                    priority_progress[priority]['completed'] += 1
-                                elif status in ['In Progress']:
-                                    in_progress_items += 1
-                                    phase_in_progress += 1
-                                elif status == 'Review':
-                                    review_items += 1
-                                    phase_review += 1
-                        
-                        completion_rate = (phase_completed / phase_total * 100) if phase_total > 0 else 0
-                        phase_stats[phase_name] = {
-                            'total': phase_total,
-                            'completed': phase_completed,
-                            'in_progress': phase_in_progress,
-                            'review': phase_review,
-                            'completion_rate': completion_rate
-                        }
-                    
-                    # Create enhanced visualizations
-                    fig = plt.figure(figsize=(16, 12))
-                    fig.suptitle('RF IC Design Learning Analytics Dashboard', fontsize=18, fontweight='bold', y=0.95)
-                    
-                    # Create a 3x2 subplot layout
-                    gs = fig.add_gridspec(3, 2, height_ratios=[1, 1, 1], width_ratios=[1, 1], hspace=0.3, wspace=0.3)
-                    
-                    # 1. Overall progress pie chart
-                    ax1 = fig.add_subplot(gs[0, 0])
-                    overall_not_started = total_items - completed_items - in_progress_items - review_items
-                    sizes = [completed_items, in_progress_items, review_items, overall_not_started]
-                    labels = ['Completed', 'In Progress', 'Review', 'Not Started']
-                    colors = ['#28a745', '#ffc107', '#17a2b8', '#dc3545']
-                    
-                    # Only show non-zero slices
-                    non_zero_data = [(size, label, color) for size, label, color in zip(sizes, labels, colors) if size > 0]
-                    if non_zero_data:
-                        sizes_nz, labels_nz, colors_nz = zip(*non_zero_data)
-                        wedges, texts, autotexts = ax1.pie(sizes_nz, labels=labels_nz, colors=colors_nz,
-                                                          autopct=lambda pct: f'{pct:.1f}%\n({int(pct/100*total_items)})',
-                                                          startangle=90, textprops={'fontsize': 9})
-                        for autotext in autotexts:
-                            autotext.set_color('white')
-                            autotext.set_fontweight('bold')
-                    
-                    ax1.set_title('Overall Progress Distribution', fontsize=12, fontweight='bold', pad=20)
-                    
-                    # 2. Progress by phase bar chart
-                    ax2 = fig.add_subplot(gs[0, 1])
-                    phases = list(phase_stats.keys())
-                    completion_rates = [phase_stats[phase]['completion_rate'] for phase in phases]
-                    phase_colors_list = [self.phase_colors.get(self.roadmap[phase]['phase'], '#6c757d') for phase in phases]
-                    
-                    bars = ax2.bar(range(len(phases)), completion_rates, color=phase_colors_list, alpha=0.8, edgecolor='black', linewidth=0.5)
-                    ax2.set_xlabel('Learning Phases', fontweight='bold')
-                    ax2.set_ylabel('Completion Rate (%)', fontweight='bold')
-                    ax2.set_title('Progress by Phase', fontsize=12, fontweight='bold', pad=20)
-                    ax2.set_xticks(range(len(phases)))
-                    ax2.set_xticklabels([phase.split(':')[0] for phase in phases], rotation=45, ha='right', fontsize=9)
-                    ax2.set_ylim(0, 105)
-                    ax2.grid(True, alpha=0.3, axis='y')
-                    
-                    # Add value labels on bars
-                    for bar, rate in zip(bars, completion_rates):
-                        height = bar.get_height()
-                        ax2.text(bar.get_x() + bar.get_width()/2., height + 1,
-                                f'{height:.1f}%', ha='center', va='bottom', fontweight='bold', fontsize=9)
-                    
-                    # 3. Priority-based progress
-                    ax3 = fig.add_subplot(gs[1, 0])
-                    priorities = list(priority_progress.keys())
-                    priority_completion_rates = []
-                    for priority in priorities:
-                        total_p = priority_progress[priority]['total']
-                        completed_p = priority_progress[priority]['completed']
-                        rate = (completed_p / total_p * 100) if total_p > 0 else 0
-                        priority_completion_rates.append(rate)
-                    
-                    priority_colors_map = {'Critical': '#dc3545', 'High': '#fd7e14', 
-                                         'Medium': '#ffc107', 'Low': '#28a745'}
-                    colors_p = [priority_colors_map[p] for p in priorities]
-                    
-                    bars_p = ax3.bar(priorities, priority_completion_rates, color=colors_p, alpha=0.8, edgecolor='black', linewidth=0.5)
-                    ax3.set_xlabel('Priority Level', fontweight='bold')
-                    ax3.set_ylabel('Completion Rate (%)', fontweight='bold')
-                    ax3.set_title('Progress by Priority', fontsize=12, fontweight='bold', pad=20)
-                    ax3.set_ylim(0, 105)
-                    ax3.grid(True, alpha=0.3, axis='y')
-                    
-                    # Add value labels and item counts
-                    for bar, priority in zip(bars_p, priorities):
-                        height = bar.get_height()
-                        total_items_p = priority_progress[priority]['total']
-                        completed_items_p = priority_progress[priority]['completed']
-                        ax3.text(bar.get_x() + bar.get_width()/2., height + 1,
-                                f'{height:.1f}%', ha='center', va='bottom', fontweight='bold', fontsize=9)
-                        ax3.text(bar.get_x() + bar.get_width()/2., height/2,
-                                f'{completed_items_p}/{total_items_p}', ha='center', va='center', 
-                                color='white', fontweight='bold', fontsize=8)
-                    
-                    # 4. Timeline view (enhanced)
-                    ax4 = fig.add_subplot(gs[1, 1])
-                    if self.milestones:
-                        milestone_phases = []
-                        start_dates = []
-                        end_dates = []
-                        statuses = []
-                        
-                        for phase, info in self.milestones.items():
-                            if info['start_date'] and info['target_end_date']:
-                                milestone_phases.append(phase.split(':')[0])
-                                start_dates.append(pd.to_datetime(info['start_date']))
-                                end_dates.append(pd.to_datetime(info['target_end_date']))
-                                statuses.append(info['status'])
-                        
-                        if milestone_phases:
-                            y_pos = np.arange(len(milestone_phases))
-                            durations = [(end - start).days for start, end in zip(start_dates, end_dates)]
-                            
-                            # Color by status
-                            status_colors_timeline = {'Planned': '#ffc107', 'Active': '#17a2b8', 
-                                                    'Completed': '#28a745', 'Delayed': '#dc3545'}
-                            bar_colors = [status_colors_timeline.get(status, '#6c757d') for status in statuses]
-                            
-                            bars_t = ax4.barh(y_pos, durations, left=[d.toordinal() for d in start_dates], 
-                                            color=bar_colors, alpha=0.8, edgecolor='black', linewidth=0.5)
-                            ax4.set_yticks(y_pos)
-                            ax4.set_yticklabels(milestone_phases, fontsize=9)
-                            ax4.set_xlabel('Timeline', fontweight='bold')
-                            ax4.set_title('Learning Phase Timeline', fontsize=12, fontweight='bold', pad=20)
-                            
-                            # Format x-axis as dates
-                            ax4.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-                            ax4.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
-                            plt.setp(ax4.xaxis.get_majorticklabels(), rotation=45, ha='right', fontsize=8)
-                            ax4.grid(True, alpha=0.3, axis='x')
-                            
-                            # Add status labels
-                            for i, (bar, status, duration) in enumerate(zip(bars_t, statuses, durations)):
-                                ax4.text(bar.get_x() + bar.get_width()/2, bar.get_y() + bar.get_height()/2,
-                                        f'{status}\n{duration}d', ha='center', va='center',
-                                        color='white', fontweight='bold', fontsize=7)
-                    else:
-                        ax4.text(0.5, 0.5, '📅 Set milestones to view timeline\n\nUse the Milestone Manager tab\nto create your learning timeline', 
-                                ha='center', va='center', transform=ax4.transAxes,
-                                fontsize=11, style='italic', bbox=dict(boxstyle="round,pad=0.3", 
-                                facecolor='lightgray', alpha=0.5))
-                        ax4.set_title('Learning Phase Timeline', fontsize=12, fontweight='bold', pad=20)
-                    
-                    # 5. Learning velocity (items completed over time)
-                    ax5 = fig.add_subplot(gs[2, :])
-                    
-                    # Extract completion dates and create velocity chart
-                    completion_dates = []
-                    for progress_info in self.progress.values():
-                        if progress_info['status'] == 'Completed' and progress_info['last_updated']:
-                            try:
-                                date = datetime.strptime(progress_info['last_updated'], '%Y-%m-%d %H:%M:%S').date()
-                                completion_dates.append(date)
-                            except:
-                                pass
-                    
-                    if completion_dates:
-                        completion_dates.sort()
-                        
-                        # Create cumulative completion chart
-                        date_counts = {}
-                        for date in completion_dates:
-                            date_counts[date] = date_counts.get(date, 0) + 1
-                        
-                        dates = list(date_counts.keys())
-                        cumulative_counts = []
-                        running_total = 0
-                        for date in dates:
-                            running_total += date_counts[date]
-                            cumulative_counts.append(running_total)
-                        
-                        ax5.plot(dates, cumulative_counts, marker='o', linewidth=2, markersize=6, 
-                                color='#2196F3', markerfacecolor='#1976D2', markeredgecolor='white')
-                        ax5.fill_between(dates, cumulative_counts, alpha=0.3, color='#2196F3')
-                        
-                        ax5.set_xlabel('Date', fontweight='bold')
-                        ax5.set_ylabel('Cumulative Items Completed', fontweight='bold')
-                        ax5.set_title('Learning Velocity - Cumulative Progress Over Time', fontsize=12, fontweight='bold', pad=20)
-                        ax5.grid(True, alpha=0.3)
-                        
-                        # Format dates on x-axis
-                        ax5.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-                        ax5.xaxis.set_major_locator(mdates.MonthLocator())
-                        plt.setp(ax5.xaxis.get_majorticklabels(), rotation=45, ha='right')
-                        
-                        # Add trend line
-                        if len(dates) > 1:
-                            x_numeric = [d.toordinal() for d in dates]
-                            z = np.polyfit(x_numeric, cumulative_counts, 1)
-                            p = np.poly1d(z)
-                            ax5.plot(dates, p([d.toordinal() for d in dates]), "--", 
-                                    color='red', alpha=0.8, linewidth=2, label=f'Trend (slope: {z[0]:.2f} items/day)')
-                            ax5.legend()
-                    else:
-                        ax5.text(0.5, 0.5, '📈 Complete some items to view\nyour learning velocity!\n\nThis chart will show your progress over time', 
-                                ha='center', va='center', transform=ax5.transAxes,
-                                fontsize=11, style='italic', bbox=dict(boxstyle="round,pad=0.3", 
-                                facecolor='lightblue', alpha=0.3))
-                        ax5.set_title('Learning Velocity - Cumulative Progress Over Time', fontsize=12, fontweight='bold', pad=20)
+                    analytics_image.value = future.result()
                     
-                    plt.tight_layout()
-                    plt.subplots_adjust(top=0.92)
-                    plt.show()
+                    total_items = stats['total_items']
+                    completed_items = stats['completed_items']
+                    in_progress_items = stats['in_progress_items']
+                    review_items = stats['review_items']
+                    phase_stats = stats['phase_stats']
+                    priority_progress = stats['priority_progress']
                     
                     # Display enhanced summary statistics
                     print("\n" + "="*70)
@@ -1938,10 +2254,10 @@ class RFLearningRoadmapSystem:
                     print(f"⏳ Not Started: {total_items - completed_items - in_progress_items - review_items} items")
                     
                     print(f"\n📋 Progress by Phase:")
-                    for phase, stats in phase_stats.items():
-                        phase_short = phase.split(':')[0]
-                        print(f"  • {phase_short}: {stats['completed']}/{stats['total']} ({stats['completion_rate']:.1f}%) "
-                              f"[{stats['in_progress']} in progress, {stats['review']} in review]")
+                    for phase, phase_stat in phase_stats.items():
+                        phase_short = self._phase_short[phase]
+                        print(f"  • {phase_short}: {phase_stat['completed']}/{phase_stat['total']} ({phase_stat['completion_rate']:.1f}%) "
+                              f"[{phase_stat['in_progress']} in progress, {phase_stat['review']} in review]")
                     
                     print(f"\n🎯 Progress by Priority:")
                     for priority in ['Critical', 'High', 'Medium', 'Low']:
@@ -1952,8 +2268,8 @@ class RFLearningRoadmapSystem:
                     
                     # Enhanced recommendations
                     print(f"\n🎯 PERSONALIZED RECOMMENDATIONS:")
-                    recommendations = self._get_learning_recommendations()
-                    for i, rec in enumerate(recommendations[:7], 1):
+                    recommendations = self._get_learning_recommendations(limit=7)
+                    for i, rec in enumerate(recommendations, 1):
                         print(f"  {i}. {rec}")
                     
                     # Learning insights
@@ -1965,91 +2281,411 @@ class RFLearningRoadmapSystem:
                 except Exception as e:
                     print(f"❌ Error generating analytics: {e}")
                     logger.error(f"Analytics generation error: {e}")
+                finally:
+                    refresh_btn.disabled = False
+        
+        def generate_analytics(b=None):
+            """Compute statistics and render the charts off the UI thread."""
+            try:
+                # Counting is fast; only the figure rasterization goes to the worker
+                stats = self._compute_progress_statistics()
+                refresh_btn.disabled = True
+                future = _ANALYTICS_EXECUTOR.submit(self._render_analytics_png, stats,
+                                                    list(self.progress.values()), dict(self.milestones),
+                                                    dict(self._milestone_dates))
+                _call_when_done(future, functools.partial(show_analytics, stats))
+            except Exception as e:
+                refresh_btn.disabled = False
+                with analytics_output:
+                    clear_output(wait=True)
+                    print(f"❌ Error generating analytics: {e}")
+                logger.error(f"Analytics generation error: {e}")
+        
+        refresh_btn.on_click(generate_analytics)
+        generate_analytics()  # Initial load
+        
+        return widgets.VBox([
+            widgets.HTML("""
+            <div style='text-align: center; padding: 15px; background: linear-gradient(135deg, #6a11cb, #2575fc); color: white; border-radius: 10px; margin-bottom: 15px;'>
+                <h2 style='margin: 0;'>📊 Learning Analytics Dashboard</h2>
+                <p style='margin: 5px 0 0 0; opacity: 0.9;'>Comprehensive insights into your learning journey</p>
+            </div>
+            """),
+            
+            widgets.HBox([
+                refresh_btn,
+                widgets.HTML("<div style='width: 20px;'></div>"),
+                widgets.HTML("<div style='color: #666; font-style: italic; padding: 8px 0;'>💡 Analytics update automatically when you track progress</div>")
+            ], layout=widgets.Layout(margin='0 0 15px 0')),
+            
+            analytics_image,
+            analytics_output
+        ])
+    
+    def _render_analytics_png(self, stats: Dict[str, Any], progress_records: List[Dict[str, Any]],
+                              milestones: Dict[str, Dict[str, str]],
+                              milestone_dates: Dict[str, Optional[Tuple[datetime, datetime]]]) -> bytes:
+        """
+        Draw the analytics dashboard charts and rasterize them to PNG.
+        
+        Uses a standalone Figure rather than pyplot so it can run on the
+        analytics worker thread. Progress and milestones are passed in as
+        snapshots so the UI thread can keep editing the live data.
+        
+        Args:
+            stats (Dict[str, Any]): Result of _compute_progress_statistics
+            progress_records (List[Dict[str, Any]]): Snapshot of self.progress values
+            milestones (Dict[str, Dict[str, str]]): Snapshot of self.milestones
+            milestone_dates (Dict[str, Optional[Tuple]]): Snapshot of the parsed milestone dates
+            
+        Returns:
+            bytes: PNG image data
+        """
+        # Imported on first render so loading the module and the other tabs skips matplotlib
+        import matplotlib.dates as mdates
+        from matplotlib.artist import setp
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        
+        total_items = stats['total_items']
+        completed_items = stats['completed_items']
+        in_progress_items = stats['in_progress_items']
+        review_items = stats['review_items']
+        phase_stats = stats['phase_stats']
+        priority_progress = stats['priority_progress']
+        
+        # Reuse one figure across refreshes; clearing the axes is cheaper than
+        # allocating a new figure, gridspec and Agg buffer every time
+        if self._analytics_figure is None:
+            fig = Figure(figsize=(16, 12))
+            # Bind the Agg canvas up front; savefig then renders on it instead of swapping canvases per call
+            FigureCanvasAgg(fig)
+            
+            # Create a 3x2 subplot layout
+            gs = fig.add_gridspec(3, 2, height_ratios=[1, 1, 1], width_ratios=[1, 1], hspace=0.3, wspace=0.3)
+            self._analytics_axes = (fig.add_subplot(gs[0, 0]), fig.add_subplot(gs[0, 1]),
+                                    fig.add_subplot(gs[1, 0]), fig.add_subplot(gs[1, 1]),
+                                    fig.add_subplot(gs[2, :]))
+            # (formatter, locator) for the timeline and velocity axes; re-attached after each clear
+            self._analytics_date_tickers = ((mdates.DateFormatter('%Y-%m'), mdates.MonthLocator(interval=2)),
+                                            (mdates.DateFormatter('%Y-%m'), mdates.MonthLocator()))
+            self._analytics_figure = fig
+        
+        fig = self._analytics_figure
+        ax1, ax2, ax3, ax4, ax5 = self._analytics_axes
+        timeline_ticks, velocity_ticks = self._analytics_date_tickers
+        for ax in self._analytics_axes:
+            ax.clear()
+        fig.suptitle('RF IC Design Learning Analytics Dashboard', fontsize=18, fontweight='bold', y=0.95)
+        
+        # 1. Overall progress pie chart
+        overall_not_started = total_items - completed_items - in_progress_items - review_items
+        sizes = [completed_items, in_progress_items, review_items, overall_not_started]
+        labels = ['Completed', 'In Progress', 'Review', 'Not Started']
+        colors = ['#28a745', '#ffc107', '#17a2b8', '#dc3545']
+        
+        # Only show non-zero slices
+        non_zero_data = [(size, label, color) for size, label, color in zip(sizes, labels, colors) if size > 0]
+        if non_zero_data:
+            sizes_nz, labels_nz, colors_nz = zip(*non_zero_data)
+            wedges, texts, autotexts = ax1.pie(sizes_nz, labels=labels_nz, colors=colors_nz,
+                                              autopct=lambda pct: f'{pct:.1f}%\n({int(pct/100*total_items)})',
+                                              startangle=90, textprops={'fontsize': 9})
+            for autotext in autotexts:
+                autotext.set_color('white')
+                autotext.set_fontweight('bold')
+        
+        ax1.set_title('Overall Progress Distribution', fontsize=12, fontweight='bold', pad=20)
+        
+        # 2. Progress by phase bar chart
+        phases = list(phase_stats.keys())
+        completion_rates = [phase_stats[phase]['completion_rate'] for phase in phases]
+        phase_colors_list = [self.phase_colors.get(self.roadmap[phase]['phase'], '#6c757d') for phase in phases]
+        
+        bars = ax2.bar(range(len(phases)), completion_rates, color=phase_colors_list, alpha=0.8, edgecolor='black', linewidth=0.5)
+        ax2.set_xlabel('Learning Phases', fontweight='bold')
+        ax2.set_ylabel('Completion Rate (%)', fontweight='bold')
+        ax2.set_title('Progress by Phase', fontsize=12, fontweight='bold', pad=20)
+        ax2.set_xticks(range(len(phases)))
+        ax2.set_xticklabels([self._phase_short[phase] for phase in phases], rotation=45, ha='right', fontsize=9)
+        ax2.set_ylim(0, 105)
+        ax2.grid(True, alpha=0.3, axis='y')
+        
+        # Add value labels on bars
+        for bar, rate in zip(bars, completion_rates):
+            height = bar.get_height()
+            ax2.text(bar.get_x() + bar.get_width()/2., height + 1,
+                    f'{height:.1f}%', ha='center', va='bottom', fontweight='bold', fontsize=9)
+        
+        # 3. Priority-based progress
+        priorities = list(priority_progress.keys())
+        priority_completion_rates = []
+        for priority in priorities:
+            total_p = priority_progress[priority]['total']
+            completed_p = priority_progress[priority]['completed']
+            rate = (completed_p / total_p * 100) if total_p > 0 else 0
+            priority_completion_rates.append(rate)
+        
+        colors_p = [PRIORITY_COLORS[p] for p in priorities]
+        
+        bars_p = ax3.bar(priorities, priority_completion_rates, color=colors_p, alpha=0.8, edgecolor='black', linewidth=0.5)
+        ax3.set_xlabel('Priority Level', fontweight='bold')
+        ax3.set_ylabel('Completion Rate (%)', fontweight='bold')
+        ax3.set_title('Progress by Priority', fontsize=12, fontweight='bold', pad=20)
+        ax3.set_ylim(0, 105)
+        ax3.grid(True, alpha=0.3, axis='y')
+        
+        # Add value labels and item counts
+        for bar, priority in zip(bars_p, priorities):
+            height = bar.get_height()
+            total_items_p = priority_progress[priority]['total']
+            completed_items_p = priority_progress[priority]['completed']
+            ax3.text(bar.get_x() + bar.get_width()/2., height + 1,
+                    f'{height:.1f}%', ha='center', va='bottom', fontweight='bold', fontsize=9)
+            ax3.text(bar.get_x() + bar.get_width()/2., height/2,
+                    f'{completed_items_p}/{total_items_p}', ha='center', va='center', 
+                    color='white', fontweight='bold', fontsize=8)
+        
+        # 4. Timeline view (enhanced)
+        if milestones:
+            milestone_phases = []
+            start_dates = []
+            end_dates = []
+            statuses = []
+            
+            for phase, info in milestones.items():
+                dates = milestone_dates.get(phase)
+                if dates:
+                    milestone_phases.append(self._phase_short.get(phase) or phase.split(':', 1)[0])
+                    start_dates.append(dates[0])
+                    end_dates.append(dates[1])
+                    statuses.append(info['status'])
+            
+            if milestone_phases:
+                y_pos = np.arange(len(milestone_phases))
+                durations = [(end - start).days for start, end in zip(start_dates, end_dates)]
+                
+                # Color by status
+                bar_colors = [MILESTONE_STATUS_COLORS.get(status, '#6c757d') for status in statuses]
+                
+                bars_t = ax4.barh(y_pos, durations, left=[d.toordinal() for d in start_dates], 
+                                color=bar_colors, alpha=0.8, edgecolor='black', linewidth=0.5)
+                ax4.set_yticks(y_pos)
+                ax4.set_yticklabels(milestone_phases, fontsize=9)
+                ax4.set_xlabel('Timeline', fontweight='bold')
+                ax4.set_title('Learning Phase Timeline', fontsize=12, fontweight='bold', pad=20)
+                
+                # Format x-axis as dates
+                ax4.xaxis.set_major_formatter(timeline_ticks[0])
+                ax4.xaxis.set_major_locator(timeline_ticks[1])
+                setp(ax4.xaxis.get_majorticklabels(), rotation=45, ha='right', fontsize=8)
+                ax4.grid(True, alpha=0.3, axis='x')
+                
+                # Add status labels
+                for i, (bar, status, duration) in enumerate(zip(bars_t, statuses, durations)):
+                    ax4.text(bar.get_x() + bar.get_width()/2, bar.get_y() + bar.get_height()/2,
+                            f'{status}\n{duration}d', ha='center', va='center',
+                            color='white', fontweight='bold', fontsize=7)
+        else:
+            ax4.text(0.5, 0.5, '📅 Set milestones to view timeline\n\nUse the Milestone Manager tab\nto create your learning timeline', 
+                    ha='center', va='center', transform=ax4.transAxes,
+                    fontsize=11, style='italic', bbox=dict(boxstyle="round,pad=0.3", 
+                    facecolor='lightgray', alpha=0.5))
+            ax4.set_title('Learning Phase Timeline', fontsize=12, fontweight='bold', pad=20)
+        
+        # 5. Learning velocity (items completed over time)
+        
+        # Extract completion days as ordinals and create velocity chart
+        completion_ordinals = []
+        for progress_info in progress_records:
+            if progress_info['status'] == 'Completed' and progress_info['last_updated']:
+                completed_at = _parse_timestamp(progress_info['last_updated'])
+                if completed_at is not None:
+                    completion_ordinals.append(completed_at.toordinal())
+        
+        if completion_ordinals:
+            # Cumulative completion chart and its trend line in one numeric kernel
+            ordinals, cumulative_counts, slope, intercept = _velocity_kernel(
+                np.asarray(completion_ordinals, dtype=np.int64))
+            dates = [datetime.fromordinal(int(ordinal)) for ordinal in ordinals]
+            
+            ax5.plot(dates, cumulative_counts, marker='o', linewidth=2, markersize=6, 
+                    color='#2196F3', markerfacecolor='#1976D2', markeredgecolor='white')
+            ax5.fill_between(dates, cumulative_counts, alpha=0.3, color='#2196F3')
+            
+            ax5.set_xlabel('Date', fontweight='bold')
+            ax5.set_ylabel('Cumulative Items Completed', fontweight='bold')
+            ax5.set_title('Learning Velocity - Cumulative Progress Over Time', fontsize=12, fontweight='bold', pad=20)
+            ax5.grid(True, alpha=0.3)
+            
+            # Format dates on x-axis
+            ax5.xaxis.set_major_formatter(velocity_ticks[0])
+            ax5.xaxis.set_major_locator(velocity_ticks[1])
+            setp(ax5.xaxis.get_majorticklabels(), rotation=45, ha='right')
+            
+            # Add trend line
+            if len(dates) > 1:
+                trend = slope * ordinals + intercept
+                ax5.plot(dates, trend, "--", 
+                        color='red', alpha=0.8, linewidth=2, label=f'Trend (slope: {slope:.2f} items/day)')
+                ax5.legend()
+        else:
+            # Text-only placeholder: no ticks or spines to lay out; clear() turns the axis back on
+            ax5.set_axis_off()
+            ax5.text(0.5, 0.5, '📈 Complete some items to view\nyour learning velocity!\n\nThis chart will show your progress over time', 
+                    ha='center', va='center', transform=ax5.transAxes,
+                    fontsize=11, style='italic', bbox=dict(boxstyle="round,pad=0.3", 
+                    facecolor='lightblue', alpha=0.3))
+            ax5.set_title('Learning Velocity - Cumulative Progress Over Time', fontsize=12, fontweight='bold', pad=20)
+        
+        fig.tight_layout()
+        fig.subplots_adjust(top=0.92)
+        
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=90)
+        return buffer.getvalue()
+    
+    def _compute_progress_statistics(self) -> Dict[str, Any]:
+        """
+        Tally subtopic statuses per phase and per priority in a single pass.
+        
+        Returns:
+            Dict[str, Any]: Overall status counts plus 'phase_stats' and
+            'priority_progress' in the shape used by the analytics dashboard
+        """
+        phase_names = list(self.roadmap)
+        phase_ids = {name: i for i, name in enumerate(phase_names)}
+        priorities = list(PRIORITY_COLORS)
+        priority_ids = {name: i for i, name in enumerate(priorities)}
+        
+        keys = self._progress_keys
+        n_items = len(keys)
+        progress = self.progress
+        topics = {phase_name: phase_data['topics'] for phase_name, phase_data in self.roadmap.items()}
+        
+        # Parallel per-item code arrays, then one compiled tally (or bincount
+        # without Numba) over (status, phase, priority) instead of per-item branching
+        status_idx = np.fromiter((STATUS_CODES.get(progress[key]['status'], OTHER_STATUS_CODE)
+                                  if key in progress else OTHER_STATUS_CODE for key in keys),
+                                 dtype=np.int8, count=n_items)
+        phase_idx = np.fromiter((phase_ids[key[0]] for key in keys), dtype=np.intp, count=n_items)
+        priority_idx = np.fromiter((priority_ids[topics[key[0]][key[1]]['priority']] for key in keys),
+                                   dtype=np.intp, count=n_items)
+        
+        # counts[status, phase, priority]
+        counts = _status_tally_kernel(status_idx, phase_idx, priority_idx,
+                                      OTHER_STATUS_CODE + 1, len(phase_names), len(priorities))
+        by_phase = counts.sum(axis=2)
+        by_priority = counts.sum(axis=1)
+        phase_totals = by_phase.sum(axis=0)
+        priority_totals = by_priority.sum(axis=0)
+        phase_rates = np.divide(by_phase[0] * 100.0, phase_totals,
+                                out=np.zeros(len(phase_names)), where=phase_totals > 0)
+        status_totals = by_phase.sum(axis=1)
+        
+        return {
+            'total_items': n_items,
+            'completed_items': int(status_totals[0]),
+            'in_progress_items': int(status_totals[1]),
+            'review_items': int(status_totals[2]),
+            'phase_stats': {
+                phase_name: {
+                    'total': int(phase_totals[i]),
+                    'completed': int(by_phase[0, i]),
+                    'in_progress': int(by_phase[1, i]),
+                    'review': int(by_phase[2, i]),
+                    'completion_rate': float(phase_rates[i])
+                }
+                for i, phase_name in enumerate(phase_names)
+            },
+            'priority_progress': {
+                priority: {'total': int(priority_totals[i]), 'completed': int(by_priority[0, i])}
+                for i, priority in enumerate(priorities)
+            }
+        }
+    
+    def _versioned_result(self, name: str, compute, limit: Optional[int] = None) -> list:
+        """
+        Return `compute()`, reusing the last result until the data changes.
         
-        refresh_btn.on_click(generate_analytics)
-        generate_analytics()  # Initial load
+        Results are keyed by _progress_version, today's date (some compare
+        against the current day) and the recent-activity check, whose 7-day
+        cutoff moves during the day.
         
-        return widgets.VBox([
-            widgets.HTML("""
-            <div style='text-align: center; padding: 15px; background: linear-gradient(135deg, #6a11cb, #2575fc); color: white; border-radius: 10px; margin-bottom: 15px;'>
-                <h2 style='margin: 0;'>📊 Learning Analytics Dashboard</h2>
-                <p style='margin: 5px 0 0 0; opacity: 0.9;'>Comprehensive insights into your learning journey</p>
-            </div>
-            """),
-            
-            widgets.HBox([
-                refresh_btn,
-                widgets.HTML("<div style='width: 20px;'></div>"),
-                widgets.HTML("<div style='color: #666; font-style: italic; padding: 8px 0;'>💡 Analytics update automatically when you track progress</div>")
-            ], layout=widgets.Layout(margin='0 0 15px 0')),
+        Args:
+            name (str): Cache slot name
+            compute (Callable[[], list]): Builds the result
+            limit (Optional[int]): Return at most this many leading items, defaults to all
             
-            analytics_output
-        ])
+        Returns:
+            list: A copy of the cached result, safe for the caller to modify
+        """
+        key = (self._progress_version, datetime.now().date(), self._check_recent_activity())
+        cached = self._result_cache.get(name)
+        if cached is None or cached[0] != key:
+            cached = (key, compute())
+            self._result_cache[name] = cached
+        return cached[1][:limit]
     
-    def _get_learning_recommendations(self) -> List[str]:
+    def _get_learning_recommendations(self, limit: Optional[int] = None) -> List[str]:
         """
         Generate intelligent learning recommendations based on current progress.
         
+        Args:
+            limit (Optional[int]): Maximum number of recommendations, defaults to all
+            
         Returns:
             List[str]: List of personalized recommendations
         """
+        return self._versioned_result('recommendations', self._compute_learning_recommendations, limit)
+    
+    def _compute_learning_recommendations(self) -> List[str]:
+        """Build the recommendations returned (and cached) by _get_learning_recommendations."""
         recommendations = []
         
         try:
-            # Check for critical items not started
-            critical_not_started = []
-            for phase_name, phase_data in self.roadmap.items():
-                for topic_name, topic_data in phase_data['topics'].items():
-                    if topic_data['priority'] == 'Critical':
-                        for subtopic in topic_data['subtopics']:
-                            progress_info = self.get_progress_info(phase_name, topic_name, subtopic)
-                            if progress_info['status'] == 'Not Started':
-                                critical_not_started.append((subtopic, topic_name, phase_name.split(':')[0]))
-            
-            if critical_not_started:
-                item = critical_not_started[0]
+            snapshot = self._snapshot_progress()
+            items = self._roadmap_items()
+            
+            # Only the first critical item not started is reported, so stop at the first hit
+            item = next(((subtopic, topic_name, self._phase_short[phase_name])
+                         for phase_name, topic_name, subtopic, priority in items
+                         if priority == 'Critical' and snapshot[(phase_name, topic_name, subtopic)] == 'Not Started'),
+                        None)
+            if item is not None:
                 recommendations.append(f"🔥 Priority: Start critical topic '{item[0]}' in {item[1]} ({item[2]})")
             
-            # Check for items in review status
-            review_items = []
-            for phase_name, phase_data in self.roadmap.items():
-                for topic_name, topic_data in phase_data['topics'].items():
-                    for subtopic in topic_data['subtopics']:
-                        progress_info = self.get_progress_info(phase_name, topic_name, subtopic)
-                        if progress_info['status'] == 'Review':
-                            review_items.append(subtopic)
+            # Three review items are listed; a fourth only decides whether to add '...'
+            review_items = list(islice((subtopic for phase_name, topic_name, subtopic, _ in items
+                                        if snapshot[(phase_name, topic_name, subtopic)] == 'Review'), 4))
             
             if review_items:
                 recommendations.append(f"📚 Complete reviews for: {', '.join(review_items[:3])}{'...' if len(review_items) > 3 else ''}")
             
             # Check for sequential phase progression
+            phase_progress = self._phase_progress(snapshot)
             phase_order = list(self.roadmap.keys())
             for i, phase_name in enumerate(phase_order[:-1]):
                 next_phase = phase_order[i + 1]
-                current_completion = self._calculate_phase_completion(phase_name)
-                next_phase_started = self._has_phase_started(next_phase)
+                current_completion = self._calculate_phase_completion(phase_name, phase_progress)
+                next_phase_started = self._has_phase_started(next_phase, phase_progress)
                 
                 if current_completion > 70 and not next_phase_started:
                     recommendations.append(f"🚀 Ready to advance: Consider starting '{next_phase.split(':')[0]}'")
                 elif current_completion < 30 and next_phase_started:
                     recommendations.append(f"⚠️ Focus needed: Complete more of '{phase_name.split(':')[0]}' before advancing")
             
-            # Check for incomplete high-priority items
-            high_priority_incomplete = []
-            for phase_name, phase_data in self.roadmap.items():
-                for topic_name, topic_data in phase_data['topics'].items():
-                    if topic_data['priority'] == 'High':
-                        incomplete_count = 0
-                        for subtopic in topic_data['subtopics']:
-                            progress_info = self.get_progress_info(phase_name, topic_name, subtopic)
-                            if progress_info['status'] not in ['Completed']:
-                                incomplete_count += 1
-                        if incomplete_count > 0:
-                            high_priority_incomplete.append((topic_name, incomplete_count, phase_name.split(':')[0]))
-            
-            if high_priority_incomplete:
-                topic_info = high_priority_incomplete[0]
-                recommendations.append(f"⭐ High priority: Complete {topic_info[1]} items in '{topic_info[0]}' ({topic_info[2]})")
+            # First high-priority topic with incomplete items; later topics are never counted
+            high_priority_counts = (
+                (topic_name, sum(snapshot[(phase_name, topic_name, subtopic)] != 'Completed'
+                                 for subtopic in topic_data['subtopics']), phase_name)
+                for phase_name, phase_data in self.roadmap.items()
+                for topic_name, topic_data in phase_data['topics'].items()
+                if topic_data['priority'] == 'High'
+            )
+            topic_info = next((counts for counts in high_priority_counts if counts[1] > 0), None)
+            if topic_info is not None:
+                recommendations.append(f"⭐ High priority: Complete {topic_info[1]} items in '{topic_info[0]}' ({self._phase_short[topic_info[2]]})")
             
             # Learning velocity recommendations
             recent_activity = self._check_recent_activity()
@@ -2059,14 +2695,12 @@ class RFLearningRoadmapSystem:
             # Milestone-based recommendations
             if self.milestones:
                 overdue_milestones = []
+                today = datetime.now().date()
                 for phase, info in self.milestones.items():
                     if info['status'] == 'Active':
-                        try:
-                            target_date = datetime.strptime(info['target_end_date'], '%Y-%m-%d').date()
-                            if target_date < datetime.now().date():
-                                overdue_milestones.append(phase.split(':')[0])
-                        except:
-                            pass
+                        dates = self._milestone_dates.get(phase)
+                        if dates and dates[1].date() < today:
+                            overdue_milestones.append(phase.split(':')[0])
                 
                 if overdue_milestones:
                     recommendations.append(f"⏰ Milestone alert: {overdue_milestones[0]} is overdue - consider updating timeline")
@@ -2137,27 +2771,92 @@ class RFLearningRoadmapSystem:
         Returns:
             bool: True if there was recent activity, False otherwise
         """
-        try:
-            cutoff_date = datetime.now() - timedelta(days=7)
-            
-            for progress_info in self.progress.values():
-                if progress_info['last_updated']:
-                    try:
-                        last_update = datetime.strptime(progress_info['last_updated'], '%Y-%m-%d %H:%M:%S')
-                        if last_update > cutoff_date:
-                            return True
-                    except:
-                        continue
-            return False
-        except:
-            return True  # Assume activity if we can't determine
+        # Any record newer than the cutoff implies the newest one is, so one comparison suffices
+        cutoff_date = datetime.now() - timedelta(days=7)
+        return self._last_activity is not None and self._last_activity > cutoff_date
+    
+    def _iter_roadmap(self):
+        """
+        Walk every subtopic in roadmap order with its phase and topic context.
+        
+        Topic and subtopic containers are looked up once per phase/topic rather
+        than once per row, so callers iterate one flat stream.
+        
+        Yields:
+            Tuple[str, dict, str, dict, int, str]: (phase_name, phase_data, topic_name,
+            topic_data, subtopic index within its topic, subtopic)
+        """
+        for phase_name, phase_data in self.roadmap.items():
+            for topic_name, topic_data in phase_data['topics'].items():
+                for index, subtopic in enumerate(topic_data['subtopics']):
+                    yield phase_name, phase_data, topic_name, topic_data, index, subtopic
+    
+    def _roadmap_items(self) -> List[Tuple[str, str, str, str]]:
+        """
+        Flat (phase, topic, subtopic, priority) rows in roadmap order.
+        
+        Built on first use and reset whenever topics or subtopics are added,
+        so whole-roadmap passes iterate one list instead of three nested dicts.
+        
+        Returns:
+            List[Tuple[str, str, str, str]]: One row per subtopic
+        """
+        if self._flat_items is None:
+            self._flat_items = [
+                (phase_name, topic_name, subtopic, topic_data['priority'])
+                for phase_name, _, topic_name, topic_data, _, subtopic in self._iter_roadmap()
+            ]
+        return self._flat_items
+    
+    def _snapshot_progress(self) -> Dict[Tuple[str, str, str], str]:
+        """
+        Collect the status of every roadmap item in a single pass.
+        
+        Passes that walk the whole roadmap several times (recommendations,
+        overview) share one snapshot instead of looking each item up again.
+        
+        Returns:
+            Dict[Tuple[str, str, str], str]: Status keyed by (phase, topic, subtopic)
+        """
+        progress = self.progress
+        snapshot = {}
+        for phase_name, topic_name, subtopic, _ in self._roadmap_items():
+            key = (phase_name, topic_name, subtopic)
+            progress_info = progress.get(key)
+            snapshot[key] = progress_info['status'] if progress_info is not None else 'Not Started'
+        return snapshot
+    
+    def _phase_progress(self, snapshot: Optional[Dict[Tuple[str, str, str], str]] = None
+                        ) -> Dict[str, Tuple[int, int, bool]]:
+        """
+        Tally every phase's completed and total items in one pass over a snapshot.
+        
+        Args:
+            snapshot (Optional[Dict]): Statuses from _snapshot_progress; taken fresh if omitted
+            
+        Returns:
+            Dict[str, Tuple[int, int, bool]]: (completed, total, any item started) per phase
+        """
+        if snapshot is None:
+            snapshot = self._snapshot_progress()
+        counts = {phase_name: [0, 0, False] for phase_name in self.roadmap}
+        for (phase_name, _, _), status in snapshot.items():
+            phase_counts = counts[phase_name]
+            phase_counts[1] += 1
+            if status == 'Completed':
+                phase_counts[0] += 1
+            if status != 'Not Started':
+                phase_counts[2] = True
+        return {phase_name: tuple(phase_counts) for phase_name, phase_counts in counts.items()}
     
-    def _calculate_phase_completion(self, phase_name: str) -> float:
+    def _calculate_phase_completion(self, phase_name: str,
+                                    phase_progress: Optional[Dict[str, Tuple[int, int, bool]]] = None) -> float:
         """
         Calculate completion percentage for a specific phase.
         
         Args:
             phase_name (str): Name of the phase
+            phase_progress (Optional[Dict]): Tallies from _phase_progress; computed fresh if omitted
             
         Returns:
             float: Completion percentage (0-100)
@@ -2166,27 +2865,22 @@ class RFLearningRoadmapSystem:
             return 0.0
         
         try:
-            total_items = 0
-            completed_items = 0
-            
-            for topic_data in self.roadmap[phase_name]['topics'].values():
-                for subtopic in topic_data['subtopics']:
-                    total_items += 1
-                    progress_info = self.get_progress_info(phase_name, "", subtopic)
-                    if progress_info['status'] == 'Completed':
-                        completed_items += 1
-            
+            if phase_progress is None:
+                phase_progress = self._phase_progress()
+            completed_items, total_items, _ = phase_progress[phase_name]
             return (completed_items / total_items * 100) if total_items > 0 else 0.0
         except Exception as e:
             logger.error(f"Error calculating phase completion: {e}")
             return 0.0
     
-    def _has_phase_started(self, phase_name: str) -> bool:
+    def _has_phase_started(self, phase_name: str,
+                           phase_progress: Optional[Dict[str, Tuple[int, int, bool]]] = None) -> bool:
         """
         Check if any item in a phase has been started.
         
         Args:
             phase_name (str): Name of the phase
+            phase_progress (Optional[Dict]): Tallies from _phase_progress; computed fresh if omitted
             
         Returns:
             bool: True if phase has been started, False otherwise
@@ -2195,16 +2889,45 @@ class RFLearningRoadmapSystem:
             return False
         
         try:
-            for topic_data in self.roadmap[phase_name]['topics'].values():
-                for subtopic in topic_data['subtopics']:
-                    progress_info = self.get_progress_info(phase_name, "", subtopic)
-                    if progress_info['status'] != 'Not Started':
-                        return True
-            return False
+            if phase_progress is None:
+                phase_progress = self._phase_progress()
+            return phase_progress[phase_name][2]
         except Exception as e:
             logger.error(f"Error checking if phase started: {e}")
             return False
     
+    @functools.cached_property
+    def _strategy_html(self) -> str:
+        """
+        Render the strategic learning framework shown under the roadmap overview.
+        
+        The block only depends on the phase colors, so it is built once per
+        instance instead of on every overview render.
+        
+        Returns:
+            str: Strategy section HTML
+        """
+        parts = [
+            "<div style='background: linear-gradient(135deg, #f8f9fa, #e9ecef); border: 3px solid #28a745; border-radius: 15px; padding: 25px; margin: 25px 0; box-shadow: 0 8px 32px rgba(0,0,0,0.1);'>",
+            "<h2 style='color: #28a745; text-align: center; margin-bottom: 25px; font-size: 2em;'>📋 Strategic Learning Framework</h2>",
+            "<div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 20px; margin: 25px 0;'>"
+        ]
+        for phase_type, icon, points in STRATEGY_PHASE_CARDS:
+            items = "".join(f"<li><strong>{label}:</strong> {text}</li>" for label, text in points)
+            parts.append(STRATEGY_PHASE_CARD_HTML.format(color=self.phase_colors[phase_type], icon=icon,
+                                                         phase_type=phase_type, items=items))
+        parts.append("</div>")
+        
+        parts.append(
+            "<div style='background: linear-gradient(135deg, #e3f2fd, #bbdefb); border-radius: 12px; padding: 20px; margin-top: 25px;'>"
+            "<h4 style='color: #1976d2; text-align: center; margin-bottom: 15px;'>💡 Success Strategy Framework</h4>"
+            "<div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px;'>"
+        )
+        parts.extend(STRATEGY_HABIT_HTML.format(icon=icon, title=title, detail=detail)
+                     for icon, title, detail in STRATEGY_HABITS)
+        parts.append("</div></div></div>")
+        return "".join(parts)
+    
     def create_roadmap_overview(self) -> widgets.Widget:
         """
         Create a comprehensive and visually appealing roadmap overview.
@@ -2248,14 +2971,30 @@ class RFLearningRoadmapSystem:
         """
         
         # Create detailed roadmap display with enhanced styling
-        roadmap_content = ""
+        parts = []
+        snapshot = self._snapshot_progress()
+        render_subtopic = ROADMAP_SUBTOPIC_HTML.format
+        
+        # Completed items for every topic at once: per-row topic and status codes,
+        # then one bincount instead of a Python comparison per subtopic
+        items = self._roadmap_items()
+        topic_ids = {}
+        topic_idx = np.fromiter((topic_ids.setdefault((phase_name, topic_name), len(topic_ids))
+                                 for phase_name, topic_name, _, _ in items), dtype=np.intp, count=len(items))
+        status_idx = np.fromiter((STATUS_CODES.get(snapshot[row[:3]], OTHER_STATUS_CODE) for row in items),
+                                 dtype=np.int8, count=len(items))
+        completed_per_topic = np.bincount(topic_idx[status_idx == STATUS_CODES['Completed']], minlength=len(topic_ids))
+        completed_by_topic = dict(zip(topic_ids, completed_per_topic.tolist()))
         
         for i, (phase_name, phase_data) in enumerate(self.roadmap.items(), 1):
             color = self.phase_colors.get(phase_data['phase'], '#6c757d')
-            phase_short = phase_name.split(':')[0] if ':' in phase_name else phase_name
+            phase_short = self._phase_short[phase_name]
             
-            # Calculate phase progress
-            phase_completion = self._calculate_phase_completion(phase_name)
+            # The phase total is the sum of its topics' counts; topics without subtopics have none
+            topic_completed_counts = [completed_by_topic.get((phase_name, topic_name), 0)
+                                      for topic_name in phase_data['topics']]
+            phase_total = sum(len(topic_data['subtopics']) for topic_data in phase_data['topics'].values())
+            phase_completion = (sum(topic_completed_counts) / phase_total * 100) if phase_total > 0 else 0.0
             progress_bar = f"""
             <div style='width: 100%; background: rgba(255,255,255,0.3); border-radius: 10px; margin: 10px 0; height: 8px;'>
                 <div style='width: {phase_completion}%; background: rgba(255,255,255,0.8); height: 8px; border-radius: 10px; transition: width 0.3s;'></div>
@@ -2263,7 +3002,7 @@ class RFLearningRoadmapSystem:
             <div style='text-align: right; font-size: 0.9em; margin-top: 5px; opacity: 0.9;'>Progress: {phase_completion:.1f}%</div>
             """
             
-            roadmap_content += f"""
+            parts.append(f"""
             <div style='border: 3px solid {color}; border-radius: 15px; padding: 25px; margin: 20px 0; 
                         background: linear-gradient(135deg, rgba(255,255,255,0.95), rgba(248,249,250,0.95)); 
                         box-shadow: 0 8px 32px rgba(0,0,0,0.1); transition: transform 0.3s;'
@@ -2281,23 +3020,18 @@ class RFLearningRoadmapSystem:
                 {progress_bar}
                 
                 <div style='margin-top: 25px;'>
-            """
+            """)
             
             for j, (topic_name, topic_data) in enumerate(phase_data['topics'].items(), 1):
-                priority_colors = {'Critical': '#dc3545', 'High': '#fd7e14', 'Medium': '#ffc107', 'Low': '#28a745'}
-                priority_color = priority_colors.get(topic_data['priority'], '#6c757d')
+                priority_color = PRIORITY_COLORS.get(topic_data['priority'], '#6c757d')
                 
-                # Calculate topic progress
-                topic_completed = 0
+                # Topic progress
+                topic_completed = topic_completed_counts[j - 1]
                 topic_total = len(topic_data['subtopics'])
-                for subtopic in topic_data['subtopics']:
-                    progress_info = self.get_progress_info(phase_name, topic_name, subtopic)
-                    if progress_info['status'] == 'Completed':
-                        topic_completed += 1
                 
                 topic_progress = (topic_completed / topic_total * 100) if topic_total > 0 else 0
                 
-                roadmap_content += f"""
+                parts.append(f"""
                     <div style='border-left: 5px solid {priority_color}; padding-left: 20px; margin: 20px 0; 
                                 background: rgba(255,255,255,0.7); border-radius: 0 10px 10px 0; padding: 15px 15px 15px 20px;'>
                         
@@ -2321,141 +3055,27 @@ class RFLearningRoadmapSystem:
                         </div>
                         
                         <div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 10px; margin-top: 15px;'>
-                """
+                """)
                 
                 for k, subtopic in enumerate(topic_data['subtopics'], 1):
-                    progress_info = self.get_progress_info(phase_name, topic_name, subtopic)
-                    status = progress_info['status']
+                    status = snapshot[(phase_name, topic_name, subtopic)]
                     
-                    status_colors = {
-                        'Completed': '#28a745',
-                        'In Progress': '#ffc107', 
-                        'Review': '#17a2b8',
-                        'Not Started': '#e9ecef',
-                        'Skipped': '#6c757d'
-                    }
-                    status_color = status_colors.get(status, '#e9ecef')
+                    status_color = SUBTOPIC_STATUS_COLORS.get(status, '#e9ecef')
                     text_color = 'white' if status != 'Not Started' else '#333'
                     
-                    roadmap_content += f"""
-                        <div style='background: {status_color}; color: {text_color}; padding: 8px 12px; border-radius: 8px; 
-                                   font-size: 0.9em; display: flex; justify-content: space-between; align-items: center; 
-                                   transition: transform 0.2s;' 
-                             onmouseover='this.style.transform="scale(1.02)"' 
-                             onmouseout='this.style.transform="scale(1)"'>
-                            <span>{k}. {subtopic}</span>
-                            <span style='font-size: 0.8em; opacity: 0.8;'>{status}</span>
-                        </div>
-                    """
-                
-                roadmap_content += "</div></div>"
-            
-            roadmap_content += "</div></div>"
-        
-        # Enhanced learning strategy section
-        strategy_html = f"""
-        <div style='background: linear-gradient(135deg, #f8f9fa, #e9ecef); border: 3px solid #28a745; border-radius: 15px; padding: 25px; margin: 25px 0; box-shadow: 0 8px 32px rgba(0,0,0,0.1);'>
-            <h2 style='color: #28a745; text-align: center; margin-bottom: 25px; font-size: 2em;'>📋 Strategic Learning Framework</h2>
-            
-            <div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 20px; margin: 25px 0;'>
-                <div style='background: white; padding: 20px; border-radius: 12px; box-shadow: 0 4px 16px rgba(0,0,0,0.1); border-left: 5px solid {self.phase_colors["Foundation"]};'>
-                    <h3 style='color: {self.phase_colors["Foundation"]}; text-align: center; margin-bottom: 15px;'>🏗️ Foundation Phase</h3>
-                    <ul style='color: #555; line-height: 1.6;'>
-                        <li><strong>Focus:</strong> Mathematical & circuit fundamentals</li>
-                        <li><strong>Goal:</strong> Solid theoretical foundation</li>
-                        <li><strong>Key Skills:</strong> Complex analysis, network theory</li>
-                        <li><strong>Outcome:</strong> Ready for analog IC design</li>
-                    </ul>
-                </div>
-                
-                <div style='background: white; padding: 20px; border-radius: 12px; box-shadow: 0 4px 16px rgba(0,0,0,0.1); border-left: 5px solid {self.phase_colors["Short-term"]};'>
-                    <h3 style='color: {self.phase_colors["Short-term"]}; text-align: center; margin-bottom: 15px;'>🚀 Short-term Phase</h3>
-                    <ul style='color: #555; line-height: 1.6;'>
-                        <li><strong>Focus:</strong> Analog IC design mastery</li>
-                        <li><strong>Goal:</strong> Design operational amplifiers</li>
-                        <li><strong>Key Skills:</strong> OpAmp design, data converters</li>
-                        <li><strong>Outcome:</strong> Competent analog designer</li>
-                    </ul>
-                </div>
+                    parts.append(render_subtopic(status_color=status_color, text_color=text_color,
+                                                 index=k, subtopic=subtopic, status=status))
                 
-                <div style='background: white; padding: 20px; border-radius: 12px; box-shadow: 0 4px 16px rgba(0,0,0,0.1); border-left: 5px solid {self.phase_colors["Mid-term"]};'>
-                    <h3 style='color: {self.phase_colors["Mid-term"]}; text-align: center; margin-bottom: 15px;'>⚡ Mid-term Phase</h3>
-                    <ul style='color: #555; line-height: 1.6;'>
-                        <li><strong>Focus:</strong> Advanced microwave & high-speed</li>
-                        <li><strong>Goal:</strong> SerDes and microwave expertise</li>
-                        <li><strong>Key Skills:</strong> EM simulation, signal integrity</li>
-                        <li><strong>Outcome:</strong> High-speed design capability</li>
-                    </ul>
-                </div>
-                
-                <div style='background: white; padding: 20px; border-radius: 12px; box-shadow: 0 4px 16px rgba(0,0,0,0.1); border-left: 5px solid {self.phase_colors["Long-term"]};'>
-                    <h3 style='color: {self.phase_colors["Long-term"]}; text-align: center; margin-bottom: 15px;'>🏆 Long-term Phase</h3>
-                    <ul style='color: #555; line-height: 1.6;'>
-                        <li><strong>Focus:</strong> RF IC design mastery</li>
-                        <li><strong>Goal:</strong> Complete RF transceiver design</li>
-                        <li><strong>Key Skills:</strong> LNA, VCO, mixer design</li>
-                        <li><strong>Outcome:</strong> RF system architect</li>
-                    </ul>
-                </div>
-                
-                <div style='background: white; padding: 20px; border-radius: 12px; box-shadow: 0 4px 16px rgba(0,0,0,0.1); border-left: 5px solid {self.phase_colors["Advanced"]};'>
-                    <h3 style='color: {self.phase_colors["Advanced"]}; text-align: center; margin-bottom: 15px;'>🌟 Advanced Phase</h3>
-                    <ul style='color: #555; line-height: 1.6;'>
-                        <li><strong>Focus:</strong> Cutting-edge applications</li>
-                        <li><strong>Goal:</strong> Industry leadership</li>
-                        <li><strong>Key Skills:</strong> mmWave, 5G, automotive radar</li>
-                        <li><strong>Outcome:</strong> Technology innovator</li>
-                    </ul>
-                </div>
-            </div>
+                parts.append("</div></div>")
             
-            <div style='background: linear-gradient(135deg, #e3f2fd, #bbdefb); border-radius: 12px; padding: 20px; margin-top: 25px;'>
-                <h4 style='color: #1976d2; text-align: center; margin-bottom: 15px;'>💡 Success Strategy Framework</h4>
-                
-                <div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px;'>
-                    <div style='text-align: center;'>
-                        <div style='background: #1976d2; color: white; width: 50px; height: 50px; border-radius: 50%; 
-                                   display: flex; align-items: center; justify-content: center; margin: 0 auto 10px; font-size: 1.5em;'>📚</div>
-                        <h5 style='margin: 0 0 5px 0; color: #1976d2;'>Consistent Study</h5>
-                        <p style='margin: 0; color: #666; font-size: 0.9em;'>10-15 hours/week</p>
-                    </div>
-                    
-                    <div style='text-align: center;'>
-                        <div style='background: #1976d2; color: white; width: 50px; height: 50px; border-radius: 50%; 
-                                   display: flex; align-items: center; justify-content: center; margin: 0 auto 10px; font-size: 1.5em;'>🛠️</div>
-                        <h5 style='margin: 0 0 5px 0; color: #1976d2;'>Hands-on Practice</h5>
-                        <p style='margin: 0; color: #666; font-size: 0.9em;'>Design & simulate</p>
-                    </div>
-                    
-                    <div style='text-align: center;'>
-                        <div style='background: #1976d2; color: white; width: 50px; height: 50px; border-radius: 50%; 
-                                   display: flex; align-items: center; justify-content: center; margin: 0 auto 10px; font-size: 1.5em;'>🔄</div>
-                        <h5 style='margin: 0 0 5px 0; color: #1976d2;'>Regular Review</h5>
-                        <p style='margin: 0; color: #666; font-size: 0.9em;'>Reinforce learning</p>
-                    </div>
-                    
-                    <div style='text-align: center;'>
-                        <div style='background: #1976d2; color: white; width: 50px; height: 50px; border-radius: 50%; 
-                                   display: flex; align-items: center; justify-content: center; margin: 0 auto 10px; font-size: 1.5em;'>👥</div>
-                        <h5 style='margin: 0 0 5px 0; color: #1976d2;'>Community</h5>
-                        <p style='margin: 0; color: #666; font-size: 0.9em;'>Join forums & groups</p>
-                    </div>
-                    
-                    <div style='text-align: center;'>
-                        <div style='background: #1976d2; color: white; width: 50px; height: 50px; border-radius: 50%; 
-                                   display: flex; align-items: center; justify-content: center; margin: 0 auto 10px; font-size: 1.5em;'>📊</div>
-                        <h5 style='margin: 0 0 5px 0; color: #1976d2;'>Track Progress</h5>
-                        <p style='margin: 0; color: #666; font-size: 0.9em;'>Monitor & adjust</p>
-                    </div>
-                </div>
-            </div>
-        </div>
-        """
+            parts.append("</div></div>")
+        
+        roadmap_content = "".join(parts)
         
         return widgets.VBox([
             widgets.HTML(overview_html),
             widgets.HTML(roadmap_content),
-            widgets.HTML(strategy_html)
+            widgets.HTML(self._strategy_html)
         ])
     
     def create_export_system(self) -> widgets.Widget:
@@ -2465,6 +3085,13 @@ class RFLearningRoadmapSystem:
         Returns:
             widgets.Widget: Complete export system interface
         """
+        if self._export_system_widget is not None:
+            return self._export_system_widget
+        
+        # The CSV exporters import pandas on first use; start that import now, off the
+        # UI thread, so the first export click doesn't wait for it
+        _PRELOAD_EXECUTOR.submit(importlib.import_module, 'pandas')
+        
         export_options = widgets.SelectMultiple(
             options=[
                 'Progress Report', 
@@ -2481,7 +3108,7 @@ class RFLearningRoadmapSystem:
         )
         
         export_format = widgets.Dropdown(
-            options=['CSV', 'JSON', 'HTML Report'],
+            options=['CSV', 'JSON', 'HTML Report', 'All Formats'],
             value='CSV',
             description='Format:',
             layout=widgets.Layout(width='200px'),
@@ -2497,64 +3124,78 @@ class RFLearningRoadmapSystem:
         
         export_output = widgets.Output()
         
+        # Format -> (file extension, exporter); 'All Formats' runs every entry
+        exporters = {
+            'CSV': ('csv', self._export_csv_format),
+            'JSON': ('json', self._export_json_format),
+            'HTML Report': ('html', self._export_html_report),
+        }
+        
         def generate_export(b):
             """Generate comprehensive exports with multiple format support."""
+            if not export_options.value:
+                with export_output:
+                    clear_output(wait=True)
+                    print("⚠️ Please select at least one item to export.")
+                return
+            
+            # Report lines are collected and printed once, so the Output widget
+            # receives one stream message per click instead of one per file
+            out_lines = []
             with export_output:
                 clear_output(wait=True)
                 
                 try:
                     # Update button state
-                    export_btn.description = '📥 Exporting...'
-                    export_btn.disabled = True
+                    with hold_sync(export_btn):
+                        export_btn.description = '📥 Exporting...'
+                        export_btn.disabled = True
                     
                     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                     export_count = 0
+                    if export_format.value == 'All Formats':
+                        formats = list(exporters.values())
+                    else:
+                        formats = [exporters.get(export_format.value, exporters['CSV'])]
                     
+                    # One export type at a time across all requested formats; derived data
+                    # such as recommendations comes from the progress-version cache, so it is
+                    # built once per click rather than once per file
                     for export_type in export_options.value:
-                        try:
-                            if export_format.value == 'HTML Report':
-                                filename = f"rf_learning_{export_type.lower().replace(' ', '_')}_{timestamp}.html"
-                                success = self._export_html_report(export_type, filename)
-                            elif export_format.value == 'JSON':
-                                filename = f"rf_learning_{export_type.lower().replace(' ', '_')}_{timestamp}.json"
-                                success = self._export_json_format(export_type, filename)
-                            else:  # CSV
-                                filename = f"rf_learning_{export_type.lower().replace(' ', '_')}_{timestamp}.csv"
-                                success = self._export_csv_format(export_type, filename)
-                            
-                            if success:
-                                print(f"✅ Exported: {filename}")
-                                export_count += 1
-                            else:
-                                print(f"⚠️ Warning: {export_type} - No data to export")
-                                
-                        except Exception as e:
-                            print(f"❌ Error exporting {export_type}: {e}")
-                            logger.error(f"Export error for {export_type}: {e}")
+                        basename = f"rf_learning_{export_type.lower().replace(' ', '_')}_{timestamp}"
+                        for extension, exporter in formats:
+                            try:
+                                filename = f"{basename}.{extension}"
+                                if exporter(export_type, filename):
+                                    out_lines.append(f"✅ Exported: {filename}")
+                                    export_count += 1
+                                else:
+                                    out_lines.append(f"⚠️ Warning: {export_type} - No data to export")
+                                    
+                            except Exception as e:
+                                out_lines.append(f"❌ Error exporting {export_type}: {e}")
+                                logger.error(f"Export error for {export_type}: {e}")
                     
                     if export_count > 0:
-                        print(f"\n🎉 Successfully exported {export_count} file(s)!")
-                        print("📁 Files saved to current directory")
+                        out_lines.append(f"\n🎉 Successfully exported {export_count} file(s)!")
+                        out_lines.append("📁 Files saved to current directory")
                     else:
-                        print("⚠️ No files were exported. Please check your data and try again.")
+                        out_lines.append("⚠️ No files were exported. Please check your data and try again.")
                         
                 except Exception as e:
-                    print(f"❌ Export system error: {e}")
+                    out_lines.append(f"❌ Export system error: {e}")
                     logger.error(f"Export system error: {e}")
                 finally:
+                    print("\n".join(out_lines))
                     # Restore button state
-                    export_btn.description = '📥 Generate Export'
-                    export_btn.disabled = False
+                    with hold_sync(export_btn):
+                        export_btn.description = '📥 Generate Export'
+                        export_btn.disabled = False
         
         export_btn.on_click(generate_export)
         
-        return widgets.VBox([
-            widgets.HTML("""
-            <div style='text-align: center; padding: 15px; background: linear-gradient(135deg, #17a2b8, #138496); color: white; border-radius: 10px; margin-bottom: 15px;'>
-                <h2 style='margin: 0;'>📥 Export System</h2>
-                <p style='margin: 5px 0 0 0; opacity: 0.9;'>Export your learning data for backup and analysis</p>
-            </div>
-            """),
+        self._export_system_widget = widgets.VBox([
+            _static_html_widget(EXPORT_HEADER_HTML),
             
             widgets.VBox([
                 widgets.HTML("<h3 style='color: #17a2b8; margin-bottom: 15px;'>📋 Export Configuration</h3>"),
@@ -2575,19 +3216,7 @@ class RFLearningRoadmapSystem:
                 
                 widgets.HTML("<div style='height: 20px;'></div>"),
                 
-                widgets.HTML("""
-                <div style='background: #e8f4f8; padding: 15px; border-radius: 8px; margin-top: 15px;'>
-                    <h4 style='color: #17a2b8; margin: 0 0 10px 0;'>💡 Export Options Guide:</h4>
-                    <ul style='margin: 0; color: #555; line-height: 1.5;'>
-                        <li><strong>Progress Report:</strong> Complete progress tracking data with status and notes</li>
-                        <li><strong>Milestone Timeline:</strong> All milestone dates and status information</li>
-                        <li><strong>Detailed Roadmap:</strong> Full roadmap structure with priorities and durations</li>
-                        <li><strong>Learning Notes:</strong> All your personal learning notes and insights</li>
-                        <li><strong>Analytics Summary:</strong> Statistical summary of your learning progress</li>
-                        <li><strong>Study Plan:</strong> Personalized study recommendations and next steps</li>
-                    </ul>
-                </div>
-                """),
+                _static_html_widget(EXPORT_GUIDE_HTML),
                 
                 export_output
             ], layout=widgets.Layout(
@@ -2598,6 +3227,7 @@ class RFLearningRoadmapSystem:
                 background_color='#e8f4f8'
             ))
         ])
+        return self._export_system_widget
     
     def _export_csv_format(self, export_type: str, filename: str) -> bool:
         """
@@ -2656,8 +3286,7 @@ class RFLearningRoadmapSystem:
                 data = self._get_study_plan_dict()
             
             if data:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+                Path(filename).write_bytes(_json_dumps(data, indent=True))
                 return True
             return False
         except Exception as e:
@@ -2676,41 +3305,38 @@ class RFLearningRoadmapSystem:
             bool: True if successful, False otherwise
         """
         try:
-            html_content = self._generate_html_report(export_type)
-            if html_content:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                return True
-            return False
+            self._write_html_report(filename, export_type)
+            return True
         except Exception as e:
             logger.error(f"HTML export error: {e}")
             return False
     
+    def _iter_progress_rows(self):
+        """Yield one progress report row per roadmap subtopic."""
+        # Direct lookups with one shared default instead of a get_progress_info call per item
+        progress = self.progress
+        default_info = self._default_progress_info()
+        for phase_name, _, topic_name, topic_data, _, subtopic in self._iter_roadmap():
+            progress_info = progress.get((phase_name, topic_name, subtopic), default_info)
+            yield {
+                'Phase': phase_name,
+                'Topic': topic_name,
+                'Subtopic': subtopic,
+                'Priority': topic_data['priority'],
+                'Estimated_Weeks': topic_data['weeks'],
+                'Status': progress_info['status'],
+                'Completion_Percent': progress_info['completion'],
+                'Notes': progress_info['notes'],
+                'Last_Updated': progress_info['last_updated']
+            }
+    
     def _export_progress_report_csv(self, filename: str) -> bool:
         """Export detailed progress report to CSV."""
         try:
-            rows = []
-            for phase_name, phase_data in self.roadmap.items():
-                for topic_name, topic_data in phase_data['topics'].items():
-                    for subtopic in topic_data['subtopics']:
-                        progress_info = self.get_progress_info(phase_name, topic_name, subtopic)
-                        rows.append({
-                            'Phase': phase_name,
-                            'Topic': topic_name,
-                            'Subtopic': subtopic,
-                            'Priority': topic_data['priority'],
-                            'Estimated_Weeks': topic_data['weeks'],
-                            'Status': progress_info['status'],
-                            'Completion_Percent': progress_info['completion'],
-                            'Notes': progress_info['notes'],
-                            'Last_Updated': progress_info['last_updated']
-                        })
-            
-            if rows:
-                df = pd.DataFrame(rows)
-                df.to_csv(filename, index=False, encoding='utf-8')
-                return True
-            return False
+            return _write_csv_rows(filename, [
+                'Phase', 'Topic', 'Subtopic', 'Priority', 'Estimated_Weeks',
+                'Status', 'Completion_Percent', 'Notes', 'Last_Updated'
+            ], self._iter_progress_rows())
         except Exception as e:
             logger.error(f"Progress report CSV export error: {e}")
             return False
@@ -2721,73 +3347,84 @@ class RFLearningRoadmapSystem:
             if not self.milestones:
                 return False
             
-            rows = []
-            for phase, info in self.milestones.items():
-                rows.append({
-                    'Phase': phase,
-                    'Start_Date': info['start_date'],
-                    'Target_End_Date': info['target_end_date'],
-                    'Actual_End_Date': info.get('actual_end_date', ''),
-                    'Status': info['status'],
-                    'Duration_Days': (pd.to_datetime(info['target_end_date']) - 
-                                    pd.to_datetime(info['start_date'])).days
-                })
-            
-            df = pd.DataFrame(rows)
+            import pandas as pd
+            
+            df = pd.DataFrame([{
+                'Phase': phase,
+                'Start_Date': info['start_date'],
+                'Target_End_Date': info['target_end_date'],
+                'Actual_End_Date': info.get('actual_end_date', ''),
+                'Status': info['status']
+            } for phase, info in self.milestones.items()])
+            # Parse both date columns in one batch each and subtract them as arrays
+            df['Duration_Days'] = (pd.to_datetime(df['Target_End_Date']) -
+                                   pd.to_datetime(df['Start_Date'])).dt.days
             df.to_csv(filename, index=False, encoding='utf-8')
             return True
         except Exception as e:
             logger.error(f"Milestone timeline CSV export error: {e}")
             return False
     
+    def _iter_roadmap_rows(self):
+        """Yield one detailed roadmap row per subtopic, in roadmap order."""
+        for phase_name, phase_data, topic_name, topic_data, i, subtopic in self._iter_roadmap():
+            yield {
+                'Phase': phase_name,
+                'Phase_Type': phase_data['phase'],
+                'Phase_Duration_Weeks': phase_data['duration_weeks'],
+                'Phase_Description': phase_data['description'],
+                'Topic': topic_name,
+                'Topic_Weeks': topic_data['weeks'],
+                'Topic_Priority': topic_data['priority'],
+                'Subtopic_Order': i + 1,
+                'Subtopic': subtopic
+            }
+    
     def _export_detailed_roadmap_csv(self, filename: str) -> bool:
         """Export complete roadmap structure to CSV."""
         try:
-            rows = []
-            for phase_name, phase_data in self.roadmap.items():
-                for topic_name, topic_data in phase_data['topics'].items():
-                    for i, subtopic in enumerate(topic_data['subtopics']):
-                        rows.append({
-                            'Phase': phase_name,
-                            'Phase_Type': phase_data['phase'],
-                            'Phase_Duration_Weeks': phase_data['duration_weeks'],
-                            'Phase_Description': phase_data['description'],
-                            'Topic': topic_name,
-                            'Topic_Weeks': topic_data['weeks'],
-                            'Topic_Priority': topic_data['priority'],
-                            'Subtopic_Order': i + 1,
-                            'Subtopic': subtopic
-                        })
-            
-            df = pd.DataFrame(rows)
-            df.to_csv(filename, index=False, encoding='utf-8')
-            return True
+            return _write_csv_rows(filename, [
+                'Phase', 'Phase_Type', 'Phase_Duration_Weeks', 'Phase_Description', 'Topic',
+                'Topic_Weeks', 'Topic_Priority', 'Subtopic_Order', 'Subtopic'
+            ], self._iter_roadmap_rows())
         except Exception as e:
             logger.error(f"Detailed roadmap CSV export error: {e}")
             return False
     
+    def _noted_progress_items(self) -> List[Tuple[Tuple[str, str, str], Dict[str, Any]]]:
+        """
+        Progress entries whose notes are not blank, in progress order.
+        
+        Shared by the notes CSV, JSON and HTML exports and cached against
+        _progress_version, so the notes are stripped once per change.
+        
+        Returns:
+            List[Tuple[Tuple[str, str, str], Dict[str, Any]]]: (key, progress info) pairs
+        """
+        return self._versioned_result('noted_items', lambda: [
+            (key, progress_info) for key, progress_info in self.progress.items()
+            if progress_info['notes'].strip()
+        ])
+    
+    def _iter_notes_rows(self):
+        """Yield one learning notes row per progress entry with non-blank notes."""
+        for (phase, topic, subtopic), progress_info in self._noted_progress_items():
+            yield {
+                'Phase': phase,
+                'Topic': topic,
+                'Subtopic': subtopic,
+                'Status': progress_info['status'],
+                'Completion_Percent': progress_info['completion'],
+                'Notes': progress_info['notes'],
+                'Last_Updated': progress_info['last_updated']
+            }
+    
     def _export_learning_notes_csv(self, filename: str) -> bool:
         """Export all learning notes to CSV."""
         try:
-            rows = []
-            for key, progress_info in self.progress.items():
-                if progress_info['notes'].strip():
-                    phase, topic, subtopic = key.split('|', 2)
-                    rows.append({
-                        'Phase': phase,
-                        'Topic': topic,
-                        'Subtopic': subtopic,
-                        'Status': progress_info['status'],
-                        'Completion_Percent': progress_info['completion'],
-                        'Notes': progress_info['notes'],
-                        'Last_Updated': progress_info['last_updated']
-                    })
-            
-            if rows:
-                df = pd.DataFrame(rows)
-                df.to_csv(filename, index=False, encoding='utf-8')
-                return True
-            return False
+            return _write_csv_rows(filename, [
+                'Phase', 'Topic', 'Subtopic', 'Status', 'Completion_Percent', 'Notes', 'Last_Updated'
+            ], self._iter_notes_rows())
         except Exception as e:
             logger.error(f"Learning notes CSV export error: {e}")
             return False
@@ -2795,31 +3432,26 @@ class RFLearningRoadmapSystem:
     def _export_analytics_summary_csv(self, filename: str) -> bool:
         """Export analytics summary to CSV."""
         try:
-            # Calculate phase statistics
+            # Per-phase counts come from the same bincount tally the analytics dashboard uses
+            phase_counts = self._compute_progress_statistics()['phase_stats']
             phase_stats = []
             for phase_name, phase_data in self.roadmap.items():
-                total_items = sum(len(topic_data['subtopics']) for topic_data in phase_data['topics'].values())
-                completed_items = 0
-                in_progress_items = 0
-                
-                for topic_data in phase_data['topics'].values():
-                    for subtopic in topic_data['subtopics']:
-                        progress_info = self.get_progress_info(phase_name, "", subtopic)
-                        if progress_info['status'] == 'Completed':
-                            completed_items += 1
-                        elif progress_info['status'] in ['In Progress', 'Review']:
-                            in_progress_items += 1
-                
+                counts = phase_counts[phase_name]
                 phase_stats.append({
                     'Phase': phase_name,
-                    'Total_Items': total_items,
-                    'Completed_Items': completed_items,
-                    'In_Progress_Items': in_progress_items,
-                    'Completion_Rate': (completed_items / total_items * 100) if total_items > 0 else 0,
+                    'Total_Items': counts['total'],
+                    'Completed_Items': counts['completed'],
+                    'In_Progress_Items': counts['in_progress'] + counts['review'],
+                    'Completion_Rate': counts['completion_rate'],
                     'Phase_Type': phase_data['phase'],
                     'Duration_Weeks': phase_data['duration_weeks']
                 })
             
+            if not phase_stats:
+                return False
+            
+            import pandas as pd
+            
             df = pd.DataFrame(phase_stats)
             df.to_csv(filename, index=False, encoding='utf-8')
             return True
@@ -2831,6 +3463,8 @@ class RFLearningRoadmapSystem:
         """Export personalized study plan to CSV."""
         try:
             recommendations = self._get_learning_recommendations()
+            # One generation stamp shared by every row
+            generated_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             
             rows = []
             for i, recommendation in enumerate(recommendations, 1):
@@ -2838,7 +3472,7 @@ class RFLearningRoadmapSystem:
                     'Priority': i,
                     'Recommendation': recommendation,
                     'Category': self._categorize_recommendation(recommendation),
-                    'Generated_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    'Generated_Date': generated_date
                 })
             
             # Add upcoming items based on progress
@@ -2848,10 +3482,12 @@ class RFLearningRoadmapSystem:
                     'Priority': len(rows) + 1,
                     'Recommendation': f"Upcoming: {item['subtopic']} ({item['topic']})",
                     'Category': 'Upcoming',
-                    'Generated_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    'Generated_Date': generated_date
                 })
             
             if rows:
+                import pandas as pd
+                
                 df = pd.DataFrame(rows)
                 df.to_csv(filename, index=False, encoding='utf-8')
                 return True
@@ -2862,71 +3498,64 @@ class RFLearningRoadmapSystem:
     
     def _get_upcoming_items(self) -> List[Dict[str, Any]]:
         """Get upcoming learning items based on current progress."""
-        upcoming = []
+        return self._versioned_result('upcoming_items', self._compute_upcoming_items)
+    
+    def _compute_upcoming_items(self) -> List[Dict[str, Any]]:
+        """Build the items returned (and cached) by _get_upcoming_items."""
         try:
-            for phase_name, phase_data in self.roadmap.items():
-                for topic_name, topic_data in phase_data['topics'].items():
-                    for subtopic in topic_data['subtopics']:
-                        progress_info = self.get_progress_info(phase_name, topic_name, subtopic)
-                        if (progress_info['status'] == 'Not Started' and 
-                            topic_data['priority'] in ['Critical', 'High']):
-                            upcoming.append({
-                                'subtopic': subtopic,
-                                'topic': topic_name,
-                                'phase': phase_name.split(':')[0],
-                                'priority': topic_data['priority']
-                            })
-            
-            # Sort by priority and limit to top 10
-            priority_order = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}
-            upcoming.sort(key=lambda x: priority_order.get(x['priority'], 4))
-            return upcoming[:10]
+            progress = self.progress
+            candidates = [
+                (PRIORITY_ORDER.get(priority, 4), phase_name, topic_name, subtopic, priority)
+                for phase_name, topic_name, subtopic, priority in self._roadmap_items()
+                if priority in UPCOMING_PRIORITIES
+                and progress.get((phase_name, topic_name, subtopic), {}).get('status', 'Not Started') == 'Not Started'
+            ]
+            
+            # Top 10 by priority; nsmallest is stable, so ties keep roadmap order
+            return [{
+                'subtopic': subtopic,
+                'topic': topic_name,
+                'phase': self._phase_short[phase_name],
+                'priority': priority
+            } for _, phase_name, topic_name, subtopic, priority in heapq.nsmallest(10, candidates, key=itemgetter(0))]
         except:
             return []
     
     def _categorize_recommendation(self, recommendation: str) -> str:
         """Categorize a recommendation for better organization."""
-        if 'critical' in recommendation.lower() or 'priority' in recommendation.lower():
-            return 'High Priority'
-        elif 'review' in recommendation.lower():
-            return 'Review'
-        elif 'advance' in recommendation.lower() or 'start' in recommendation.lower():
-            return 'Progression'
-        elif 'focus' in recommendation.lower():
-            return 'Focus Area'
-        elif 'milestone' in recommendation.lower():
-            return 'Milestone'
-        else:
-            return 'General'
+        # One regex scan finds every keyword; the best-ranked one picks the category
+        matches = [RECOMMENDATION_CATEGORIES[keyword.lower()]
+                   for keyword in RECOMMENDATION_KEYWORDS.findall(recommendation)]
+        return min(matches)[1] if matches else 'General'
     
     def _get_progress_data_dict(self) -> Dict[str, Any]:
         """Get progress data as dictionary for JSON export."""
+        status_counts = Counter(p['status'] for p in self.progress.values())
         return {
-            'progress_data': self.progress,
+            'progress_data': {'|'.join(key): info for key, info in self.progress.items()},
             'export_timestamp': datetime.now().isoformat(),
             'total_items': len(self.progress),
             'summary': {
-                'completed': len([p for p in self.progress.values() if p['status'] == 'Completed']),
-                'in_progress': len([p for p in self.progress.values() if p['status'] == 'In Progress']),
-                'review': len([p for p in self.progress.values() if p['status'] == 'Review']),
-                'not_started': len([p for p in self.progress.values() if p['status'] == 'Not Started'])
+                'completed': status_counts['Completed'],
+                'in_progress': status_counts['In Progress'],
+                'review': status_counts['Review'],
+                'not_started': status_counts['Not Started']
             }
         }
     
     def _get_notes_data_dict(self) -> Dict[str, Any]:
         """Get notes data as dictionary for JSON export."""
         notes_data = {}
-        for key, progress_info in self.progress.items():
-            if progress_info['notes'].strip():
-                phase, topic, subtopic = key.split('|', 2)
-                notes_data[key] = {
-                    'phase': phase,
-                    'topic': topic,
-                    'subtopic': subtopic,
-                    'notes': progress_info['notes'],
-                    'status': progress_info['status'],
-                    'last_updated': progress_info['last_updated']
-                }
+        for key, progress_info in self._noted_progress_items():
+            phase, topic, subtopic = key
+            notes_data['|'.join(key)] = {
+                'phase': phase,
+                'topic': topic,
+                'subtopic': subtopic,
+                'notes': progress_info['notes'],
+                'status': progress_info['status'],
+                'last_updated': progress_info['last_updated']
+            }
         
         return {
             'learning_notes': notes_data,
@@ -2953,8 +3582,9 @@ class RFLearningRoadmapSystem:
         )
         
         if self.progress:
-            completed_items = len([p for p in self.progress.values() if p['status'] == 'Completed'])
-            in_progress_items = len([p for p in self.progress.values() if p['status'] == 'In Progress'])
+            status_counts = Counter(p['status'] for p in self.progress.values())
+            completed_items = status_counts['Completed']
+            in_progress_items = status_counts['In Progress']
             
             analytics_data['overall_statistics'] = {
                 'total_items': total_items,
@@ -2979,124 +3609,96 @@ class RFLearningRoadmapSystem:
     
     def _get_current_focus_areas(self) -> List[str]:
         """Get current focus areas based on in-progress items."""
+        return self._versioned_result('focus_areas', self._compute_current_focus_areas)
+    
+    def _compute_current_focus_areas(self) -> List[str]:
+        """Build the areas returned (and cached) by _get_current_focus_areas."""
         focus_areas = []
         try:
-            for key, progress_info in self.progress.items():
-                if progress_info['status'] in ['In Progress', 'Review']:
-                    phase, topic, subtopic = key.split('|', 2)
-                    focus_areas.append(f"{topic}: {subtopic}")
+            # Stop scanning at the fifth active item instead of filtering all progress
+            focus_areas = list(islice((f"{topic}: {subtopic}"
+                                       for (phase, topic, subtopic), progress_info in self.progress.items()
+                                       if progress_info['status'] in FOCUS_STATUSES), 5))
         except:
             pass
-        return focus_areas[:5]  # Limit to top 5
+        return focus_areas
     
     def _get_next_milestones(self) -> List[Dict[str, str]]:
         """Get upcoming milestones."""
+        return self._versioned_result('next_milestones', self._compute_next_milestones)
+    
+    def _compute_next_milestones(self) -> List[Dict[str, str]]:
+        """Build the milestones returned (and cached) by _get_next_milestones."""
         next_milestones = []
         try:
             current_date = datetime.now().date()
             for phase, info in self.milestones.items():
-                if info['status'] in ['Planned', 'Active']:
-                    try:
-                        target_date = datetime.strptime(info['target_end_date'], '%Y-%m-%d').date()
-                        if target_date >= current_date:
-                            next_milestones.append({
-                                'phase': phase.split(':')[0],
-                                'target_date': info['target_end_date'],
-                                'status': info['status']
-                            })
-                    except:
-                        continue
-            
-            # Sort by target date
-            next_milestones.sort(key=lambda x: x['target_date'])
+                if info['status'] in ACTIVE_MILESTONE_STATUSES:
+                    # Dates were parsed when the milestone was loaded or set
+                    dates = self._milestone_dates.get(phase)
+                    if dates and dates[1].date() >= current_date:
+                        next_milestones.append({
+                            'phase': self._phase_short.get(phase) or phase.split(':', 1)[0],
+                            'target_date': info['target_end_date'],
+                            'status': info['status']
+                        })
+            
+            # Earliest three by target date; nsmallest is stable like the sort it replaces
+            next_milestones = heapq.nsmallest(3, next_milestones, key=itemgetter('target_date'))
         except:
             pass
         
-        return next_milestones[:3]  # Limit to next 3
+        return next_milestones
     
-    def _generate_html_report(self, export_type: str) -> str:
-        """Generate HTML report for specified export type."""
-        try:
-            html_template = f"""
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>RF IC Design Learning Report - {export_type}</title>
-                <style>
-                    body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 40px; background: #f8f9fa; }}
-                    .header {{ background: linear-gradient(135deg, #667eea, #764ba2); color: white; padding: 30px; border-radius: 15px; text-align: center; margin-bottom: 30px; }}
-                    .content {{ background: white; padding: 30px; border-radius: 15px; box-shadow: 0 4px 20px rgba(0,0,0,0.1); }}
-                    h1 {{ margin: 0; font-size: 2.5em; }}
-                    h2 {{ color: #333; border-bottom: 3px solid #667eea; padding-bottom: 10px; }}
-                    h3 {{ color: #666; }}
-                    .status-completed {{ background: #28a745; color: white; padding: 4px 8px; border-radius: 12px; font-size: 0.8em; }}
-                    .status-progress {{ background: #ffc107; color: black; padding: 4px 8px; border-radius: 12px; font-size: 0.8em; }}
-                    .status-review {{ background: #17a2b8; color: white; padding: 4px 8px; border-radius: 12px; font-size: 0.8em; }}
-                    .priority-critical {{ border-left: 5px solid #dc3545; padding-left: 15px; margin: 10px 0; }}
-                    .priority-high {{ border-left: 5px solid #fd7e14; padding-left: 15px; margin: 10px 0; }}
-                    .footer {{ text-align: center; margin-top: 30px; color: #666; font-style: italic; }}
-                    table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-                    th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-                    th {{ background-color: #f8f9fa; font-weight: bold; }}
-                    .notes {{ background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 10px 0; font-style: italic; }}
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>RF IC Design Learning Report</h1>
-                    <p>{export_type} - Generated on {datetime.now().strftime('%B %d, %Y at %H:%M')}</p>
-                </div>
-                <div class="content">
-                    {self._get_html_content_for_type(export_type)}
-                </div>
-                <div class="footer">
-                    <p>Generated by RF IC Design Learning Roadmap System</p>
-                    <p>Continue your journey to RF IC design mastery! 🚀</p>
-                </div>
-            </body>
-            </html>
-            """
-            return html_template
-        except Exception as e:
-            logger.error(f"HTML report generation error: {e}")
-            return ""
+    def _write_html_report(self, filename: str, export_type: str) -> None:
+        """Write the HTML report for export_type to filename without assembling the full page."""
+        content = self._html_report_content(export_type)
+        # Each piece is encoded once and written as bytes, skipping the text layer
+        with open(filename, 'wb') as f:
+            f.write(HTML_REPORT_HEAD.format(
+                export_type=export_type,
+                generated_on=datetime.now().strftime('%B %d, %Y at %H:%M')
+            ).encode('utf-8'))
+            f.write(content.encode('utf-8'))
+            f.write(HTML_REPORT_TAIL_BYTES)
     
-    def _get_html_content_for_type(self, export_type: str) -> str:
-        """Generate HTML content for specific export type."""
+    def _html_report_content(self, export_type: str) -> str:
+        """Build the report section for export_type, or an error paragraph if it fails."""
+        # The single error boundary for the section builders, which only format strings
         try:
-            if export_type == 'Progress Report':
-                return self._generate_progress_html()
-            elif export_type == 'Milestone Timeline':
-                return self._generate_milestone_html()
-            elif export_type == 'Detailed Roadmap':
-                return self._generate_roadmap_html()
-            elif export_type == 'Learning Notes':
-                return self._generate_notes_html()
-            elif export_type == 'Analytics Summary':
-                return self._generate_analytics_html()
-            elif export_type == 'Study Plan':
-                return self._generate_study_plan_html()
-            return "<p>Content not available</p>"
+            return self._get_html_content_for_type(export_type)
         except Exception as e:
             logger.error(f"HTML content generation error: {e}")
             return f"<p>Error generating content: {e}</p>"
     
+    def _get_html_content_for_type(self, export_type: str) -> str:
+        """Generate HTML content for specific export type."""
+        builder = {
+            'Progress Report': self._generate_progress_html,
+            'Milestone Timeline': self._generate_milestone_html,
+            'Detailed Roadmap': self._generate_roadmap_html,
+            'Learning Notes': self._generate_notes_html,
+            'Analytics Summary': self._generate_analytics_html,
+            'Study Plan': self._generate_study_plan_html
+        }.get(export_type)
+        return builder() if builder else "<p>Content not available</p>"
+    
     def _generate_progress_html(self) -> str:
         """Generate HTML content for progress report."""
-        html = "<h2>📈 Learning Progress Report</h2>"
+        parts = ["<h2>📈 Learning Progress Report</h2>"]
         
         if not self.progress:
-            return html + "<p><em>No progress data available yet. Start tracking your learning journey!</em></p>"
+            parts.append("<p><em>No progress data available yet. Start tracking your learning journey!</em></p>")
+            return "".join(parts)
         
-        # Summary statistics
+        # Summary statistics, counted in one pass over progress
         total_items = len(self.progress)
-        completed = len([p for p in self.progress.values() if p['status'] == 'Completed'])
-        in_progress = len([p for p in self.progress.values() if p['status'] == 'In Progress'])
-        review = len([p for p in self.progress.values() if p['status'] == 'Review'])
+        status_counts = Counter(p['status'] for p in self.progress.values())
+        completed = status_counts['Completed']
+        in_progress = status_counts['In Progress']
+        review = status_counts['Review']
         
-        html += f"""
+        parts.append(f"""
         <div style='background: linear-gradient(135deg, #e3f2fd, #bbdefb); padding: 20px; border-radius: 10px; margin: 20px 0;'>
             <h3>📊 Overview Statistics</h3>
             <div style='display: flex; justify-content: space-around; flex-wrap: wrap;'>
@@ -3107,150 +3709,127 @@ class RFLearningRoadmapSystem:
                 <div style='text-align: center; margin: 10px;'><strong>{(completed/total_items*100):.1f}%</strong><br>Overall Progress</div>
             </div>
         </div>
-        """
+        """)
         
         # Detailed progress table
-        html += "<h3>📋 Detailed Progress</h3><table><thead><tr><th>Phase</th><th>Topic</th><th>Subtopic</th><th>Status</th><th>Progress</th><th>Last Updated</th></tr></thead><tbody>"
-        
-        for key, progress_info in self.progress.items():
-            if '|' in key:
-                phase, topic, subtopic = key.split('|', 2)
-                status_class = f"status-{progress_info['status'].lower().replace(' ', '-')}"
-                html += f"""
-                <tr>
-                    <td>{phase.split(':')[0]}</td>
-                    <td>{topic}</td>
-                    <td>{subtopic}</td>
-                    <td><span class="{status_class}">{progress_info['status']}</span></td>
-                    <td>{progress_info['completion']}%</td>
-                    <td>{progress_info['last_updated']}</td>
-                </tr>
-                """
+        parts.append("<h3>📋 Detailed Progress</h3><table><thead><tr><th>Phase</th><th>Topic</th><th>Subtopic</th><th>Status</th><th>Progress</th><th>Last Updated</th></tr></thead><tbody>")
+        
+        phase_short = self._phase_short
+        for (phase, topic, subtopic), progress_info in self.progress.items():
+            status_class = STATUS_CSS_CLASSES.get(progress_info['status'], 'status-other')
+            parts.append(f"""
+            <tr>
+                <td>{phase_short.get(phase) or phase.split(':', 1)[0]}</td>
+                <td>{topic}</td>
+                <td>{subtopic}</td>
+                <td><span class="{status_class}">{progress_info['status']}</span></td>
+                <td>{progress_info['completion']}%</td>
+                <td>{progress_info['last_updated']}</td>
+            </tr>
+            """)
         
-        html += "</tbody></table>"
-        return html
+        parts.append("</tbody></table>")
+        return "".join(parts)
     
     def _generate_milestone_html(self) -> str:
         """Generate HTML content for milestone timeline."""
-        html = "<h2>🎯 Milestone Timeline</h2>"
+        parts = ["<h2>🎯 Milestone Timeline</h2>"]
         
         if not self.milestones:
-            return html + "<p><em>No milestones set yet. Create milestones to track your learning timeline!</em></p>"
+            parts.append("<p><em>No milestones set yet. Create milestones to track your learning timeline!</em></p>")
+            return "".join(parts)
         
-        html += "<div style='margin: 20px 0;'>"
+        parts.append("<div style='margin: 20px 0;'>")
         for phase, info in self.milestones.items():
-            status_colors = {'Planned': '#ffc107', 'Active': '#17a2b8', 'Completed': '#28a745', 'Delayed': '#dc3545'}
-            color = status_colors.get(info['status'], '#6c757d')
+            color = MILESTONE_STATUS_COLORS.get(info['status'], '#6c757d')
             
-            html += f"""
+            parts.append(f"""
             <div style='border-left: 5px solid {color}; padding: 15px; margin: 15px 0; background: rgba(255,255,255,0.8); border-radius: 0 10px 10px 0;'>
-                <h4 style='margin: 0 0 10px 0; color: {color};'>{phase.split(':')[0]}</h4>
+                <h4 style='margin: 0 0 10px 0; color: {color};'>{self._phase_short.get(phase) or phase.split(':', 1)[0]}</h4>
                 <p><strong>Status:</strong> <span style='background: {color}; color: white; padding: 2px 8px; border-radius: 12px;'>{info['status']}</span></p>
                 <p><strong>Start Date:</strong> {info['start_date']}</p>
                 <p><strong>Target End Date:</strong> {info['target_end_date']}</p>
                 {f"<p><strong>Actual End Date:</strong> {info['actual_end_date']}</p>" if info.get('actual_end_date') else ""}
             </div>
-            """
+            """)
         
-        html += "</div>"
-        return html
+        parts.append("</div>")
+        return "".join(parts)
     
     def _generate_roadmap_html(self) -> str:
         """Generate HTML content for detailed roadmap."""
-        html = "<h2>🗺️ Detailed Learning Roadmap</h2>"
+        # Rendered once and reused until a topic or subtopic is added
+        if self._roadmap_html is not None:
+            return self._roadmap_html
         
+        parts = ["<h2>🗺️ Detailed Learning Roadmap</h2>"]
+        
+        default_template = ROADMAP_PHASE_CARD_HTML.replace('{color}', '#6c757d')
         for i, (phase_name, phase_data) in enumerate(self.roadmap.items(), 1):
-            color = self.phase_colors.get(phase_data['phase'], '#6c757d')
-            
-            html += f"""
-            <div style='border: 2px solid {color}; border-radius: 10px; padding: 20px; margin: 20px 0; background: rgba(255,255,255,0.95);'>
-                <h3 style='color: {color}; margin-bottom: 10px;'>Phase {i}: {phase_name}</h3>
-                <p style='font-style: italic; color: #666;'>{phase_data['description']}</p>
-                <p><strong>Duration:</strong> {phase_data['duration_weeks']} weeks | <strong>Type:</strong> {phase_data['phase']}</p>
-                
-                <h4>Topics:</h4>
-            """
+            template = self._phase_card_templates.get(phase_data['phase'], default_template)
+            parts.append(template.format(index=i, phase_name=phase_name, description=phase_data['description'],
+                                         weeks=phase_data['duration_weeks'], phase_type=phase_data['phase']))
             
             for topic_name, topic_data in phase_data['topics'].items():
-                priority_colors = {'Critical': '#dc3545', 'High': '#fd7e14', 'Medium': '#ffc107', 'Low': '#28a745'}
-                priority_color = priority_colors.get(topic_data['priority'], '#6c757d')
+                priority_color = PRIORITY_COLORS.get(topic_data['priority'], '#6c757d')
                 
-                html += f"""
+                parts.append(f"""
                 <div class='priority-{topic_data['priority'].lower()}'>
                     <h5>{topic_name} <span style='background: {priority_color}; color: white; padding: 2px 8px; border-radius: 12px; font-size: 0.8em;'>{topic_data['priority']}</span></h5>
                     <p><strong>Duration:</strong> {topic_data['weeks']} weeks</p>
                     <ul>
-                """
-                
-                for subtopic in topic_data['subtopics']:
-                    html += f"<li>{subtopic}</li>"
+                """)
                 
-                html += "</ul></div>"
+                parts.extend(f"<li>{subtopic}</li>" for subtopic in topic_data['subtopics'])
+                parts.append("</ul></div>")
             
-            html += "</div>"
+            parts.append("</div>")
         
-        return html
+        self._roadmap_html = "".join(parts)
+        return self._roadmap_html
     
     def _generate_notes_html(self) -> str:
         """Generate HTML content for learning notes."""
-        html = "<h2>📝 Learning Notes</h2>"
-        
-        notes_found = False
-        for key, progress_info in self.progress.items():
-            if progress_info['notes'].strip():
-                if not notes_found:
-                    notes_found = True
-                    html += "<div style='margin: 20px 0;'>"
-                
-                phase, topic, subtopic = key.split('|', 2)
-                html += f"""
+        parts = ["<h2>📝 Learning Notes</h2>"]
+        
+        # Only entries with notes are visited; with none there is nothing to format
+        noted_items = self._noted_progress_items()
+        if not noted_items:
+            parts.append("<p><em>No learning notes found. Start adding notes to track your insights and key learnings!</em></p>")
+            return "".join(parts)
+        
+        parts.append("<div style='margin: 20px 0;'>")
+        phase_short = self._phase_short
+        for (phase, topic, subtopic), progress_info in noted_items:
+            # Line breaks become <br>; a literal '\n' can't sit inside the f-string expression
+            notes_html = progress_info['notes'].replace('\n', '<br>')
+            parts.append(f"""
                 <div style='margin: 20px 0; padding: 15px; border-radius: 10px; background: #f8f9fa; border-left: 4px solid #2196F3;'>
                     <h4 style='margin: 0 0 10px 0; color: #2196F3;'>{subtopic}</h4>
-                    <p style='margin: 0 0 5px 0; color: #666; font-size: 0.9em;'><strong>Topic:</strong> {topic} | <strong>Phase:</strong> {phase.split(':')[0]}</p>
-                    <div class='notes'>{progress_info['notes'].replace(chr(10), '<br>')}</div>
+                    <p style='margin: 0 0 5px 0; color: #666; font-size: 0.9em;'><strong>Topic:</strong> {topic} | <strong>Phase:</strong> {phase_short.get(phase) or phase.split(':', 1)[0]}</p>
+                    <div class='notes'>{notes_html}</div>
                     <p style='margin: 5px 0 0 0; color: #999; font-size: 0.8em;'>Last updated: {progress_info['last_updated']}</p>
                 </div>
-                """
-        
-        if not notes_found:
-            html += "<p><em>No learning notes found. Start adding notes to track your insights and key learnings!</em></p>"
-        else:
-            html += "</div>"
+                """)
         
-        return html
+        parts.append("</div>")
+        return "".join(parts)
     
     def _generate_analytics_html(self) -> str:
         """Generate HTML content for analytics summary."""
-        html = "<h2>📊 Analytics Summary</h2>"
+        parts = ["<h2>📊 Analytics Summary</h2>"]
         
-        # Calculate statistics
-        phase_stats = {}
-        total_items = 0
-        completed_items = 0
-        
-        for phase_name, phase_data in self.roadmap.items():
-            phase_total = sum(len(topic_data['subtopics']) for topic_data in phase_data['topics'].values())
-            phase_completed = 0
-            
-            for topic_data in phase_data['topics'].values():
-                for subtopic in topic_data['subtopics']:
-                    total_items += 1
-                    progress_info = self.get_progress_info(phase_name, "", subtopic)
-                    if progress_info['status'] == 'Completed':
-                        completed_items += 1
-                        phase_completed += 1
-            
-            completion_rate = (phase_completed / phase_total * 100) if phase_total > 0 else 0
-            phase_stats[phase_name] = {
-                'total': phase_total,
-                'completed': phase_completed,
-                'completion_rate': completion_rate
-            }
+        # Per-phase totals and completions come from the same single bincount
+        # tally the dashboard and the CSV summary use
+        stats = self._compute_progress_statistics()
+        phase_stats = stats['phase_stats']
+        total_items = stats['total_items']
+        completed_items = stats['completed_items']
         
         # Overall statistics
         overall_completion = (completed_items / total_items * 100) if total_items > 0 else 0
         
-        html += f"""
+        parts.append(f"""
         <div style='background: linear-gradient(135deg, #e8f5e8, #c8e6c9); padding: 20px; border-radius: 10px; margin: 20px 0;'>
             <h3>🎯 Overall Performance</h3>
             <div style='font-size: 1.2em; text-align: center;'>
@@ -3264,62 +3843,62 @@ class RFLearningRoadmapSystem:
                 <tr><th>Phase</th><th>Completed</th><th>Total</th><th>Completion Rate</th></tr>
             </thead>
             <tbody>
-        """
+        """)
         
-        for phase, stats in phase_stats.items():
-            html += f"""
+        for phase, phase_stat in phase_stats.items():
+            parts.append(f"""
             <tr>
-                <td>{phase.split(':')[0]}</td>
-                <td>{stats['completed']}</td>
-                <td>{stats['total']}</td>
-                <td>{stats['completion_rate']:.1f}%</td>
+                <td>{self._phase_short[phase]}</td>
+                <td>{phase_stat['completed']}</td>
+                <td>{phase_stat['total']}</td>
+                <td>{phase_stat['completion_rate']:.1f}%</td>
             </tr>
-            """
+            """)
         
-        html += "</tbody></table>"
+        parts.append("</tbody></table>")
         
         # Add recommendations
-        recommendations = self._get_learning_recommendations()
-        html += "<h3>💡 Current Recommendations</h3><ul>"
-        for rec in recommendations[:5]:
-            html += f"<li>{rec}</li>"
-        html += "</ul>"
+        recommendations = self._get_learning_recommendations(limit=5)
+        parts.append("<h3>💡 Current Recommendations</h3><ul>")
+        for rec in recommendations:
+            parts.append(f"<li>{rec}</li>")
+        parts.append("</ul>")
         
-        return html
+        return "".join(parts)
     
     def _generate_study_plan_html(self) -> str:
         """Generate HTML content for study plan."""
-        html = "<h2>📚 Personalized Study Plan</h2>"
+        parts = ["<h2>📚 Personalized Study Plan</h2>"]
         
         # Current recommendations
         recommendations = self._get_learning_recommendations()
-        html += "<h3>🎯 Priority Recommendations</h3><ol>"
+        parts.append("<h3>🎯 Priority Recommendations</h3><ol>")
         for rec in recommendations:
-            html += f"<li style='margin: 8px 0; line-height: 1.5;'>{rec}</li>"
-        html += "</ol>"
+            parts.append(f"<li style='margin: 8px 0; line-height: 1.5;'>{rec}</li>")
+        parts.append("</ol>")
         
         # Current focus areas
         focus_areas = self._get_current_focus_areas()
         if focus_areas:
-            html += "<h3>🔍 Current Focus Areas</h3><ul>"
+            parts.append("<h3>🔍 Current Focus Areas</h3><ul>")
             for area in focus_areas:
-                html += f"<li>{area}</li>"
-            html += "</ul>"
+                parts.append(f"<li>{area}</li>")
+            parts.append("</ul>")
         
         # Upcoming milestones
         next_milestones = self._get_next_milestones()
         if next_milestones:
-            html += "<h3>📅 Upcoming Milestones</h3><div>"
+            parts.append("<h3>📅 Upcoming Milestones</h3><div>")
             for milestone in next_milestones:
-                html += f"""
+                parts.append(f"""
                 <div style='padding: 10px; margin: 10px 0; background: #fff3cd; border-radius: 8px; border-left: 4px solid #ffc107;'>
                     <strong>{milestone['phase']}</strong> - Target: {milestone['target_date']} ({milestone['status']})
                 </div>
-                """
-            html += "</div>"
+                """)
+            parts.append("</div>")
         
         # Study tips
-        html += f"""
+        parts.append(f"""
         <h3>💡 Study Success Tips</h3>
         <div style='background: #d4edda; padding: 15px; border-radius: 8px; border-left: 4px solid #28a745;'>
             <ul style='margin: 0;'>
@@ -3330,9 +3909,18 @@ class RFLearningRoadmapSystem:
                 <li><strong>Community:</strong> Join RF/IC design forums and discussions</li>
             </ul>
         </div>
-        """
+        """)
         
-        return html
+        return "".join(parts)
+    
+    def _system_status_html(self) -> str:
+        """Render the system header followed by the current data file and count status."""
+        return SYSTEM_HEADER_HTML + SYSTEM_STATUS_HTML.format(
+            progress_mark="✅" if self._progress_file_exists else "📝",
+            milestones_mark="✅" if self._milestones_file_exists else "📝",
+            item_count=len(self.progress),
+            milestone_count=len(self.milestones)
+        )
     
     def display_full_system(self) -> widgets.Widget:
         """
@@ -3342,14 +3930,16 @@ class RFLearningRoadmapSystem:
             widgets.Widget: Complete system interface
         """
         try:
-            # Create tabs for different sections
-            tab_contents = [
-                self.create_roadmap_overview(),
-                self.create_progress_manager(),
-                self.create_milestone_manager(),
-                self.create_analytics_dashboard(),
-                self.create_export_system()
+            # Tab bodies are built the first time their tab is selected; the
+            # others start as lightweight placeholders
+            tab_builders = [
+                self.create_roadmap_overview,
+                self.create_progress_manager,
+                self.create_milestone_manager,
+                self.create_analytics_dashboard,
+                self.create_export_system
             ]
+            tab_built = [False] * len(tab_builders)
             
             tab_titles = [
                 '🗺️ Roadmap Overview',
@@ -3360,62 +3950,35 @@ class RFLearningRoadmapSystem:
             ]
             
             tabs = widgets.Tab()
-            tabs.children = tab_contents
+            tabs.children = [
+                widgets.HTML("<div style='padding: 20px; color: #6c757d; font-style: italic;'>⏳ Loading...</div>")
+                for _ in tab_builders
+            ]
             for i, title in enumerate(tab_titles):
                 tabs.set_title(i, title)
             
-            # Enhanced header with system information
-            header = widgets.HTML(f"""
-            <div style='text-align: center; padding: 25px; background: linear-gradient(45deg, #667eea, #764ba2); 
-                        color: white; border-radius: 15px; margin-bottom: 20px; box-shadow: 0 8px 32px rgba(0,0,0,0.1);'>
-                <h1 style='margin: 0 0 10px 0; font-size: 2.5em; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);'>
-                    🎯 RF IC Design Learning Roadmap System
-                </h1>
-                <p style='margin: 5px 0 15px 0; font-size: 1.3em; opacity: 0.95;'>
-                    Your comprehensive journey from fundamentals to mastery
-                </p>
-                <div style='background: rgba(255,255,255,0.2); padding: 15px; border-radius: 10px; margin-top: 15px;'>
-                    <div style='display: flex; justify-content: space-around; flex-wrap: wrap;'>
-                        <div style='margin: 5px;'><strong>🏗️ Foundation</strong><br>0-3 months</div>
-                        <div style='margin: 5px;'><strong>🚀 Short-term</strong><br>3-9 months</div>
-                        <div style='margin: 5px;'><strong>⚡ Mid-term</strong><br>9-18 months</div>
-                        <div style='margin: 5px;'><strong>🏆 Long-term</strong><br>18-30 months</div>
-                        <div style='margin: 5px;'><strong>🌟 Advanced</strong><br>30+ months</div>
-                    </div>
-                </div>
-            </div>
-            """)
-            
-            # System information and quick stats
-            system_info = widgets.HTML(f"""
-            <div style='background: linear-gradient(135deg, #f8f9fa, #e9ecef); padding: 20px; border-radius: 12px; 
-                        margin-bottom: 20px; border: 2px solid #dee2e6;'>
-                <div style='display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap;'>
-                    <div style='margin: 10px;'>
-                        <h4 style='margin: 0 0 5px 0; color: #495057;'>📊 System Status</h4>
-                        <p style='margin: 0; color: #6c757d;'>Ready for learning tracking</p>
-                    </div>
-                    <div style='margin: 10px;'>
-                        <h4 style='margin: 0 0 5px 0; color: #495057;'>💾 Data Files</h4>
-                        <p style='margin: 0; color: #6c757d;'>
-                            Progress: {"✅" if os.path.exists(self.progress_file) else "📝"} | 
-                            Milestones: {"✅" if os.path.exists(self.milestones_file) else "📝"}
-                        </p>
-                    </div>
-                    <div style='margin: 10px;'>
-                        <h4 style='margin: 0 0 5px 0; color: #495057;'>🎯 Quick Stats</h4>
-                        <p style='margin: 0; color: #6c757d;'>
-                            {len(self.progress)} items tracked | 
-                            {len(self.milestones)} milestones set
-                        </p>
-                    </div>
-                </div>
-            </div>
-            """)
+            def build_tab(change):
+                """Replace the selected tab's placeholder with its real content once."""
+                index = change['new']
+                if index is None or tab_built[index]:
+                    return
+                tab_built[index] = True
+                children = list(tabs.children)
+                children[index] = tab_builders[index]()
+                tabs.children = children
+            
+            build_tab({'new': tabs.selected_index or 0})
+            tabs.observe(build_tab, names='selected_index')
+            
+            # Header and status share one widget; later renders only refresh its value
+            status_html = self._system_status_html()
+            if self._status_widget is None:
+                self._status_widget = widgets.HTML(status_html)
+            else:
+                self._status_widget.value = status_html
             
             return widgets.VBox([
-                header,
-                system_info,
+                self._status_widget,
                 tabs
             ])
             